@@ -0,0 +1,137 @@
+"""ITS API 호출 비교 (requests.get 단독 호출 vs HttpClient)
+
+로컬 대체 HTTP 서버(지연, gzip 응답, 일정 비율의 503/429 응답)를 띄우고
+같은 요청을 두 방식으로 보내 성공 수, 소요 시간, 지연 시간을 비교합니다.
+QGIS 없이 플러그인 디렉토리(QcctvKor)의 상위 경로를 기준으로 실행합니다.
+
+    python3 QcctvKor/benchmarks/bench_http_client.py [--requests 200] [--error-rate 0.1]
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import requests
+
+from QcctvKor.utils.exceptions import QcctvKorError
+from QcctvKor.utils.http_client import HttpClient
+
+
+def make_payload(count: int) -> bytes:
+    """ITS 형식의 CCTV 목록 응답 본문"""
+    rng = random.Random(count)
+    items = [
+        {
+            "cctvName": f"CCTV {i}",
+            "cctvUrl": f"http://example.com/stream/{i}",
+            "coordX": str(rng.uniform(124.5, 131.0)),
+            "coordY": str(rng.uniform(33.0, 38.7))
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"response": {"data": items}}).encode("utf-8")
+
+
+def start_server(payload: bytes, latency: float, error_rate: float) -> ThreadingHTTPServer:
+    """Stand-in ITS server with keep-alive, gzip and injected 503/429 responses"""
+    compressed = gzip.compress(payload)
+    rng = random.Random(0)
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            # 헤더와 본문을 나누어 보내므로 Nagle 지연 방지 (실제 서버와 동일)
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            with lock:
+                failing = rng.random() < error_rate
+                status = rng.choice((429, 503))
+            if failing:
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+            body = compressed if gzipped else payload
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(fetch, url: str, count: int, workers: int):
+    """Send count requests with workers threads; (successes, seconds)"""
+    def one(_):
+        try:
+            fetch(url)
+            return True
+        except (requests.exceptions.RequestException, QcctvKorError):
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        successes = sum(pool.map(one, range(count)))
+    return successes, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--items", type=int, default=2000, help="응답당 CCTV 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="서버 응답 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.1, help="503/429 응답 비율")
+    args = parser.parse_args()
+
+    server = start_server(make_payload(args.items), args.latency, args.error_rate)
+    url = f"http://127.0.0.1:{server.server_port}/api/NCCTVInfo"
+
+    def bare(target):
+        response = requests.get(target)
+        response.raise_for_status()
+        return response.json()
+
+    client = HttpClient(max_concurrency=args.workers, backoff=0.05)
+
+    print(f"{'client':>12} {'ok':>6} {'total (s)':>10}")
+    for label, fetch in (("requests.get", bare), ("HttpClient", client.get_json)):
+        successes, elapsed = run(fetch, url, args.requests, args.workers)
+        print(f"{label:>12} {successes:>6} {elapsed:>10.3f}")
+
+    stats = client.stats()
+    print(
+        f"HttpClient: 요청 {stats['requests']}, 재시도 {stats['retries']}, "
+        f"실패 {stats['failures']}, 지연 p50 {stats.get('latency_p50_ms', 0):.1f}ms "
+        f"p95 {stats.get('latency_p95_ms', 0):.1f}ms"
+    )
+    client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
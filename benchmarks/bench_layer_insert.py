@@ -0,0 +1,91 @@
+"""CCTV 레이어 피처 추가 성능 비교 (개별 추가 vs 일괄 추가)
+
+QGIS 파이썬 환경에서 플러그인 디렉토리(QcctvKor)의 상위 경로를 기준으로 실행합니다.
+
+    python3 QcctvKor/benchmarks/bench_layer_insert.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from qgis.core import QgsApplication, QgsFeature, QgsGeometry, QgsPointXY
+
+DEFAULT_SIZES = [1000, 5000, 10000, 50000, 100000]
+
+
+def make_records(count: int):
+    """Generate random CCTV records inside the national extent"""
+    rng = random.Random(count)
+    return [
+        {
+            "name": f"CCTV {i}",
+            "url": f"http://example.com/stream/{i}",
+            "lat": rng.uniform(33.0, 38.7),
+            "lon": rng.uniform(124.5, 131.0)
+        }
+        for i in range(count)
+    ]
+
+
+def insert_one_by_one(model, records) -> float:
+    """Previous path: addFeature, updateExtents and triggerRepaint per camera"""
+    start = time.perf_counter()
+    provider = model.layer.dataProvider()
+    for cctv in records:
+        feature = QgsFeature()
+        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(cctv["lon"], cctv["lat"])))
+        feature.setAttributes([cctv["name"], cctv["url"]])
+        provider.addFeature(feature)
+        model.layer.updateExtents()
+        model.layer.triggerRepaint()
+    return time.perf_counter() - start
+
+
+def insert_bulk(model, records) -> float:
+    """Bulk path: CctvModel.add_cctv_features"""
+    start = time.perf_counter()
+    model.add_cctv_features(records)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--legacy-limit", type=int, default=100000,
+                        help="개별 추가 방식을 측정할 최대 피처 수")
+    args = parser.parse_args()
+
+    app = QgsApplication([], False)
+    app.initQgis()
+
+    from QcctvKor.model.cctv_model import CctvModel
+
+    print(f"{'features':>10} {'one-by-one (s)':>16} {'bulk (s)':>10} {'speedup':>9}")
+    for size in args.sizes:
+        records = make_records(size)
+        model = CctvModel()
+
+        legacy = None
+        if size <= args.legacy_limit:
+            model.create_temp_layer()
+            legacy = insert_one_by_one(model, records)
+            model.remove_temp_layer()
+
+        model.create_temp_layer()
+        bulk = insert_bulk(model, records)
+        model.remove_temp_layer()
+
+        if legacy is None:
+            print(f"{size:>10} {'-':>16} {bulk:>10.3f} {'-':>9}")
+        else:
+            print(f"{size:>10} {legacy:>16.3f} {bulk:>10.3f} {legacy / bulk:>8.1f}x")
+
+    app.exitQgis()
+
+
+if __name__ == "__main__":
+    main()
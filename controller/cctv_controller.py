@@ -1,22 +1,35 @@
-from qgis.gui import QgisInterface, QgsMapToolIdentifyFeature
-from qgis.core import QgsProject, Qgis
+from qgis.gui import QgisInterface, QgsMapToolEmitPoint
+from qgis.core import (QgsProject, Qgis, QgsCoordinateTransform, QgsPointXY,
+                       QgsRectangle)
 from qgis.PyQt.QtWidgets import QAction, QMessageBox, QDialog, QToolButton, QMenu
 from qgis.PyQt.QtGui import QIcon
 from ..model.cctv_model import CctvModel
+from .viewport_loader import ViewportLoader
 from ..view.cctv_dialog import CctvDialog
 from ..view.settings_dialog import SettingsDialog
 from ..view.api_key_dialog import ApiKeyDialog
 from ..utils.config_manager import ConfigManager
 import os
 
+# CCTV 클릭 판정 허용 반경 (픽셀)
+CLICK_TOLERANCE_PX = 8
+
+# 메시지 바 경고 표시 시간 (초)
+MESSAGE_DURATION_S = 10
+
 class CctvController:
     def __init__(self, iface: QgisInterface):
         self.iface = iface
+        # 로딩 작업이 끝나면 모델이 GUI 스레드에서 레이어를 채우고 변경분을 반영
         self.model = CctvModel()
         self.dialog = None
         self.action = None
         self.api_key_action = None
         self.map_tool = None
+        # 지도 화면 범위 단위 로딩 (config.ini [VIEWPORT] ENABLED)
+        self.viewport_loader = None
+        # 경계 파일 누락 경고는 세션당 한 번만 표시
+        self._boundary_warning_shown = False
         
     def initGui(self) -> None:
         """Initialize plugin components - QGIS Plugin required method"""
@@ -74,24 +87,25 @@ class CctvController:
                 self.show_cctv_dialog(default_cctv_info)
                 return
             
-            # API 키가 있는 경우 정상적으로 CCTV 데이터 로드
-            self.model.load_cctv_data()
-            
             # Create temporary layer
             self.model.create_temp_layer()
+            self._warn_missing_boundaries()
             
-            # Add CCTV points to layer
-            for cctv in self.model.cctv_data:
-                self.model.add_cctv_feature(
-                    cctv["name"],
-                    cctv["url"],
-                    cctv["lat"],
-                    cctv["lon"]
-                )
+            # 이미 로드된 카탈로그가 있으면 바로 표시
+            self.model.add_cctv_features(self.model.cctv_data)
             
-            # Set up map tool for feature identification
-            self.map_tool = QgsMapToolIdentifyFeature(self.iface.mapCanvas())
-            self.map_tool.featureIdentified.connect(self.handle_feature_click)
+            # 조회 → 파싱 → 색인은 백그라운드에서, 레이어 반영은 완료 시 GUI 스레드에서
+            if config_manager.get_viewport_loading():
+                # 전국을 한 번에 받지 않고 화면에 보이는 타일만 조회
+                if self.viewport_loader is None:
+                    self.viewport_loader = ViewportLoader(self.iface.mapCanvas(), self.model)
+                self.viewport_loader.start()
+            else:
+                self.model.load_cctv_data(tiled=True, stale_while_revalidate=True)
+            
+            # Set up map tool for nearest CCTV identification
+            self.map_tool = QgsMapToolEmitPoint(self.iface.mapCanvas())
+            self.map_tool.canvasClicked.connect(self.handle_map_click)
             self.iface.mapCanvas().setMapTool(self.map_tool)
             
         except Exception as e:
@@ -105,15 +119,46 @@ class CctvController:
             # 기본 CCTV 대화상자 표시
             self.show_cctv_dialog(default_cctv_info)
         
-    def handle_feature_click(self, feature) -> None:
-        """Handle CCTV point click event"""
+    def _warn_missing_boundaries(self) -> None:
+        """Tell the user that 시도 falls back to name-based guesses without a boundary file"""
+        if self._boundary_warning_shown or self.model.region_engine.available:
+            return
+        self._boundary_warning_shown = True
+        self.iface.messageBar().pushMessage(
+            "QcctvKor",
+            "행정구역 경계 파일이 없어 CCTV 이름으로 시도를 추정합니다 (일부 CCTV의 시도가 "
+            "틀릴 수 있음). config.ini [REGION] BOUNDARY_FILE에 시군구 경계 파일을 지정하거나 "
+            f"{self.model.region_engine.boundary_file} 경로에 넣어 주세요.",
+            level=Qgis.Warning,
+            duration=MESSAGE_DURATION_S
+        )
+        
+    def handle_map_click(self, point: QgsPointXY, button) -> None:
+        """Show the CCTV nearest to the clicked canvas point"""
+        if not self.model.layer:
+            return
+            
         try:
-            # Get CCTV info for clicked feature
-            cctv_info = self.model.get_cctv_info(feature.id())
+            canvas = self.iface.mapCanvas()
+            radius = canvas.mapUnitsPerPixel() * CLICK_TOLERANCE_PX
+            search_rect = QgsRectangle(
+                point.x() - radius, point.y() - radius,
+                point.x() + radius, point.y() + radius
+            )
             
-            # Show CCTV dialog
-            self.show_cctv_dialog(cctv_info)
+            # 캔버스 좌표계 -> 레이어 좌표계
+            transform = QgsCoordinateTransform(
+                canvas.mapSettings().destinationCrs(),
+                self.model.layer.crs(),
+                QgsProject.instance()
+            )
+            layer_rect = transform.transformBoundingBox(search_rect)
+            tolerance = max(layer_rect.width(), layer_rect.height()) / 2
             
+            cctv_info = self.model.find_nearest_cctv(layer_rect.center(), tolerance)
+            if cctv_info:
+                self.show_cctv_dialog(cctv_info)
+                
         except Exception as e:
             QMessageBox.warning(
                 self.iface.mainWindow(),
@@ -124,9 +169,12 @@ class CctvController:
     def show_cctv_dialog(self, cctv_info: dict) -> None:
         """Show CCTV streaming dialog"""
         if self.dialog:
+            # 다른 CCTV로 바꿀 때는 레이어와 지도 도구를 유지
+            self.dialog.finished.disconnect(self.cleanup)
             self.dialog.close()
             
-        self.dialog = CctvDialog(cctv_info, self.iface.mainWindow(), self.iface)
+        self.dialog = CctvDialog(cctv_info, self.iface.mainWindow(), self.iface,
+                                 self.model)
         self.dialog.finished.connect(self.cleanup)
         self.dialog.show()
         
@@ -148,5 +196,11 @@ class CctvController:
         self.iface.removePluginMenu("QcctvKor", self.api_key_action)
         self.iface.removeToolBarIcon(self.action)
         
+        # 화면 범위 로딩 중지 후 실행 중인 로딩/필터 작업 취소
+        # (대화상자를 닫을 때는 취소하지 않음)
+        if self.viewport_loader is not None:
+            self.viewport_loader.stop()
+        self.model.cancel_background_tasks()
+        
         # Clean up resources
         self.cleanup() 
\ No newline at end of file
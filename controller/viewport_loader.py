@@ -0,0 +1,87 @@
+from typing import Optional
+from qgis.core import QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsProject
+from qgis.gui import QgsMapCanvas
+from qgis.PyQt.QtCore import QObject, QTimer
+from ..model.cctv_model import CctvModel
+from ..model.cctv_tiles import BBox
+from ..utils.exceptions import QcctvKorError
+from ..utils.logger import Logger
+
+logger = Logger.get_logger()
+
+# 지도 이동/확대가 멈춘 뒤 로딩까지 기다리는 시간 (밀리초)
+VIEWPORT_DEBOUNCE_MS = 300
+
+# 화면 범위를 사방으로 넓혀 미리 불러올 비율 (가로/세로 길이 대비)
+VIEWPORT_MARGIN = 0.1
+
+
+class ViewportLoader(QObject):
+    """Load CCTV tiles for the map canvas extent as the user pans and zooms
+
+    캔버스 extentsChanged를 디바운스하여 이동이 멈춘 뒤 한 번만 화면 범위
+    (WGS84, 여백 포함)를 모델에 전달합니다. 모델은 아직 없는 타일만 조회하고
+    메모리 예산을 넘으면 화면에서 먼 타일을 제거합니다.
+    """
+
+    def __init__(self, canvas: QgsMapCanvas, model: CctvModel,
+                 delay_ms: int = VIEWPORT_DEBOUNCE_MS, margin: float = VIEWPORT_MARGIN):
+        super().__init__()
+        self.canvas = canvas
+        self.model = model
+        self.margin = margin
+        self.active = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.load_current_extent)
+
+    def start(self) -> None:
+        """Follow canvas extent changes and load the current view"""
+        if self.active:
+            return
+        self.canvas.extentsChanged.connect(self._schedule)
+        self.active = True
+        self.load_current_extent()
+
+    def stop(self) -> None:
+        """Stop following the canvas (running loads are left to the model)"""
+        if not self.active:
+            return
+        self._timer.stop()
+        self.canvas.extentsChanged.disconnect(self._schedule)
+        self.active = False
+
+    def _schedule(self) -> None:
+        # 이동 중에는 타이머만 다시 시작
+        self._timer.start()
+
+    def current_bbox(self) -> Optional[BBox]:
+        """Canvas extent in WGS84 lon/lat, widened by the margin"""
+        transform = QgsCoordinateTransform(
+            self.canvas.mapSettings().destinationCrs(),
+            QgsCoordinateReferenceSystem("EPSG:4326"),
+            QgsProject.instance()
+        )
+        try:
+            extent = transform.transformBoundingBox(self.canvas.extent())
+        except Exception as e:
+            logger.warning(f"화면 범위 좌표 변환 실패: {str(e)}")
+            return None
+        if extent.isEmpty():
+            return None
+
+        pad_x = extent.width() * self.margin
+        pad_y = extent.height() * self.margin
+        return (extent.xMinimum() - pad_x, extent.yMinimum() - pad_y,
+                extent.xMaximum() + pad_x, extent.yMaximum() + pad_y)
+
+    def load_current_extent(self) -> None:
+        """Ask the model to load the tiles of the current view"""
+        bbox = self.current_bbox()
+        if bbox is None:
+            return
+        try:
+            self.model.load_viewport(bbox)
+        except QcctvKorError as e:
+            logger.error(Logger.format_error(e, "화면 범위 로딩 실패"))
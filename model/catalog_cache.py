@@ -0,0 +1,164 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+from qgis.core import QgsApplication
+from threading import Lock
+from contextlib import contextmanager
+import json
+import os
+import sqlite3
+import time
+import zlib
+from ..utils.logger import Logger
+from ..utils.exceptions import DataError
+
+logger = Logger.get_logger()
+
+class CatalogCache:
+    """Persistent SQLite cache of parsed CCTV catalogs keyed by API parameters
+
+    name이 다른 캐시는 서로 다른 파일에 저장됩니다 (예: 필터 범위 조회 결과).
+    캐시 파일을 만들거나 열 수 없으면 경고 후 캐시 없이 동작합니다.
+    """
+
+    # 캐시 키에서 제외할 파라미터 (API 키가 바뀌어도 같은 데이터)
+    IGNORED_PARAMS = ("key",)
+
+    def __init__(self, db_path: Optional[str] = None, ttl: float = 300,
+                 max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024,
+                 name: str = "catalog_cache"):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self.enabled = True
+        try:
+            self.db_path = db_path or self._default_db_path(name)
+            self._init_db()
+        except (sqlite3.Error, OSError) as e:
+            # 읽기 전용 프로필, 잠기거나 손상된 파일 등: 플러그인 로딩은 계속
+            logger.warning(f"캐시 파일을 열 수 없어 캐시 없이 동작합니다 ({name}): {str(e)}")
+            self.enabled = False
+
+    @staticmethod
+    def _default_db_path(name: str = "catalog_cache") -> str:
+        """플러그인 프로필 디렉토리의 캐시 파일 경로"""
+        cache_dir = os.path.join(QgsApplication.qgisSettingsDirPath(), "QcctvKor")
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, f"{name}.sqlite")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 단위 연결 (작업 스레드마다 새 연결 사용)"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        """캐시 테이블 생성"""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS catalog ("
+                " key TEXT PRIMARY KEY,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " payload BLOB NOT NULL)"
+            )
+
+    @classmethod
+    def make_key(cls, params: Dict) -> str:
+        """요청 파라미터로 캐시 키 생성"""
+        return json.dumps(
+            {k: v for k, v in params.items() if k not in cls.IGNORED_PARAMS},
+            sort_keys=True
+        )
+
+    def get_entry(self, key: str) -> Optional[Tuple[List[Dict], float]]:
+        """만료 여부와 관계없이 (데이터, 생성 시각) 조회"""
+        if not self.enabled:
+            return None
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT payload, created_at FROM catalog WHERE key = ?",
+                    (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE catalog SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key)
+                )
+            return json.loads(zlib.decompress(row[0]).decode("utf-8")), row[1]
+
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            logger.warning(f"캐시 조회 실패: {str(e)}")
+            return None
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[List[Dict]]:
+        """캐시된 데이터 조회 (만료된 항목은 allow_stale일 때만 반환)"""
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+
+        data, created_at = entry
+        if not allow_stale and time.time() - created_at > self.ttl:
+            return None
+        return data
+
+    def put(self, key: str, data: List[Dict],
+            created_at: Optional[float] = None) -> None:
+        """데이터 저장 후 크기 제한 적용"""
+        if not self.enabled:
+            return
+        try:
+            payload = zlib.compress(
+                json.dumps(data, ensure_ascii=False).encode("utf-8")
+            )
+            now = time.time()
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO catalog "
+                    "(key, created_at, accessed_at, size, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, created_at or now, now, len(payload), payload)
+                )
+                self._prune(conn)
+
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            raise DataError(f"캐시 저장 실패: {str(e)}")
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """항목 수와 전체 크기 제한을 넘으면 오래 사용되지 않은 항목부터 삭제"""
+        rows = conn.execute(
+            "SELECT key, size FROM catalog ORDER BY accessed_at DESC"
+        ).fetchall()
+
+        total_size = 0
+        expired = []
+        for i, (key, size) in enumerate(rows):
+            total_size += size
+            if i >= self.max_entries or total_size > self.max_bytes:
+                expired.append((key,))
+
+        if expired:
+            conn.executemany("DELETE FROM catalog WHERE key = ?", expired)
+            logger.info(f"캐시 항목 {len(expired)}개 삭제됨")
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """캐시 항목 삭제 (key가 없으면 전체 삭제)"""
+        if not self.enabled:
+            return
+        try:
+            with self._lock, self._connect() as conn:
+                if key is None:
+                    conn.execute("DELETE FROM catalog")
+                else:
+                    conn.execute("DELETE FROM catalog WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"캐시 무효화 실패: {str(e)}")
+            return
+        logger.info("캐시가 무효화되었습니다.")
@@ -0,0 +1,108 @@
+from typing import Dict, Iterable, List, Tuple
+
+# 좌표 비교 정밀도 (소수점 5자리 ≒ 1m)
+COORD_PRECISION = 5
+
+CHANGE_TYPES = ("added", "removed", "moved", "renamed", "url_changed")
+
+# diff_catalog 결과에 덧붙이는 변경: 같은 CCTV의 분류(지역/도로 유형/출처)만 바뀜
+EXTRA_CHANGE_TYPES = ("reclassified",)
+
+
+def position_key(cctv: Dict) -> Tuple[float, float]:
+    """Rounded (lon, lat) of a camera"""
+    return (round(cctv["lon"], COORD_PRECISION), round(cctv["lat"], COORD_PRECISION))
+
+
+def record_key(cctv: Dict) -> Tuple:
+    """Identity key of a camera: name plus rounded position"""
+    return (cctv["name"],) + position_key(cctv)
+
+
+def _index_unique(records: Iterable[Dict], key_func) -> Dict:
+    """Index records by key, dropping keys that are not unique"""
+    index = {}
+    duplicated = set()
+    for cctv in records:
+        key = key_func(cctv)
+        if key in index:
+            duplicated.add(key)
+        index[key] = cctv
+    for key in duplicated:
+        del index[key]
+    return index
+
+
+def diff_catalog(old: Iterable[Dict], new: Iterable[Dict]) -> Dict[str, List]:
+    """Compute keyed diff between two catalogs
+
+    Cameras are first matched on name and position; the rest are matched
+    on name only (moved) and then on position only (renamed).
+
+    Returns:
+        {"added": [new], "removed": [old], "moved": [(old, new)],
+         "renamed": [(old, new)], "url_changed": [(old, new)]}
+    """
+    diff = {change: [] for change in CHANGE_TYPES}
+
+    old_by_key = {record_key(cctv): cctv for cctv in old}
+    new_by_key = {record_key(cctv): cctv for cctv in new}
+
+    # 이름과 위치가 같은 CCTV: URL 변경만 확인
+    for key, new_cctv in new_by_key.items():
+        old_cctv = old_by_key.get(key)
+        if old_cctv is not None and old_cctv["url"] != new_cctv["url"]:
+            diff["url_changed"].append((old_cctv, new_cctv))
+
+    old_rest = [cctv for key, cctv in old_by_key.items() if key not in new_by_key]
+    new_rest = [cctv for key, cctv in new_by_key.items() if key not in old_by_key]
+
+    # 이름이 같고 위치가 다른 CCTV: 이동
+    old_by_name = _index_unique(old_rest, lambda cctv: cctv["name"])
+    new_by_name = _index_unique(new_rest, lambda cctv: cctv["name"])
+    matched_old = set()
+    matched_new = set()
+    for name, new_cctv in new_by_name.items():
+        old_cctv = old_by_name.get(name)
+        if old_cctv is not None:
+            diff["moved"].append((old_cctv, new_cctv))
+            matched_old.add(id(old_cctv))
+            matched_new.add(id(new_cctv))
+
+    old_rest = [cctv for cctv in old_rest if id(cctv) not in matched_old]
+    new_rest = [cctv for cctv in new_rest if id(cctv) not in matched_new]
+
+    # 위치가 같고 이름이 다른 CCTV: 이름 변경
+    old_by_pos = _index_unique(old_rest, position_key)
+    new_by_pos = _index_unique(new_rest, position_key)
+    for pos, new_cctv in new_by_pos.items():
+        old_cctv = old_by_pos.get(pos)
+        if old_cctv is not None:
+            diff["renamed"].append((old_cctv, new_cctv))
+            matched_old.add(id(old_cctv))
+            matched_new.add(id(new_cctv))
+
+    diff["removed"] = [cctv for cctv in old_rest if id(cctv) not in matched_old]
+    diff["added"] = [cctv for cctv in new_rest if id(cctv) not in matched_new]
+    return diff
+
+
+def is_empty_diff(diff: Dict[str, List]) -> bool:
+    """Check whether a diff contains no changes"""
+    return not any(diff.get(change) for change in CHANGE_TYPES + EXTRA_CHANGE_TYPES)
+
+
+def summarize_diff(diff: Dict[str, List]) -> str:
+    """Short human readable summary of a diff"""
+    labels = {
+        "added": "추가",
+        "removed": "삭제",
+        "moved": "이동",
+        "renamed": "이름 변경",
+        "url_changed": "URL 변경",
+        "reclassified": "분류 변경"
+    }
+    changes = CHANGE_TYPES + tuple(change for change in EXTRA_CHANGE_TYPES if diff.get(change))
+    return ", ".join(
+        f"{labels[change]} {len(diff.get(change, []))}개" for change in changes
+    )
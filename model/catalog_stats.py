@@ -0,0 +1,162 @@
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+import numpy as np
+
+from .catalog_diff import record_key
+from .catalog_store import CatalogStore
+
+# 격자 집계 셀 크기 (도, 약 10km)
+GRID_CELL_DEG = 0.1
+
+# 범주 차원 -> CatalogStore 열 이름
+CATEGORY_DIMENSIONS = {
+    "region": "regions",
+    "district": "districts",
+    "road_type": "road_types",
+    "source": "sources"
+}
+
+Cell = Tuple[float, float]
+
+
+def cell_ids(lon: np.ndarray, lat: np.ndarray, cell_size: float = GRID_CELL_DEG) -> np.ndarray:
+    """Packed grid cell id of each point (row in the high bits, offset column in the low 32 bits)"""
+    col = np.floor(lon / cell_size).astype(np.int64) + (1 << 31)
+    row = np.floor(lat / cell_size).astype(np.int64)
+    return (row << 32) + col
+
+
+def cell_origin(cell_id: int, cell_size: float = GRID_CELL_DEG) -> Cell:
+    """South-west corner (lon, lat) of a packed cell id"""
+    row = cell_id >> 32
+    col = (cell_id & 0xFFFFFFFF) - (1 << 31)
+    return (round(col * cell_size, 6), round(row * cell_size, 6))
+
+
+def count_rows(store: CatalogStore, indices: Optional[np.ndarray] = None,
+               cell_size: float = GRID_CELL_DEG) -> Dict[str, Dict]:
+    """Counts per region/district/road type/source/grid cell in one vectorised pass
+
+    행을 순회하지 않고 범주 코드 배열에 bincount를 적용합니다.
+    """
+    counts = {}
+    for dimension, column in CATEGORY_DIMENSIONS.items():
+        index = getattr(store, column)
+        codes = index.codes if indices is None else index.codes[indices]
+        totals = np.bincount(codes, minlength=len(index.labels))
+        counts[dimension] = {
+            label: int(total) for label, total in zip(index.labels, totals) if total
+        }
+
+    lon = store.lon if indices is None else store.lon[indices]
+    lat = store.lat if indices is None else store.lat[indices]
+    cells, totals = np.unique(cell_ids(lon, lat, cell_size), return_counts=True)
+    counts["cell"] = {
+        cell_origin(cell, cell_size): int(total)
+        for cell, total in zip(cells.tolist(), totals.tolist())
+    }
+    return counts
+
+
+class CatalogAggregates:
+    """Counts of a catalog by category and grid cell, maintained incrementally
+
+    전체 카탈로그 집계는 한 번 계산한 뒤 카탈로그 변경분(diff)을 적용해
+    갱신합니다. 필터 결과 통계는 결과 행 인덱스에 대한 bincount로 구하며
+    (필터 키별로 캐시) 레코드를 다시 읽지 않습니다.
+    """
+
+    def __init__(self, store: CatalogStore, cell_size: float = GRID_CELL_DEG):
+        self.store = store
+        self.version = store.version
+        self.cell_size = cell_size
+        self.counts = count_rows(store, cell_size=cell_size)
+        self.total = len(store)
+        self._filtered: Dict[str, Tuple[int, Dict]] = {}
+
+    def _row_labels(self, store: CatalogStore, cctv: Mapping) -> Dict[str, object]:
+        """Dimension values of a diff record as stored in store"""
+        index = store.key_index().get(record_key(cctv))
+        if index is None:
+            labels = {dimension: cctv.get(dimension) for dimension in CATEGORY_DIMENSIONS}
+            lon, lat = cctv["lon"], cctv["lat"]
+        else:
+            labels = {
+                dimension: getattr(store, column).label(index)
+                for dimension, column in CATEGORY_DIMENSIONS.items()
+            }
+            lon, lat = store.lon[index], store.lat[index]
+        labels["cell"] = cell_origin(
+            int(cell_ids(np.array([lon]), np.array([lat]), self.cell_size)[0]), self.cell_size
+        )
+        return labels
+
+    def _add(self, labels: Mapping, delta: int) -> None:
+        for dimension, value in labels.items():
+            if value is None:
+                continue
+            counts = self.counts[dimension]
+            total = counts.get(value, 0) + delta
+            if total > 0:
+                counts[value] = total
+            else:
+                counts.pop(value, None)
+
+    def apply_diff(self, diff: Mapping, old_store: CatalogStore, new_store: CatalogStore) -> None:
+        """Update the totals from a catalog diff (old_store -> new_store)
+
+        제거/변경 전 값은 이전 저장소에서, 추가/변경 후 값은 새 저장소에서
+        읽으므로 경계 기반 지역 배정 결과도 그대로 반영됩니다.
+        """
+        for cctv in diff.get("removed", []):
+            self._add(self._row_labels(old_store, cctv), -1)
+            self.total -= 1
+        for cctv in diff.get("added", []):
+            self._add(self._row_labels(new_store, cctv), 1)
+            self.total += 1
+        for change in ("moved", "renamed", "url_changed", "reclassified"):
+            for old_cctv, new_cctv in diff.get(change, []):
+                self._add(self._row_labels(old_store, old_cctv), -1)
+                self._add(self._row_labels(new_store, new_cctv), 1)
+
+        self.store = new_store
+        self.version = new_store.version
+        self._filtered = {}
+
+    def for_rows(self, indices: Optional[np.ndarray], key: Optional[str] = None) -> Dict[str, Dict]:
+        """Counts of a subset of rows (cached per filter key)"""
+        if indices is None:
+            return self.counts
+        if key is not None:
+            cached = self._filtered.get(key)
+            if cached is not None and cached[0] == len(indices):
+                return cached[1]
+        counts = count_rows(self.store, indices, self.cell_size)
+        if key is not None:
+            self._filtered[key] = (len(indices), counts)
+        return counts
+
+    @staticmethod
+    def top(counts: Mapping, limit: int = 10) -> List[Tuple[object, int]]:
+        """Largest entries of a count mapping"""
+        return sorted(counts.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def verify(self) -> bool:
+        """Check the incremental totals against a full recount"""
+        full = count_rows(self.store, cell_size=self.cell_size)
+        return full == self.counts and self.total == len(self.store)
+
+
+def iter_report_lines(store: CatalogStore, indices: np.ndarray,
+                      chunk: int = 5000) -> Iterable[str]:
+    """Per-camera report lines built in chunks (one string per chunk)"""
+    names = store.names.values
+    for start in range(0, len(indices), chunk):
+        part = indices[start:start + chunk]
+        yield "".join(
+            f"- {names[code]} (위도: {lat}, 경도: {lon})\n"
+            for code, lat, lon in zip(
+                store.name_codes[part].tolist(),
+                store.lat[part].tolist(),
+                store.lon[part].tolist()
+            )
+        )
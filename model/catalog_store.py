@@ -0,0 +1,269 @@
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from collections.abc import Mapping as MappingABC, Sequence as SequenceABC
+from itertools import count
+import numpy as np
+
+from ..utils.geo import PointGridIndex
+from .catalog_diff import COORD_PRECISION
+from .cctv_classify import (REGIONS, ROAD_TYPES, UNKNOWN, CategoryIndex,
+                            classify_region, classify_road_type)
+
+# 카탈로그가 바뀔 때마다 증가하는 전역 버전 (필터/검색 결과 캐시 키로 사용)
+_catalog_versions = count(1)
+
+# 출처가 없는 레코드(이전 캐시/CSV)의 기본 데이터 출처
+DEFAULT_SOURCE = "its"
+
+
+def record_categories(cctv: Mapping) -> Dict[str, str]:
+    """Region/district/road type/source of a record as the store classifies it
+
+    값이 없는 필드는 저장소와 같은 기본값(이름 기반 분류, 기타, 기본 출처)을
+    사용하므로 레코드와 저장소 행의 분류를 그대로 비교할 수 있습니다.
+    """
+    name = cctv["name"]
+    return {
+        "region": cctv.get("region") or classify_region(name),
+        "district": cctv.get("district") or UNKNOWN,
+        "road_type": cctv.get("road_type") or classify_road_type(name),
+        "source": cctv.get("source") or DEFAULT_SOURCE
+    }
+
+
+def _dynamic_labels(values: Iterable[str]) -> List[str]:
+    """Sorted distinct values with the unknown label last"""
+    return sorted(set(values) - {UNKNOWN}) + [UNKNOWN]
+
+
+class StringTable:
+    """Interned string table: each distinct value is stored once"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._lower: Optional[List[str]] = None
+
+    def intern(self, value: str) -> int:
+        """Get (or assign) the code of a string"""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+            self._lower = None
+        return code
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def lower(self) -> List[str]:
+        """Lowercased values (computed once)"""
+        if self._lower is None:
+            self._lower = [value.lower() for value in self.values]
+        return self._lower
+
+
+class CctvRow(MappingABC):
+    """Read-only dict-like view of one catalog row"""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "CatalogStore", index: int):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str):
+        store = self._store
+        i = self._index
+        if key == "name":
+            return store.names[store.name_codes[i]]
+        if key == "url":
+            return store.urls[store.url_codes[i]]
+        if key == "lat":
+            return float(store.lat[i])
+        if key == "lon":
+            return float(store.lon[i])
+        if key == "region":
+            return store.regions.label(i)
+        if key == "district":
+            return store.districts.label(i)
+        if key == "road_type":
+            return store.road_types.label(i)
+        if key == "source":
+            return store.sources.label(i)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._store.FIELDS)
+
+    @property
+    def index(self) -> int:
+        """Row index in the store"""
+        return self._index
+
+    def __repr__(self) -> str:
+        return f"CctvRow({dict(self)!r})"
+
+
+class RowsView(SequenceABC):
+    """Sequence of row views over a store, backed by an index array"""
+
+    def __init__(self, store: "CatalogStore", indices: Optional[np.ndarray] = None):
+        self.store = store
+        self.indices = (
+            np.arange(len(store), dtype=np.int64) if indices is None
+            else np.asarray(indices, dtype=np.int64)
+        )
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return RowsView(self.store, self.indices[item])
+        return CctvRow(self.store, int(self.indices[item]))
+
+    def __iter__(self) -> Iterator[CctvRow]:
+        store = self.store
+        for i in self.indices.tolist():
+            yield CctvRow(store, i)
+
+    def copy(self) -> "RowsView":
+        return RowsView(self.store, self.indices.copy())
+
+    def to_records(self) -> List[Dict]:
+        """Materialize rows as plain dicts"""
+        return self.store.to_records(self.indices)
+
+
+class CatalogStore:
+    """Columnar CCTV catalog
+
+    좌표는 NumPy 배열에, 이름과 URL은 문자열 테이블 코드로 저장합니다.
+    지역(시도/시군구)과 도로 유형은 범주형 코드와 값별 비트맵 색인으로 저장합니다.
+    필터 결과는 레코드 복사 대신 인덱스 배열(RowsView)로 표현합니다.
+    """
+
+    FIELDS = ("name", "url", "lat", "lon", "region", "district", "road_type", "source")
+
+    def __init__(self, records: Iterable[Mapping] = ()):
+        self.names = StringTable()
+        self.urls = StringTable()
+
+        name_codes = []
+        url_codes = []
+        lat = []
+        lon = []
+        regions = []
+        districts = []
+        road_types = []
+        sources = []
+        for cctv in records:
+            name = cctv["name"]
+            name_codes.append(self.names.intern(name))
+            url_codes.append(self.urls.intern(cctv["url"]))
+            lat.append(cctv["lat"])
+            lon.append(cctv["lon"])
+            # 파싱 시 분류된 값을 사용하고, 이전 캐시/CSV 레코드는 여기서 분류
+            categories = record_categories(cctv)
+            regions.append(categories["region"])
+            districts.append(categories["district"])
+            road_types.append(categories["road_type"])
+            sources.append(categories["source"])
+
+        self.name_codes = np.array(name_codes, dtype=np.int32)
+        self.url_codes = np.array(url_codes, dtype=np.int32)
+        self.lat = np.array(lat, dtype=np.float64)
+        self.lon = np.array(lon, dtype=np.float64)
+        self.regions = CategoryIndex.from_values(REGIONS, regions)
+        self.districts = CategoryIndex.from_values(_dynamic_labels(districts), districts)
+        self.road_types = CategoryIndex.from_values(ROAD_TYPES, road_types)
+        self.sources = CategoryIndex.from_values(_dynamic_labels(sources), sources)
+        self.version = next(_catalog_versions)
+        self._key_index: Optional[Dict[Tuple, int]] = None
+        self._point_index: Optional[PointGridIndex] = None
+
+    def __len__(self) -> int:
+        return len(self.name_codes)
+
+    def row(self, index: int) -> CctvRow:
+        return CctvRow(self, index)
+
+    def set_admin_regions(self, regions: CategoryIndex, districts: CategoryIndex) -> None:
+        """Replace the 시도/시군구 columns (boundary-based assignment)"""
+        self.regions = regions
+        self.districts = districts
+
+    def rows(self, indices: Optional[np.ndarray] = None) -> RowsView:
+        """View of all rows, or of the rows at the given indices"""
+        return RowsView(self, indices)
+
+    def to_records(self, indices: Optional[np.ndarray] = None) -> List[Dict]:
+        """Materialize rows as plain dicts (for JSON cache / CSV)"""
+        if indices is None:
+            indices = np.arange(len(self))
+        names = self.names.values
+        urls = self.urls.values
+        region_labels = self.regions.labels
+        district_labels = self.districts.labels
+        road_labels = self.road_types.labels
+        source_labels = self.sources.labels
+        return [
+            {
+                "name": names[n], "url": urls[u], "lat": la, "lon": lo,
+                "region": region_labels[r], "district": district_labels[d],
+                "road_type": road_labels[t], "source": source_labels[s]
+            }
+            for n, u, la, lo, r, d, t, s in zip(
+                self.name_codes[indices].tolist(),
+                self.url_codes[indices].tolist(),
+                self.lat[indices].tolist(),
+                self.lon[indices].tolist(),
+                self.regions.codes[indices].tolist(),
+                self.districts.codes[indices].tolist(),
+                self.road_types.codes[indices].tolist(),
+                self.sources.codes[indices].tolist()
+            )
+        ]
+
+    def name_contains(self, keyword: str) -> np.ndarray:
+        """Boolean mask of rows whose name contains keyword (case-insensitive)
+
+        부분 문자열 비교는 고유 이름마다 한 번만 수행합니다.
+        """
+        keyword = keyword.lower()
+        matched = np.fromiter(
+            (keyword in name for name in self.names.lower),
+            dtype=bool,
+            count=len(self.names)
+        )
+        if not len(self.name_codes):
+            return np.zeros(0, dtype=bool)
+        return matched[self.name_codes]
+
+    def point_index(self) -> PointGridIndex:
+        """Grid spatial index over the row coordinates (built on first use)"""
+        if self._point_index is None:
+            self._point_index = PointGridIndex(self.lon, self.lat)
+        return self._point_index
+
+    def key_index(self) -> Dict[Tuple, int]:
+        """Map record_key (name, lon, lat) -> row index"""
+        if self._key_index is None:
+            names = self.names.values
+            self._key_index = {
+                (names[n], round(lo, COORD_PRECISION), round(la, COORD_PRECISION)): i
+                for i, (n, lo, la) in enumerate(zip(
+                    self.name_codes.tolist(),
+                    self.lon.tolist(),
+                    self.lat.tolist()
+                ))
+            }
+        return self._key_index
@@ -0,0 +1,114 @@
+from typing import Dict, List, Optional, Sequence
+import re
+import numpy as np
+
+# 시도 (코드 순서 고정, 마지막은 미분류)
+REGIONS = [
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
+    "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주",
+    "기타"
+]
+
+# 이름에서 시도를 찾을 때 사용할 별칭
+REGION_ALIASES = {
+    "서울": ["서울"],
+    "부산": ["부산"],
+    "대구": ["대구"],
+    "인천": ["인천"],
+    "광주": ["광주"],
+    "대전": ["대전"],
+    "울산": ["울산"],
+    "세종": ["세종"],
+    "경기": ["경기"],
+    "강원": ["강원"],
+    "충북": ["충북", "충청북"],
+    "충남": ["충남", "충청남"],
+    "전북": ["전북", "전라북"],
+    "전남": ["전남", "전라남"],
+    "경북": ["경북", "경상북"],
+    "경남": ["경남", "경상남"],
+    "제주": ["제주"]
+}
+
+ROAD_TYPES = ["고속도로", "국도", "시도", "기타"]
+
+UNKNOWN = "기타"
+
+# 고속도로 시설 명칭 (IC, JC, 요금소, 휴게소 등)
+_HIGHWAY_PATTERN = re.compile(r"고속|IC|JC|JCT|TG|톨게이트|요금소|휴게소|분기점|나들목")
+
+
+def classify_region(name: str) -> str:
+    """Guess 시도 from a camera name"""
+    for region, aliases in REGION_ALIASES.items():
+        if any(alias in name for alias in aliases):
+            return region
+    return UNKNOWN
+
+
+def classify_road_type(name: str) -> str:
+    """Guess road type from a camera name"""
+    if "국도" in name:
+        return "국도"
+    if _HIGHWAY_PATTERN.search(name):
+        return "고속도로"
+    if "시도" in name:
+        return "시도"
+    return UNKNOWN
+
+
+class CategoryIndex:
+    """Categorical column with one bitmap (boolean mask) per category value"""
+
+    def __init__(self, labels: Sequence[str], codes: np.ndarray):
+        self.labels = list(labels)
+        self._codes_by_label: Dict[str, int] = {label: i for i, label in enumerate(self.labels)}
+        self.codes = np.asarray(codes, dtype=np.uint16)
+        # 비트맵은 처음 사용할 때 만듦 (시군구처럼 값이 많은 열 대비)
+        self._bitmaps: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def from_values(cls, labels: Sequence[str], values: Sequence[str]) -> "CategoryIndex":
+        """Build from per-row label values (unknown values fall into the last label)"""
+        lookup = {label: i for i, label in enumerate(labels)}
+        unknown = len(labels) - 1
+        codes = np.fromiter(
+            (lookup.get(value, unknown) for value in values),
+            dtype=np.uint16,
+            count=len(values)
+        )
+        return cls(labels, codes)
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._codes_by_label
+
+    def label(self, row: int) -> str:
+        return self.labels[self.codes[row]]
+
+    def bitmap(self, label: str) -> np.ndarray:
+        """Row mask of one category value"""
+        code = self._codes_by_label.get(label)
+        if code is None:
+            return np.zeros(len(self.codes), dtype=bool)
+        bitmap = self._bitmaps.get(code)
+        if bitmap is None:
+            bitmap = self._bitmaps[code] = self.codes == code
+        return bitmap
+
+    def bitmap_any(self, labels: Sequence[str]) -> np.ndarray:
+        """Row mask of any of the category values (bitwise OR)"""
+        mask = np.zeros(len(self.codes), dtype=bool)
+        for label in labels:
+            mask |= self.bitmap(label)
+        return mask
+
+    def counts(self, mask: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """Row count per category value, optionally restricted to a mask"""
+        codes = self.codes if mask is None else self.codes[mask]
+        totals = np.bincount(codes, minlength=len(self.labels))
+        return {label: int(total) for label, total in zip(self.labels, totals) if total}
+
+    def labels_with_counts(self) -> List[tuple]:
+        """(label, count) for every non-empty category in label order"""
+        counts = self.counts()
+        return [(label, counts[label]) for label in self.labels if label in counts]
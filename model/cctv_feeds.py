@@ -0,0 +1,170 @@
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+import math
+import re
+
+from ..utils.exceptions import ConfigError
+
+
+class Feed(NamedTuple):
+    """One ITS CCTV feed (road type x stream type) and the source tag of its records"""
+    source: str
+    road_type: str  # API type: ex 고속도로 / its 국도
+    cctv_type: str  # API cctvType: 1 실시간 스트리밍 / 2 동영상 파일 / 3 정지 영상
+
+
+ROAD_TYPES = ("ex", "its")
+CCTV_TYPES = ("1", "2", "3", "4", "5")
+
+# 기본 피드 (앞의 피드가 중복 제거 시 우선)
+DEFAULT_FEEDS = (
+    Feed("ex", "ex", "1"),
+    Feed("its", "its", "1")
+)
+
+# 같은 CCTV로 볼 최대 거리(m)와 최소 이름 유사도
+DEDUP_DISTANCE_M = 50.0
+NAME_SIMILARITY = 0.7
+
+# 위도 1도의 거리(m)와 격자 셀 경도 폭 계산 기준 위도 (국내 최북단보다 북쪽)
+METERS_PER_DEG = 111320.0
+GRID_REFERENCE_LAT = 40.0
+
+_BRACKETS = re.compile(r"\[[^\]]*\]|\([^)]*\)")
+_NOISE = re.compile(r"[\s\-_/.,·:]+")
+_DIRECTION = re.compile(r"상행|하행|양방향|[가-힣]+방향")
+
+
+def feed_source(road_type: str, cctv_type: str) -> str:
+    """Source tag of a feed (도로 유형, 실시간 스트리밍이 아니면 CCTV 유형 추가)"""
+    return road_type if cctv_type == "1" else f"{road_type}-{cctv_type}"
+
+
+def parse_feeds(value: str) -> Tuple[Feed, ...]:
+    """Parse a feed list such as "ex:1, its:1, ex:3" (비어 있으면 기본 피드)"""
+    feeds = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        road_type, _, cctv_type = part.partition(":")
+        road_type = road_type.strip().lower()
+        cctv_type = cctv_type.strip() or "1"
+        if road_type not in ROAD_TYPES or cctv_type not in CCTV_TYPES:
+            raise ConfigError(f"잘못된 CCTV 피드 설정입니다: {part}")
+        feed = Feed(feed_source(road_type, cctv_type), road_type, cctv_type)
+        if feed not in feeds:
+            feeds.append(feed)
+    return tuple(feeds) or DEFAULT_FEEDS
+
+
+def normalize_name(name: str) -> str:
+    """Name without bracketed prefixes, spaces and punctuation"""
+    return _NOISE.sub("", _BRACKETS.sub("", name or "")).lower()
+
+
+def _bigrams(text: str) -> Dict[str, int]:
+    grams = {}
+    for i in range(len(text) - 1):
+        gram = text[i:i + 2]
+        grams[gram] = grams.get(gram, 0) + 1
+    return grams
+
+
+def name_similarity(a: str, b: str) -> float:
+    """Similarity (0-1) of two camera names
+
+    정규화한 이름이 같으면 1, 한쪽이 다른 쪽을 포함하면 0.9, 그 밖에는
+    문자 바이그램 Dice 계수입니다. 진행 방향(상행/하행, ○○방향)이 다르면 0입니다.
+    """
+    directions_a = set(_DIRECTION.findall(a or ""))
+    directions_b = set(_DIRECTION.findall(b or ""))
+    if directions_a and directions_b and directions_a != directions_b:
+        return 0.0
+
+    a = normalize_name(a)
+    b = normalize_name(b)
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    if len(a) >= 2 and len(b) >= 2 and (a in b or b in a):
+        return 0.9
+
+    grams_a = _bigrams(a)
+    grams_b = _bigrams(b)
+    total = sum(grams_a.values()) + sum(grams_b.values())
+    if not total:
+        return 0.0
+    common = sum(min(count, grams_b.get(gram, 0)) for gram, count in grams_a.items())
+    return 2.0 * common / total
+
+
+class FeedMerger:
+    """Merge records of several feeds, dropping cameras already taken from an earlier feed
+
+    CCTV를 거리 기준 크기의 격자 셀에 해시하고, 인접 9개 셀의 앞선 피드
+    CCTV 중 거리 안에 있으면서 URL이 같거나 이름이 비슷한 것이 있으면
+    중복으로 봅니다. 같은 피드 안의 레코드끼리는 비교하지 않습니다.
+    """
+
+    def __init__(self, distance_m: float = DEDUP_DISTANCE_M,
+                 min_similarity: float = NAME_SIMILARITY):
+        self.distance_m = distance_m
+        self.min_similarity = min_similarity
+        self.cell_lat = distance_m / METERS_PER_DEG
+        self.cell_lon = self.cell_lat / math.cos(math.radians(GRID_REFERENCE_LAT))
+        self.records: List[Dict] = []
+        self.duplicates = 0
+        self._grid: Dict[Tuple[int, int], List[Dict]] = {}
+
+    def _cell(self, cctv: Dict) -> Tuple[int, int]:
+        return (int(math.floor(cctv["lon"] / self.cell_lon)),
+                int(math.floor(cctv["lat"] / self.cell_lat)))
+
+    def _distance_m(self, a: Dict, b: Dict) -> float:
+        """Equirectangular distance (수십 m 범위에서는 대원 거리와 같음)"""
+        dx = (a["lon"] - b["lon"]) * math.cos(math.radians((a["lat"] + b["lat"]) / 2))
+        dy = a["lat"] - b["lat"]
+        return math.hypot(dx, dy) * METERS_PER_DEG
+
+    def find_duplicate(self, cctv: Dict) -> Optional[Dict]:
+        """Camera of an earlier feed that cctv duplicates, if any"""
+        col, row = self._cell(cctv)
+        for d_col in (-1, 0, 1):
+            for d_row in (-1, 0, 1):
+                for other in self._grid.get((col + d_col, row + d_row), ()):
+                    if self._distance_m(cctv, other) > self.distance_m:
+                        continue
+                    if cctv["url"] and cctv["url"] == other["url"]:
+                        return other
+                    if name_similarity(cctv["name"], other["name"]) >= self.min_similarity:
+                        return other
+        return None
+
+    def add_feed(self, records: Sequence[Dict]) -> List[Dict]:
+        """Add the records of the next feed; returns those kept"""
+        kept = []
+        for cctv in records:
+            if self._grid and self.find_duplicate(cctv) is not None:
+                self.duplicates += 1
+                continue
+            kept.append(cctv)
+
+        # 같은 피드 안에서는 비교하지 않도록 피드가 끝난 뒤 격자에 등록
+        for cctv in kept:
+            self._grid.setdefault(self._cell(cctv), []).append(cctv)
+        self.records.extend(kept)
+        return kept
+
+
+def merge_feeds(feeds: Sequence[Sequence[Dict]], distance_m: float = DEDUP_DISTANCE_M,
+                min_similarity: float = NAME_SIMILARITY) -> Tuple[List[Dict], int]:
+    """Merge per-feed record lists in priority order
+
+    Returns:
+        (병합된 레코드, 제거한 중복 수)
+    """
+    merger = FeedMerger(distance_m, min_similarity)
+    for records in feeds:
+        merger.add_feed(records)
+    return merger.records, merger.duplicates
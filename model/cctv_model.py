@@ -1,174 +1,1188 @@
-from typing import List, Dict, Optional, Callable
+from typing import (List, Dict, FrozenSet, Iterable, Iterator, NamedTuple, Optional,
+                    Callable, Sequence, Tuple)
 from qgis.core import (QgsVectorLayer, QgsFeature, QgsGeometry, QgsPoint,
                       QgsField, QgsProject, QgsPointXY, QgsSvgMarkerSymbolLayer,
                       QgsSingleSymbolRenderer, QgsSymbol, QgsPalLayerSettings,
-                      QgsTextFormat, QgsVectorLayerSimpleLabeling, QgsVectorFileWriter)
+                      QgsTextFormat, QgsVectorLayerSimpleLabeling, QgsVectorFileWriter,
+                      QgsExpression, QgsFeatureRequest, QgsRectangle, QgsSpatialIndex,
+                      QgsApplication, QgsTask)
 from qgis.PyQt.QtCore import QVariant, QObject, pyqtSignal
 from qgis.PyQt.QtGui import QColor
 from ..utils.logger import Logger
 from ..utils.exceptions import (
-    QcctvKorError, ApiError, NetworkError, DataError,
-    LayerError, ConfigError, handle_exception
+    QcctvKorError, ApiError, DataError,
+    LayerError, ConfigError, CanceledError, handle_exception
 )
-import requests
-import json
+import numpy as np
 import os
 import time
-from threading import Thread
-from functools import lru_cache
+from threading import Lock
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 import csv
 from datetime import datetime
 from .filter_settings import FilterSettings
+from .cctv_tiles import TileGrid, Tile, BBox
+from .cctv_feeds import DEFAULT_FEEDS, Feed, merge_feeds, parse_feeds
+from .catalog_cache import CatalogCache
+from .catalog_diff import diff_catalog, is_empty_diff, summarize_diff, record_key
+from .catalog_store import DEFAULT_SOURCE, CatalogStore, RowsView, record_categories
+from .search_index import NgramSearchIndex, has_choseong
+from .cctv_classify import UNKNOWN, classify_region, classify_road_type
+from .region_engine import RegionEngine
+from .filter_engine import FilterEngine, SPATIAL_KEYS, filter_key, is_group
+from .catalog_stats import CatalogAggregates, count_rows, iter_report_lines
+from .filter_query import parse_query
+from .filter_pushdown import Pushdown, bbox_contains, describe_pushdown, plan_pushdown, region_bbox
+from .spatial_filter import DEFAULT_BUFFER_M, selection_filter
 from QcctvKor.view.settings_dialog import SettingsDialog
 from ..utils.config_manager import ConfigManager
+from ..utils.http_client import HttpClient, shared_client
+from ..utils.json_stream import JsonArrayStream
 
 logger = Logger.get_logger()
 
+# 단일 요청 로딩의 기본 조회 범위 (수도권)
+DEFAULT_BBOX = (126.5, 37.0, 127.5, 38.0)
+
+# 메모리에 유지할 필터 범위 조회 결과 수
+MAX_PUSHDOWN_AREAS = 16
+
+# 화면 범위 로딩 시 메모리(타일 데이터)에 유지할 최대 레코드 수
+VIEWPORT_BUDGET = 20000
+
+# 첫 로드 중 레이어에 점진적으로 추가할 조각 크기(레코드 수)와 최대 간격(초)
+LAYER_CHUNK_SIZE = 500
+LAYER_CHUNK_INTERVAL = 0.1
+
+# 경계 기반 배정/피드 병합 후 레이어 속성을 다시 확인할 분류 필드
+CLASSIFIED_FIELDS = ("region", "district", "road_type", "source")
+
+# ITS API 응답에서 CCTV 목록의 위치
+ITEMS_PATH = ("response", "data")
+
+# 파싱 중 취소 확인/조각 전달 단위(항목 수)와 로딩 진행률 알림 최소 간격(초)
+# (조각 전달 단위는 레이어 조각보다 작아야 조각 크기/간격이 지켜짐)
+PARSE_BATCH = 256
+PROGRESS_INTERVAL = 0.25
+
+class RecordChunker:
+    """Batch records arriving from a download into chunks by size or age
+    
+    emit(조각 번호, 레코드 목록)은 조각마다 한 번 호출되며, 지금까지 넘긴
+    레코드는 records에 누적됩니다. 큰 묶음(타일 하나 등)은 chunk_size 단위로
+    나누어 넘기고, 남은 레코드는 interval이 지난 뒤 다음 묶음이 올 때 넘깁니다.
+    작업 스레드에서 사용합니다.
+    """
+    
+    def __init__(self, emit: Callable[[int, List[Dict]], None],
+                 chunk_size: int = LAYER_CHUNK_SIZE, interval: float = LAYER_CHUNK_INTERVAL):
+        self.emit = emit
+        self.chunk_size = chunk_size
+        self.interval = interval
+        self.records: List[Dict] = []
+        self.chunks = 0
+        self._pending: List[Dict] = []
+        self._last_flush = time.monotonic()
+        
+    def add(self, records: List[Dict]) -> None:
+        self._pending.extend(records)
+        if len(self._pending) >= self.chunk_size:
+            # 가득 찬 조각만 넘기고 나머지는 다음 묶음을 기다림
+            full = len(self._pending) - len(self._pending) % self.chunk_size
+            pending, self._pending = self._pending[:full], self._pending[full:]
+            self._emit_chunks(pending)
+        if self._pending and time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+            
+    def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        self._emit_chunks(pending)
+        
+    def _emit_chunks(self, records: List[Dict]) -> None:
+        self._last_flush = time.monotonic()
+        for start in range(0, len(records), self.chunk_size):
+            chunk = records[start:start + self.chunk_size]
+            self.records.extend(chunk)
+            self.emit(self.chunks, chunk)
+            self.chunks += 1
+
+class PreparedFilter(NamedTuple):
+    """Filter result evaluated off the GUI thread, ready to apply to the layer"""
+    filter_config: Dict
+    rows: RowsView
+    subset: str
+    layer_revision: int
+
+class CatalogBuild(NamedTuple):
+    """Catalog parsed and indexed by the load task, ready to install on the GUI thread"""
+    generation: int
+    catalog: CatalogStore
+    search_index: NgramSearchIndex
+    base: CatalogStore  # 변경분(diff) 계산 기준 카탈로그
+    diff: Optional[Dict]  # None이면 첫 로드
+    final: bool  # 재검증 전 마지막 카탈로그이면 False
+    layer_diff: Optional[Dict] = None  # 점진 표시한 레코드 -> 카탈로그 변경분
+
 class CctvModel(QObject):
     # 시그널 정의
     data_loaded = pyqtSignal(bool)  # 데이터 로딩 완료 시그널
     loading_progress = pyqtSignal(int, int)  # 로딩 진행률 시그널
+    catalog_updated = pyqtSignal(object)  # 재검증 후 카탈로그 변경분(diff) 시그널
+    filter_progress = pyqtSignal(int)  # 백그라운드 필터 진행률 (0-100) 시그널
+    filter_finished = pyqtSignal(bool)  # 백그라운드 필터 적용 완료 시그널
+    filter_canceled = pyqtSignal()  # 백그라운드 필터가 결과 없이 취소됨 시그널
+    _catalog_built = pyqtSignal(object)  # 로딩 작업 -> GUI 스레드 카탈로그 전달
+    _records_arrived = pyqtSignal(int, int, object)  # 첫 로드 중 (세대, 조각 번호, 레코드)
     
     def __init__(self):
         super().__init__()
         self.layer: Optional[QgsVectorLayer] = None
-        self.cctv_data: List[Dict] = []
-        self.filtered_data: List[Dict] = []
+        # 열 기반 카탈로그와 필터 결과(인덱스 배열 뷰)
+        self.catalog = CatalogStore()
+        self.search_index = NgramSearchIndex(self.catalog)
+        self._filtered: Optional[RowsView] = None
         self.layer_name = "QcctvKor_temp_layer"
         
+        # 레이어 피처 색인 (record_key -> 피처 ID, 피처 ID -> 레코드, 공간 색인)
+        self._layer_fids: Dict[Tuple, int] = {}
+        self._records_by_fid: Dict[int, Dict] = {}
+        self._spatial_index = QgsSpatialIndex()
+        # 피처 색인이 바뀔 때마다 증가 (백그라운드에서 만든 피처 ID 조건 검증용)
+        self._layer_revision = 0
+        
         # API 설정 로드 (초기화 시에는 오류 발생하지 않음)
+        boundary_file = None
+        feeds_setting = ""
+        viewport_budget = 0
         try:
             config_manager = ConfigManager()
             self.api_key = config_manager.get_api_key()
             self.base_url = "http://openapi.its.go.kr:8081/api/NCCTVInfo"
+            boundary_file = config_manager.get_boundary_file() or None
+            feeds_setting = config_manager.get_cctv_feeds()
+            viewport_budget = config_manager.get_viewport_budget()
             logger.info("API 설정이 로드되었습니다.")
         except Exception as e:
             logger.error(Logger.format_error(e, "API 설정 로드 실패"))
             self.api_key = ""
             self.base_url = "http://openapi.its.go.kr:8081/api/NCCTVInfo"
             
-        self._cache = {}
+        # 조회할 ITS CCTV 피드 (도로 유형 x CCTV 유형, 앞의 피드가 중복 제거 시 우선)
+        try:
+            self.feeds = parse_feeds(feeds_setting)
+        except ConfigError as e:
+            logger.error(Logger.format_error(e, "CCTV 피드 설정 오류 (기본 피드 사용)"))
+            self.feeds = DEFAULT_FEEDS
+            
+        # 행정구역 경계 기반 시도/시군구 배정
+        self.region_engine = RegionEngine(boundary_file)
+        if not self.region_engine.available:
+            logger.warning(
+                f"행정구역 경계 파일이 없어 CCTV 이름으로 시도를 추정합니다: "
+                f"{self.region_engine.boundary_file}"
+            )
+            
         self._cache_timeout = 300
+        self._cache = CatalogCache(ttl=self._cache_timeout)
+        
+        # 필터 범위 조회 (필터 조건을 API 조회 범위/도로 유형으로 변환, 별도 캐시)
+        self._pushdown_cache = CatalogCache(ttl=self._cache_timeout, name="pushdown_cache")
+        self._pushdown_data: "OrderedDict[Pushdown, List[Dict]]" = OrderedDict()
+        self._pending_pushdown: Optional[Pushdown] = None
+        # 로딩 슬롯에서 실행 중인 필터 범위 조회 (다른 로딩에 밀리면 다시 대기열에 넣음)
+        self._running_pushdown: Optional[Pushdown] = None
+        # 카탈로그에 반영된 조회 범위, 피드 출처 태그와 범위를 가져온 필터 범위 조회
+        # (None이면 전체 로딩, 필터 범위 조회 결과가 제거되면 기록도 제거)
+        self._covered: List[Tuple[BBox, FrozenSet[str], Optional[Pushdown]]] = []
+        
+        # 전국 타일 단위 조회 설정
+        self.tile_grid = TileGrid(max_age=self._cache_timeout)
+        self.max_fetch_workers = 4
+        # 화면 범위 로딩에서 넘으면 화면에서 먼 타일부터 제거할 레코드 수
+        self.viewport_budget = viewport_budget or VIEWPORT_BUDGET
+        
+        # ITS API 호출 (연결 재사용, 제한 시간, 재시도/백오프, 지연 시간 기록)
+        self.http: HttpClient = shared_client()
+        # (타일, 피드 출처 태그) -> 레코드
+        self._tile_data: Dict[Tuple[Tile, str], List[Dict]] = {}
+        self._tile_lock = Lock()
+        
         self.filter_settings = FilterSettings()
+        self.filter_engine = FilterEngine()
         self.current_filter = None
+        
+        # 백그라운드 필터 작업 (새 요청이 실행 중인 이전 작업을 취소)
+        self._filter_task: Optional[QgsTask] = None
+        self._filter_generation = 0
+        
+        # 카탈로그 로딩 작업 (작업 스레드에서 만든 카탈로그를 GUI 스레드에서 설치)
+        self._load_task: Optional[QgsTask] = None
+        self._load_generation = 0
+        self._catalog_built.connect(self._on_catalog_built)
+        # 레이어에 조각 단위로 표시 중인 로딩 세대
+        self._stream_generation: Optional[int] = None
+        self._records_arrived.connect(self._on_records_arrived)
+        
+        # 지역/도로/출처/격자별 집계 (카탈로그 변경분으로 갱신)
+        self._aggregates: Optional[CatalogAggregates] = None
+        
+    @property
+    def cctv_data(self) -> RowsView:
+        """All catalog rows (read-only dict-like views)"""
+        return self.catalog.rows()
+        
+    @cctv_data.setter
+    def cctv_data(self, records) -> None:
+        """Replace the catalog, rebuild its search index and re-evaluate the current filter"""
+        self._install_catalog(*self._build_catalog(records))
+        if self._filtered is not None and self.current_filter:
+            self._filtered = self.catalog.rows(self._evaluate_filter(self.current_filter))
+        else:
+            self._filtered = None
+            
+    def _build_catalog(self, records) -> Tuple[CatalogStore, NgramSearchIndex]:
+        """Parse records into an indexed catalog (thread-safe, model state untouched)"""
+        catalog = CatalogStore(records)
+        self._assign_admin_regions(catalog)
+        return catalog, NgramSearchIndex(catalog)
+        
+    def _install_catalog(self, catalog: CatalogStore, search_index: NgramSearchIndex) -> None:
+        """Make an indexed catalog current"""
+        # 이전 카탈로그의 필터 결과는 더 이상 쓰이지 않음
+        self.filter_engine.invalidate(catalog)
+        self.search_index = search_index
+        self.catalog = catalog
+            
+    def _assign_admin_regions(self, catalog: CatalogStore) -> None:
+        """Assign 시도/시군구 by administrative boundaries (name-based on failure)"""
+        if not self.region_engine.available:
+            return
+        try:
+            self.region_engine.apply(catalog)
+        except Exception as e:
+            logger.error(Logger.format_error(e, "행정구역 배정 실패 (이름 기반 분류 사용)"))
+            
+    @property
+    def filtered_data(self) -> RowsView:
+        """Rows of the current filter result (empty when no filter)"""
+        if self._filtered is None:
+            return self.catalog.rows(np.zeros(0, dtype=np.int64))
+        return self._filtered
+        
+    @filtered_data.setter
+    def filtered_data(self, records) -> None:
+        if isinstance(records, RowsView):
+            self._filtered = records
+        else:
+            self._filtered = CatalogStore(records).rows() if records else None
     
-    def load_cctv_data(self) -> None:
-        """비동기적으로 CCTV 데이터 로드"""
+    def load_cctv_data(self, tiled: bool = False,
+                       stale_while_revalidate: bool = False) -> QgsTask:
+        """비동기적으로 CCTV 데이터 로드
+        
+        조회 → 파싱 → 색인 단계는 QgsTask 작업 스레드에서 실행되고, 만들어진
+        카탈로그는 GUI 스레드에서 설치되어 레이어에 바로 반영됩니다.
+        실행 중인 이전 로딩은 취소됩니다.
+        tiled가 True이면 전국 범위를 타일로 나누어 병렬로 조회합니다.
+        stale_while_revalidate가 True이면 마지막으로 알려진 카탈로그를 먼저
+        표시하고 백그라운드에서 다시 조회한 뒤 catalog_updated로 변경분을 알립니다.
+        """
         # API 키 검사는 여기서 수행
         if not self.api_key:
             raise ConfigError("API 키가 설정되지 않았습니다. '플러그인 > QcctvKor > ITS API 키 설정' 메뉴에서 API 키를 설정해주세요.")
         
-        Thread(target=self._async_load_data, daemon=True).start()
+        return self._start_load_task("CCTV 카탈로그 로딩", self._run_load_task,
+                                     tiled, stale_while_revalidate)
+        
+    def _start_load_task(self, description: str, function: Callable, *args) -> QgsTask:
+        """Run function(task, *args, generation) as the load task (previous load is cancelled)
+        
+        취소되는 작업이 필터 범위 조회이면 새 작업이 끝난 뒤 다시 실행합니다.
+        """
+        interrupted = self._running_pushdown if self._load_task is not None else None
+        self.cancel_load_task()
+        self._running_pushdown = None
+        if interrupted is not None and self._pending_pushdown is None:
+            self._pending_pushdown = interrupted
+        generation = self._load_generation
+        
+        task = QgsTask.fromFunction(
+            description,
+            function,
+            *args,
+            generation,
+            on_finished=lambda exception, result=None: self._on_load_task_finished(
+                generation, exception, result),
+            flags=QgsTask.CanCancel
+        )
+        task.progressChanged.connect(self._on_load_progress)
+        self._load_task = task
+        QgsApplication.taskManager().addTask(task)
+        return task
+        
+    def cancel_load_task(self) -> None:
+        """Cancel the running catalog load (catalogs not yet installed are discarded)"""
+        self._load_generation += 1
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+            
+    def cancel_background_tasks(self) -> None:
+        """Cancel background loading and filtering (plugin unload / cleanup)"""
+        self._pending_pushdown = None
+        self._running_pushdown = None
+        self.cancel_load_task()
+        self.cancel_filter_task()
         
     @Logger.log_function_call
-    def _async_load_data(self) -> None:
-        """비동기 데이터 로딩 처리"""
+    def _run_load_task(self, task: QgsTask, tiled: bool, stale_while_revalidate: bool,
+                       generation: int) -> None:
+        """Load pipeline worker: fetch -> parse -> index (runs off the GUI thread)
+        
+        만든 카탈로그는 _catalog_built 시그널로 GUI 스레드에 전달합니다.
+        모델 상태(카탈로그, 레이어)는 여기서 변경하지 않습니다.
+        """
+        progress = self._task_progress(task)
+        base = self.catalog
+        
+        last_known = []
+        if stale_while_revalidate:
+            last_known = self._load_last_known_catalog(tiled)
+            if last_known:
+                logger.info(f"마지막 카탈로그 {len(last_known)}개를 먼저 표시합니다.")
+                base = self._deliver_catalog(generation, last_known, base, final=False)
+                
+        # 표시할 카탈로그가 없으면 조회되는 대로 조각 단위로 레이어에 추가
+        stream = None
+        if not len(base):
+            stream = RecordChunker(
+                lambda index, records: self._records_arrived.emit(generation, index, records)
+            )
+        on_records = stream.add if stream else None
+                
         try:
-            # 캐시 확인
-            cached_data = self._get_cached_data()
-            if cached_data:
-                logger.info("캐시된 데이터를 사용합니다.")
-                self.cctv_data = cached_data
-                self.data_loaded.emit(True)
+            if tiled:
+                new_data, failed = self._fetch_tiled_catalog(progress, task.isCanceled, on_records)
+                # 실패한 타일이 있으면 그 범위는 필터 범위 조회로 다시 가져올 수 있게 둠
+                loaded_feeds = self.feeds if not failed else []
+                covered_bbox = self.tile_grid.extent
+            else:
+                new_data, loaded_feeds = self._fetch_catalog(
+                    None, progress, task.isCanceled, on_records,
+                    use_cache=not stale_while_revalidate
+                )
+                covered_bbox = DEFAULT_BBOX
+                    
+        except CanceledError:
+            raise
+        except Exception as e:
+            if not last_known:
+                raise handle_exception(e)
+            # 이전 카탈로그를 계속 사용
+            logger.error(Logger.format_error(e, "카탈로그 재검증 실패"))
+            return
+            
+        if task.isCanceled():
+            raise CanceledError("카탈로그 로딩이 취소되었습니다.")
+        if stream:
+            stream.flush()
+            logger.info(f"{len(stream.records)}개 CCTV를 {stream.chunks}개 조각으로 먼저 표시했습니다.")
+        if loaded_feeds:
+            with self._tile_lock:
+                self._mark_covered(covered_bbox, loaded_feeds)
+        # 필터 범위 조회로 가져온 CCTV도 카탈로그에 유지
+        new_data = self._merge_records(new_data, self._pushed_records())
+        self._deliver_catalog(generation, new_data, base, final=True,
+                              streamed=stream.records if stream else None)
+        
+    @staticmethod
+    def _task_progress(task: QgsTask) -> Callable[[int, int], None]:
+        """progress(done, total) callback reporting to a task a few times per second"""
+        last_report = [0.0]
+        
+        def progress(done: int, total: int) -> None:
+            # 진행률 알림은 초당 몇 번으로 제한 (완료 시점은 항상 알림)
+            now = time.monotonic()
+            if done < total and now - last_report[0] < PROGRESS_INTERVAL:
                 return
+            last_report[0] = now
+            task.setProgress(100.0 * min(done, total) / max(total, 1))
+        return progress
+        
+    def _deliver_catalog(self, generation: int, records: List[Dict], base: CatalogStore,
+                         final: bool, streamed: Optional[List[Dict]] = None) -> CatalogStore:
+        """Index records and hand the catalog to the GUI thread (worker side)"""
+        catalog, search_index = self._build_catalog(records)
+        # 첫 로드이면 변경분 없이 전체를 반영
+        diff = None
+        if len(base):
+            diff = diff_catalog(base.rows(), catalog.rows())
+            diff["reclassified"] = self._reclassified(base.rows(), catalog, diff)
+        layer_diff = self._streamed_layer_diff(streamed, catalog) if streamed else None
+        self._catalog_built.emit(CatalogBuild(
+            generation, catalog, search_index, base, diff, final, layer_diff
+        ))
+        return catalog
+        
+    @staticmethod
+    def _streamed_layer_diff(streamed: List[Dict], catalog: CatalogStore) -> Dict:
+        """Diff from the records shown while streaming to the finished catalog
+        
+        타일 경계 중복 제거와 행정구역 경계 배정으로 달라진 피처도 포함합니다
+        (분류만 바뀐 피처는 reclassified).
+        """
+        diff = diff_catalog(streamed, catalog.rows())
+        diff["reclassified"] = CctvModel._reclassified(streamed, catalog, diff)
+        return diff
+        
+    @staticmethod
+    def _reclassified(records: Iterable[Dict], catalog: CatalogStore, diff: Dict) -> List[Tuple]:
+        """Pairs (record, catalog row) with the same key whose classified fields differ
+        
+        URL 변경으로 이미 diff에 들어 있는 CCTV는 제외합니다.
+        """
+        key_index = catalog.key_index()
+        changed = {record_key(new_cctv) for _, new_cctv in diff.get("url_changed", [])}
+        reclassified = []
+        for cctv in records:
+            key = record_key(cctv)
+            index = key_index.get(key)
+            if index is None or key in changed:
+                continue
+            row = catalog.row(index)
+            # 파싱 직후 레코드에 없는 필드(시군구 등)는 저장소와 같은 기본값으로 비교
+            categories = record_categories(cctv)
+            if any(categories[field] != row[field] for field in CLASSIFIED_FIELDS):
+                reclassified.append((cctv, row))
+        return reclassified
+        
+    def _on_catalog_built(self, build: CatalogBuild) -> None:
+        """Install a catalog from the load task and populate the layer (GUI thread)"""
+        if build.generation != self._load_generation:
+            return
+            
+        old_catalog = self.catalog
+        # 작업 중에 다른 카탈로그가 설치되었으면 변경분을 레이어 기준으로 다시 계산
+        diff = build.diff if build.base is old_catalog else None
+        self._install_catalog(build.catalog, build.search_index)
+        if diff is not None:
+            self._update_aggregates(diff, old_catalog)
+            
+        try:
+            if build.layer_diff is not None and self._stream_generation == build.generation:
+                # 조각 단위로 표시한 레코드와 최종 카탈로그의 차이만 반영
+                self._stream_generation = None
+                self.update_layer_features(build.layer_diff)
+            else:
+                self._sync_layer(diff)
+        except QcctvKorError as e:
+            logger.error(Logger.format_error(e, "레이어 갱신 실패"))
+            
+        # 레이어 피처가 바뀌었으므로 현재 필터와 표시 조건을 다시 평가
+        if self._filtered is not None and self.current_filter:
+            self.apply_filter_async(self.current_filter)
+        else:
+            self._filtered = None
+            
+        if diff is not None:
+            if is_empty_diff(diff):
+                logger.info("카탈로그 변경 사항이 없습니다.")
+            else:
+                logger.info(f"카탈로그가 갱신되었습니다: {summarize_diff(diff)}")
+                self.catalog_updated.emit(diff)
+        if build.diff is None or build.final:
+            self.data_loaded.emit(True)
+            
+    def _sync_layer(self, diff: Optional[Dict]) -> None:
+        """Bring the layer up to date with the installed catalog"""
+        if not self.layer:
+            return
+        if not self._layer_fids:
+            # 빈 레이어는 전체 카탈로그로 채움
+            self.add_cctv_features(self.cctv_data)
+        else:
+            self.update_layer_features(diff)
+            
+    def _on_records_arrived(self, generation: int, index: int, records: List[Dict]) -> None:
+        """Add a chunk of a first load to the layer (one repaint per chunk, GUI thread)"""
+        if generation != self._load_generation or not self.layer:
+            return
+        if self._stream_generation != generation:
+            # 빈 레이어에 첫 조각부터 받은 경우에만 점진 표시
+            if index != 0 or self._layer_fids:
+                return
+            self._stream_generation = generation
+            
+        # 타일 경계에서 중복된 CCTV는 한 번만 추가
+        chunk = {}
+        for cctv in records:
+            key = record_key(cctv)
+            if key not in self._layer_fids:
+                chunk.setdefault(key, cctv)
+        if not chunk:
+            return
+        self._add_layer_records(list(chunk.values()))
+        self.layer.updateExtents()
+        self.layer.triggerRepaint()
+        
+    def _on_load_progress(self, value: float) -> None:
+        self.loading_progress.emit(int(value), 100)
+        
+    def _on_load_task_finished(self, generation: int, exception, result) -> None:
+        """Report a failed load (catalogs were already installed via _catalog_built)"""
+        if generation != self._load_generation:
+            return
+        self._load_task = None
+        self._running_pushdown = None
+        # 로딩 중에 요청된 (또는 로딩에 밀려 취소된) 필터 범위 조회 실행
+        self._start_pending_pushdown()
+        if exception is None:
+            # 진행률 표시 종료 (카탈로그 설치는 _catalog_built에서 data_loaded로 알림)
+            self.loading_progress.emit(100, 100)
+            return
+            
+        if isinstance(exception, CanceledError) or str(exception) == "Task canceled":
+            logger.info("카탈로그 로딩이 취소되었습니다.")
+            return
+        logger.error(Logger.format_error(exception, "데이터 로딩 실패"))
+        self.data_loaded.emit(False)
+            
+    def _load_last_known_catalog(self, tiled: bool) -> List[Dict]:
+        """만료 여부와 관계없이 마지막으로 저장된 카탈로그 조회 (피드별 캐시 병합)"""
+        if not tiled:
+            return self._merge_feeds([
+                self._get_cached_data(self._get_api_params(feed=feed), allow_stale=True) or []
+                for feed in self.feeds
+            ])
+            
+        for tile in self.tile_grid.tiles():
+            bbox = self.tile_grid.tile_bbox(tile)
+            for feed in self.feeds:
+                if (tile, feed.source) in self._tile_data:
+                    continue
+                entry = self._cache.get_entry(CatalogCache.make_key(self._get_api_params(bbox, feed)))
+                if entry:
+                    with self._tile_lock:
+                        self._tile_data[(tile, feed.source)] = entry[0]
+        return self._merge_tile_data()
+        
+    def _fetch_catalog(self, bbox: Optional[BBox] = None,
+                       progress: Optional[Callable[[int, int], None]] = None,
+                       is_canceled: Optional[Callable[[], bool]] = None,
+                       on_records: Optional[Callable[[List[Dict]], None]] = None,
+                       use_cache: bool = True) -> Tuple[List[Dict], List[Feed]]:
+        """bbox 범위의 모든 피드 조회 (병합 결과가 비어 있으면 DataError)
+        
+        Returns:
+            (병합된 레코드, 데이터를 가져온 피드)
+        """
+        cctv_data, loaded_feeds = self._fetch_feeds(self.feeds, bbox, progress, is_canceled,
+                                                    on_records, use_cache)
+        if not cctv_data:
+            raise DataError("유효한 CCTV 데이터가 없습니다.")
+        logger.info(f"{len(cctv_data)}개의 CCTV 데이터가 로드되었습니다. (피드 {len(self.feeds)}개)")
+        return cctv_data, loaded_feeds
+        
+    def _fetch_feeds(self, feeds: Sequence[Feed], bbox: Optional[BBox] = None,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     is_canceled: Optional[Callable[[], bool]] = None,
+                     on_records: Optional[Callable[[List[Dict]], None]] = None,
+                     use_cache: bool = True,
+                     cache: Optional[CatalogCache] = None) -> Tuple[List[Dict], List[Feed]]:
+        """피드들을 동시에 조회한 뒤 병합하고 피드 간 중복 CCTV 제거
+        
+        피드별로 캐시하며 (use_cache가 False이면 캐시를 건너뜀), 조회에 실패한
+        피드는 마지막 캐시 데이터로 대신합니다. on_records가 주어지면 피드마다
+        파싱한 레코드를 PARSE_BATCH개 단위로 넘깁니다 (피드 간 중복 제거 전).
+        cache가 없으면 기본 카탈로그 캐시를 사용합니다.
+        
+        Returns:
+            (병합된 레코드, 데이터를 가져온 피드 - 캐시 없이 실패한 피드 제외)
+        """
+        fractions = [0.0] * len(feeds)
+        records_lock = Lock()
+        
+        def feed_progress(i: int) -> Callable[[int, int], None]:
+            def report(done: int, total: int) -> None:
+                fractions[i] = min(done, total) / max(total, 1)
+                if progress:
+                    progress(int(sum(fractions) * 1000), len(feeds) * 1000)
+            return report
+            
+        def deliver(records: List[Dict]) -> None:
+            # 여러 피드의 작업 스레드에서 호출되므로 순서대로 전달
+            with records_lock:
+                on_records(records)
                 
-            # API 호출
-            params = self._get_api_params()
-            try:
-                response = requests.get(self.base_url, params=params)
-                response.raise_for_status()
-            except requests.exceptions.RequestException as e:
-                raise NetworkError(f"API 호출 실패: {str(e)}")
+        feed_data: List[List[Dict]] = [[] for _ in feeds]
+        failed_feeds = [False] * len(feeds)
+        errors = []
+        with ThreadPoolExecutor(max_workers=len(feeds)) as pool:
+            futures = {
+                pool.submit(self._fetch_feed, feed, bbox, is_canceled, feed_progress(i),
+                            deliver if on_records else None, use_cache, cache): i
+                for i, feed in enumerate(feeds)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                feed = feeds[i]
+                try:
+                    feed_data[i] = future.result()
+                except CanceledError:
+                    raise
+                except QcctvKorError as e:
+                    stale = self._get_cached_data(self._get_api_params(bbox, feed), True, cache)
+                    if stale is not None:
+                        logger.warning(f"{feed.source} 피드 조회 실패, 마지막 데이터를 사용합니다: {str(e)}")
+                        feed_data[i] = stale
+                    else:
+                        logger.warning(f"{feed.source} 피드 조회 실패: {str(e)}")
+                        failed_feeds[i] = True
+                        errors.append(e)
+                        
+        if progress:
+            progress(1, 1)
+        if errors and len(errors) == len(feeds):
+            raise errors[0]
+        loaded_feeds = [feed for feed, failed in zip(feeds, failed_feeds) if not failed]
+        return self._merge_feeds(feed_data), loaded_feeds
+        
+    def _fetch_feed(self, feed: Feed, bbox: Optional[BBox] = None,
+                    is_canceled: Optional[Callable[[], bool]] = None,
+                    progress: Optional[Callable[[int, int], None]] = None,
+                    on_records: Optional[Callable[[List[Dict]], None]] = None,
+                    use_cache: bool = True, cache: Optional[CatalogCache] = None) -> List[Dict]:
+        """단일 피드 조회, 파싱 및 캐시 저장 (캐시가 유효하면 캐시 사용)"""
+        params = self._get_api_params(bbox, feed)
+        if use_cache:
+            cached = self._get_cached_data(params, cache=cache)
+            if cached is not None:
+                logger.info(f"캐시된 {feed.source} 피드 데이터를 사용합니다.")
+                return cached
+                
+        # 취소/오류로 파싱이 중단되어도 응답(동시 요청 자리)을 바로 반환
+        with closing(self._stream_cctv_items(params, is_canceled, progress)) as items:
+            cctv_data = self._parse_items(items, feed.source, is_canceled, on_records)
+        self._update_cache(params, cctv_data, cache)
+        return cctv_data
+        
+    def _fetch_tiled_catalog(self, progress: Optional[Callable[[int, int], None]] = None,
+                             is_canceled: Optional[Callable[[], bool]] = None,
+                             on_records: Optional[Callable[[List[Dict]], None]] = None
+                             ) -> Tuple[List[Dict], int]:
+        """오래된 타일만 모든 피드로 병렬 조회한 뒤 전체 타일 병합
+        
+        타일은 모든 피드 조회에 성공해야 최신으로 표시됩니다. on_records가
+        주어지면 이미 있는 타일 데이터와 조회가 끝난 (타일, 피드)의 레코드를
+        도착하는 대로 넘깁니다.
+        
+        Returns:
+            (병합된 레코드, 실패한 타일 수)
+        """
+        tiles = self.tile_grid.tiles()
+        stale_tiles = self.tile_grid.stale_tiles(tiles)
+        logger.info(
+            f"전체 {len(tiles)}개 타일 중 {len(stale_tiles)}개 타일을 "
+            f"피드 {len(self.feeds)}개로 조회합니다."
+        )
+        if on_records and self._tile_data:
+            on_records(self._merge_tile_data())
+            
+        # 최신 타일의 요청은 완료된 것으로 진행률에 포함
+        fresh = (len(tiles) - len(stale_tiles)) * len(self.feeds)
+        
+        def tile_progress(done: int, total: int) -> None:
+            progress(fresh + done, fresh + total)
+            
+        if progress:
+            tile_progress(0, len(stale_tiles) * len(self.feeds))
+        failed = self._fetch_tiles(stale_tiles, tile_progress if progress else None,
+                                   is_canceled, on_records)
                 
+        cctv_data = self._merge_tile_data()
+        logger.info(
+            f"{len(cctv_data)}개의 CCTV 데이터가 로드되었습니다. "
+            f"(실패 타일: {failed}개)"
+        )
+        
+        if not cctv_data:
+            raise DataError("유효한 CCTV 데이터가 없습니다.")
+        return cctv_data, failed
+        
+    def _fetch_tiles(self, tiles: Sequence[Tile],
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     is_canceled: Optional[Callable[[], bool]] = None,
+                     on_records: Optional[Callable[[List[Dict]], None]] = None) -> int:
+        """타일들을 모든 피드로 병렬 조회하여 타일 데이터에 저장
+        
+        타일은 모든 피드 조회에 성공해야 최신으로 표시되며, progress는
+        (완료한 요청 수, 전체 요청 수)로 호출됩니다.
+        
+        Returns:
+            실패한 타일 수
+        """
+        feeds = self.feeds
+        total = len(tiles) * len(feeds)
+        done = 0
+        # 타일별 남은 피드 수와 가장 오래된 조회 시각
+        remaining = {tile: len(feeds) for tile in tiles}
+        fetched_at = {}
+        failed = set()
+        with ThreadPoolExecutor(max_workers=self.max_fetch_workers) as pool:
+            futures = {
+                pool.submit(self._fetch_tile, tile, feed, is_canceled): (tile, feed)
+                for tile in tiles
+                for feed in feeds
+            }
+            for future in as_completed(futures):
+                if is_canceled and is_canceled():
+                    # 시작하지 않은 타일 요청은 버리고 진행 중인 요청만 기다림
+                    for pending in futures:
+                        pending.cancel()
+                    raise CanceledError("카탈로그 로딩이 취소되었습니다.")
+                tile, feed = futures[future]
+                try:
+                    tile_data, tile_fetched_at = future.result()
+                    with self._tile_lock:
+                        self._tile_data[(tile, feed.source)] = tile_data
+                    fetched_at[tile] = min(fetched_at.get(tile, tile_fetched_at), tile_fetched_at)
+                    if on_records:
+                        on_records(tile_data)
+                except QcctvKorError as e:
+                    # 실패한 타일은 이전 데이터를 유지하고 다음 갱신 때 다시 조회
+                    failed.add(tile)
+                    logger.warning(f"타일 {tile} {feed.source} 피드 조회 실패: {str(e)}")
+                remaining[tile] -= 1
+                if not remaining[tile] and tile not in failed:
+                    self.tile_grid.mark_fresh(tile, fetched_at[tile])
+                done += 1
+                if progress:
+                    progress(done, total)
+        return len(failed)
+            
+    def _fetch_tile(self, tile: Tile, feed: Feed,
+                    is_canceled: Optional[Callable[[], bool]] = None) -> Tuple[List[Dict], float]:
+        """단일 타일의 피드 하나 조회 및 파싱 (영구 캐시 우선)
+        
+        Returns:
+            (타일 데이터, 조회 시각)
+        """
+        params = self._get_api_params(self.tile_grid.tile_bbox(tile), feed)
+        entry = self._cache.get_entry(CatalogCache.make_key(params))
+        if entry and time.time() - entry[1] <= self._cache_timeout:
+            return entry
+            
+        with closing(self._stream_cctv_items(params, is_canceled)) as items:
+            tile_data = self._parse_items(items, feed.source, is_canceled)
+        self._update_cache(params, tile_data)
+        return tile_data, time.time()
+        
+    def _merge_tile_data(self) -> List[Dict]:
+        """타일별 데이터를 피드마다 병합(경계 중복 제거)한 뒤 피드 간 중복 CCTV 제거"""
+        feed_data = []
+        with self._tile_lock:
+            keys = sorted(self._tile_data)
+            for feed in self.feeds:
+                merged = {}
+                for key in keys:
+                    if key[1] != feed.source:
+                        continue
+                    for cctv in self._tile_data[key]:
+                        merged.setdefault((
+                            cctv["name"],
+                            cctv["url"],
+                            round(cctv["lon"], 6),
+                            round(cctv["lat"], 6)
+                        ), cctv)
+                feed_data.append(list(merged.values()))
+        return self._merge_feeds(feed_data)
+        
+    def _merge_feeds(self, feed_data: List[List[Dict]]) -> List[Dict]:
+        """피드별 데이터를 우선순위대로 병합하고 여러 피드에 있는 CCTV 중복 제거"""
+        if len(feed_data) == 1:
+            return list(feed_data[0])
+        cctv_data, duplicates = merge_feeds(feed_data)
+        if duplicates:
+            logger.info(f"피드 간 중복 CCTV {duplicates}개를 제거했습니다.")
+        return cctv_data
+        
+    @staticmethod
+    def _merge_records(records: List[Dict], extra: List[Dict]) -> List[Dict]:
+        """records followed by the extra records it does not already contain
+        
+        피드 간 중복 제거와 같은 기준(위치 + URL/이름 유사도)으로 비교합니다.
+        """
+        if not extra:
+            return list(records)
+        return merge_feeds([records, extra])[0]
+        
+    def _pushed_records(self) -> List[Dict]:
+        """Records fetched by filter pushdowns (kept across catalog reloads)"""
+        with self._tile_lock:
+            areas = list(self._pushdown_data.values())
+        if len(areas) <= 1:
+            return list(areas[0]) if areas else []
+        return merge_feeds(areas)[0]
+        
+    def _pushdown_feeds(self, request: Pushdown) -> List[Feed]:
+        """Configured feeds of the road types a pushdown needs"""
+        return [
+            feed for feed in self.feeds
+            if request.road_types is None or feed.road_type in request.road_types
+        ]
+        
+    def _mark_covered(self, bbox: BBox, feeds: Sequence[Feed],
+                      pushdown: Optional[Pushdown] = None) -> None:
+        """Record that the catalog holds every CCTV of feeds inside bbox
+        
+        pushdown은 범위를 가져온 필터 범위 조회이며, 그 결과가 제거되면 기록도
+        함께 제거됩니다. _tile_lock을 잡은 상태에서 호출합니다.
+        """
+        entry = (tuple(bbox), frozenset(feed.source for feed in feeds), pushdown)
+        # 새 범위에 포함되는 기록은 제거
+        self._covered = [
+            covered for covered in self._covered
+            if not (bbox_contains(entry[0], covered[0]) and covered[1] <= entry[1])
+        ]
+        self._covered.append(entry)
+            
+    def _is_covered(self, request: Pushdown) -> bool:
+        """Whether a loaded area already holds what a pushdown would fetch"""
+        needed = {feed.source for feed in self._pushdown_feeds(request)}
+        with self._tile_lock:
+            return any(
+                bbox_contains(bbox, request.bbox) and needed <= sources
+                for bbox, sources, _ in self._covered
+            )
+            
+    def _region_bbox(self, region: str) -> Optional[BBox]:
+        """Box of a 시도 (행정구역 경계가 있으면 경계 범위, 없으면 기본 범위)"""
+        areas = None
+        if self.region_engine.available:
             try:
-                data = response.json()
-            except json.JSONDecodeError as e:
-                raise DataError(f"JSON 파싱 실패: {str(e)}")
+                areas = self.region_engine.areas
+            except QcctvKorError as e:
+                logger.warning(str(e))
+        return region_bbox(region, areas)
+        
+    def push_down_filter(self, filter_config: Dict) -> Optional[QgsTask]:
+        """Fetch the area and road types a filter narrows to, unless already loaded
+        
+        필터의 공간/지역 조건은 API 조회 범위(bbox)로, 도로 유형/출처 조건은
+        조회할 피드로 바꾸어 그 범위만 조회하고 (별도 캐시) 결과를 카탈로그에
+        병합합니다. 병합 후 현재 필터가 다시 평가됩니다. 로딩 중이면 로딩이
+        끝난 뒤 조회하며, 조회할 것이 없으면 None을 반환합니다.
+        """
+        if not self.api_key:
+            return None
+        request = plan_pushdown(
+            filter_config, self._region_bbox,
+            {feed.source: feed.road_type for feed in self.feeds}
+        )
+        if request is None or not self._pushdown_feeds(request) or self._is_covered(request):
+            return None
+        if self._load_task is not None:
+            self._pending_pushdown = request
+            return None
+        return self._start_pushdown(request)
+        
+    def _start_pending_pushdown(self) -> None:
+        request, self._pending_pushdown = self._pending_pushdown, None
+        if request is not None and not self._is_covered(request):
+            self._start_pushdown(request)
+            
+    def _start_pushdown(self, request: Pushdown) -> QgsTask:
+        logger.info(f"필터 범위 조회: {describe_pushdown(request)}")
+        task = self._start_load_task("CCTV 필터 범위 조회", self._run_pushdown_task, request)
+        self._running_pushdown = request
+        return task
+        
+    def _run_pushdown_task(self, task: QgsTask, request: Pushdown, generation: int) -> None:
+        """Pushdown worker: fetch the narrowed area and merge it into the catalog"""
+        feeds = self._pushdown_feeds(request)
+        try:
+            records, loaded_feeds = self._fetch_feeds(
+                feeds, request.bbox, self._task_progress(task),
+                task.isCanceled, cache=self._pushdown_cache
+            )
+        except CanceledError:
+            raise
+        except QcctvKorError as e:
+            # 조회에 실패해도 현재 카탈로그로 필터링은 계속됨 (종료는 _on_load_task_finished에서 알림)
+            logger.warning(f"필터 범위 조회 실패: {str(e)}")
+            return
+            
+        if task.isCanceled():
+            raise CanceledError("필터 범위 조회가 취소되었습니다.")
+        with self._tile_lock:
+            self._pushdown_data[request] = records
+            self._pushdown_data.move_to_end(request)
+            while len(self._pushdown_data) > MAX_PUSHDOWN_AREAS:
+                evicted, _ = self._pushdown_data.popitem(last=False)
+                # 결과가 없어진 범위는 다시 조회할 수 있도록 기록도 제거
+                self._covered = [covered for covered in self._covered if covered[2] != evicted]
+            if loaded_feeds:
+                self._mark_covered(request.bbox, loaded_feeds, request)
+        
+        base = self.catalog
+        merged = self._merge_records(base.rows().to_records(), records)
+        if len(merged) == len(base):
+            logger.info(f"필터 범위 조회: 새 CCTV가 없습니다. ({len(records)}개 조회)")
+            return
+        logger.info(f"필터 범위 조회로 CCTV {len(merged) - len(base)}개를 추가합니다. ({len(records)}개 조회)")
+        self._deliver_catalog(generation, merged, base, final=True)
+        
+    def load_viewport(self, bbox: BBox) -> Optional[QgsTask]:
+        """Load the tiles of a map view (WGS84 bbox) that are missing or stale
+        
+        화면과 겹치는 타일 중 메모리에 없거나 오래된 타일만 조회하여 (영구 캐시
+        우선) 타일 데이터에 더하고, 레코드 수가 viewport_budget을 넘으면 화면에서
+        먼 타일부터 카탈로그와 레이어에서 제거합니다. 실행 중인 이전 로딩은
+        취소되며 (필터 범위 조회는 이 로딩이 끝난 뒤 다시 실행), 조회할 타일이
+        없으면 None을 반환합니다.
+        """
+        if not self.api_key:
+            raise ConfigError("API 키가 설정되지 않았습니다. '플러그인 > QcctvKor > ITS API 키 설정' 메뉴에서 API 키를 설정해주세요.")
+            
+        tiles = self.tile_grid.tiles_for_bbox(bbox)
+        if not tiles:
+            return None
+        stale = self.tile_grid.stale_tiles(tiles)
+        # 취소될 로딩이 있으면 그 사이 받은 타일을 반영하도록 다시 구성
+        if not stale and self._load_task is None:
+            return None
+        return self._start_load_task("CCTV 화면 범위 로딩", self._run_viewport_task,
+                                     tuple(stale), tuple(bbox))
+        
+    def _run_viewport_task(self, task: QgsTask, tiles: Tuple[Tile, ...], bbox: BBox,
+                           generation: int) -> None:
+        """Viewport worker: fetch tiles, evict far tiles over budget and rebuild the catalog"""
+        base = self.catalog
+        stream = None
+        if not len(base):
+            stream = RecordChunker(
+                lambda index, records: self._records_arrived.emit(generation, index, records)
+            )
+            
+        failed = 0
+        if tiles:
+            logger.info(f"화면 범위 타일 {len(tiles)}개를 피드 {len(self.feeds)}개로 조회합니다.")
+            failed = self._fetch_tiles(tiles, self._task_progress(task), task.isCanceled,
+                                       stream.add if stream else None)
+        if task.isCanceled():
+            raise CanceledError("카탈로그 로딩이 취소되었습니다.")
+            
+        evicted = self._evict_tiles(bbox)
+        if stream:
+            stream.flush()
+        records = self._merge_records(self._merge_tile_data(), self._pushed_records())
+        logger.info(
+            f"화면 범위 로딩: CCTV {len(records)}개 "
+            f"(실패 타일: {failed}개, 제거한 타일: {evicted}개)"
+        )
+        self._deliver_catalog(generation, records, base, final=True,
+                              streamed=stream.records if stream else None)
+        
+    def _evict_tiles(self, bbox: BBox) -> int:
+        """Drop the tiles farthest from the view while the tile data is over budget
+        
+        화면과 겹치는 타일은 제거하지 않습니다. 제거한 타일은 영구 캐시에 남아
+        있으므로 다시 화면에 들어오면 캐시에서 읽습니다.
+        
+        Returns:
+            제거한 타일 수
+        """
+        view_tiles = set(self.tile_grid.tiles_for_bbox(bbox))
+        center_x = (bbox[0] + bbox[2]) / 2
+        center_y = (bbox[1] + bbox[3]) / 2
+        scale_x = np.cos(np.radians(center_y))
+        
+        def distance(tile: Tile) -> float:
+            min_x, min_y, max_x, max_y = self.tile_grid.tile_bbox(tile)
+            return np.hypot(((min_x + max_x) / 2 - center_x) * scale_x,
+                            (min_y + max_y) / 2 - center_y)
+            
+        evicted = []
+        with self._tile_lock:
+            sizes: Dict[Tile, int] = {}
+            for (tile, _), tile_data in self._tile_data.items():
+                sizes[tile] = sizes.get(tile, 0) + len(tile_data)
+            total = sum(sizes.values())
+            if total <= self.viewport_budget:
+                return 0
                 
-            if "response" not in data or "data" not in data["response"]:
-                raise ApiError("잘못된 API 응답 형식")
+            far_tiles = sorted((tile for tile in sizes if tile not in view_tiles),
+                               key=distance, reverse=True)
+            for tile in far_tiles:
+                if total <= self.viewport_budget:
+                    break
+                total -= sizes[tile]
+                evicted.append(tile)
+            evicted_set = set(evicted)
+            for key in [key for key in self._tile_data if key[0] in evicted_set]:
+                del self._tile_data[key]
                 
-            # 데이터 파싱
-            self.cctv_data = []
-            total_items = len(data["response"]["data"])
-            logger.info(f"총 {total_items}개의 CCTV 데이터를 로드합니다.")
+        for tile in evicted:
+            self.tile_grid.invalidate(tile)
+        if evicted:
+            logger.info(f"메모리 예산({self.viewport_budget}개) 초과로 화면 밖 타일 {len(evicted)}개를 제거했습니다.")
+        return len(evicted)
+        
+    def _stream_cctv_items(self, params: Dict,
+                           is_canceled: Optional[Callable[[], bool]] = None,
+                           progress: Optional[Callable[[int, int], None]] = None) -> Iterator[Dict]:
+        """ITS API 호출 후 응답을 받는 대로 파싱하여 CCTV 항목을 하나씩 반환
+        
+        본문 전체를 메모리에 올리지 않으며, progress(읽은 바이트, 전체 바이트)는
+        응답에 Content-Length가 있을 때만 호출됩니다. 제너레이터를 닫으면
+        (끝까지 읽지 않았더라도) 응답도 닫힙니다.
+        """
+        response = self.http.get(self.base_url, params, stream=True, is_canceled=is_canceled)
+        try:
+            try:
+                total = int(response.headers.get("Content-Length") or 0)
+            except ValueError:
+                total = 0
+            parser = JsonArrayStream(ITEMS_PATH)
+            for chunk in self.http.iter_chunks(response, is_canceled=is_canceled):
+                yield from parser.feed(chunk)
+                if progress and total:
+                    progress(self.http.bytes_read(response), total)
+            parser.close()
+        finally:
+            response.close()
             
-            for i, cctv in enumerate(data["response"]["data"]):
-                try:
-                    self.cctv_data.append(self._parse_cctv_data(cctv))
-                    self.loading_progress.emit(i + 1, total_items)
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"잘못된 CCTV 데이터 무시: {str(e)}")
-                    continue
-                    
-            # 캐시 업데이트
-            self._update_cache(self.cctv_data)
-            logger.info(f"{len(self.cctv_data)}개의 CCTV 데이터가 로드되었습니다.")
+        if not parser.found:
+            raise ApiError("잘못된 API 응답 형식")
             
-            if not self.cctv_data:
-                raise DataError("유효한 CCTV 데이터가 없습니다.")
+    def _parse_items(self, items: Iterable[Dict], source: str = DEFAULT_SOURCE,
+                     is_canceled: Optional[Callable[[], bool]] = None,
+                     on_records: Optional[Callable[[List[Dict]], None]] = None) -> List[Dict]:
+        """Parse API items of one feed into records (invalid items are counted, not logged one by one)"""
+        cctv_data = []
+        streamed = 0
+        invalid = 0
+        for i, cctv in enumerate(items):
+            if i and i % PARSE_BATCH == 0:
+                if is_canceled and is_canceled():
+                    raise CanceledError("카탈로그 로딩이 취소되었습니다.")
+                if on_records:
+                    on_records(cctv_data[streamed:])
+                    streamed = len(cctv_data)
+            try:
+                cctv_data.append(self._parse_cctv_data(cctv, source))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                invalid += 1
                 
-            self.data_loaded.emit(True)
+        if on_records and streamed < len(cctv_data):
+            on_records(cctv_data[streamed:])
+        if invalid:
+            logger.warning(f"잘못된 CCTV 데이터 {invalid}개를 건너뛰었습니다.")
+        return cctv_data
             
-        except Exception as e:
-            logger.error(Logger.format_error(e, "데이터 로딩 실패"))
-            self.data_loaded.emit(False)
-            raise handle_exception(e)
-            
-    @lru_cache(maxsize=100)
     def get_cctv_info(self, feature_id: int) -> Dict:
-        """캐시된 CCTV 정보 조회"""
+        """피처 ID로 CCTV 정보 조회 (레이어와 함께 갱신되는 색인 사용)"""
         if not self.layer:
             raise Exception("Layer not initialized")
             
-        feature = next(self.layer.getFeatures(f"$id = {feature_id}"), None)
-        if not feature:
+        cctv = self._records_by_fid.get(feature_id)
+        if cctv is None:
             raise Exception(f"Feature {feature_id} not found")
             
-        return {
-            "name": feature["name"],
-            "url": feature["url"],
-            "geometry": feature.geometry().asPoint()
-        }
+        info = dict(cctv)
+        info["geometry"] = QgsPointXY(cctv["lon"], cctv["lat"])
+        return info
         
-    def _get_cached_data(self) -> Optional[List[Dict]]:
-        """캐시된 데이터 조회"""
-        if not self._cache:
+    def find_nearest_cctv(self, point: QgsPointXY, tolerance: float) -> Optional[Dict]:
+        """Find the nearest visible CCTV within tolerance (layer CRS units)"""
+        if not self.layer or not self._records_by_fid:
             return None
             
-        cache_time = self._cache.get("timestamp", 0)
-        if time.time() - cache_time > self._cache_timeout:
+        # 허용 범위 안의 후보를 모두 구한 뒤 가려진 피처를 빼고 가장 가까운 것 선택
+        # (최근접 N개만 보면 필터가 걸린 밀집 지역에서 모두 숨겨져 있을 수 있음)
+        search_rect = QgsRectangle(point.x() - tolerance, point.y() - tolerance,
+                                   point.x() + tolerance, point.y() + tolerance)
+        candidates = self._spatial_index.intersects(search_rect)
+        if not candidates:
             return None
             
-        return self._cache.get("data")
+        # 현재 필터(subset string)로 숨겨진 피처는 제외
+        if self.layer.subsetString():
+            request = QgsFeatureRequest().setFilterFids(candidates)
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+            request.setNoAttributes()
+            visible = {feature.id() for feature in self.layer.getFeatures(request)}
+            candidates = [fid for fid in candidates if fid in visible]
+            
+        max_sqr_dist = tolerance * tolerance
+        nearest_fid = None
+        nearest_sqr_dist = None
+        for fid in candidates:
+            cctv = self._records_by_fid.get(fid)
+            if cctv is None:
+                continue
+            sqr_dist = point.sqrDist(QgsPointXY(cctv["lon"], cctv["lat"]))
+            if sqr_dist <= max_sqr_dist and (nearest_sqr_dist is None or sqr_dist < nearest_sqr_dist):
+                nearest_fid = fid
+                nearest_sqr_dist = sqr_dist
+                
+        if nearest_fid is None:
+            return None
+        return self.get_cctv_info(nearest_fid)
         
-    def _update_cache(self, data: List[Dict]) -> None:
-        """캐시 업데이트"""
-        self._cache = {
-            "timestamp": time.time(),
-            "data": data
-        }
+    def _get_cached_data(self, params: Dict, allow_stale: bool = False,
+                         cache: Optional[CatalogCache] = None) -> Optional[List[Dict]]:
+        """영구 캐시에서 요청 파라미터에 해당하는 데이터 조회"""
+        return (cache or self._cache).get(CatalogCache.make_key(params), allow_stale)
+        
+    def _update_cache(self, params: Dict, data: List[Dict],
+                      cache: Optional[CatalogCache] = None) -> None:
+        """영구 캐시 업데이트 (실패해도 로딩은 계속 진행)"""
+        try:
+            (cache or self._cache).put(CatalogCache.make_key(params), data)
+        except DataError as e:
+            logger.warning(str(e))
+            
+    def invalidate_cache(self) -> None:
+        """영구 캐시, 타일 갱신 시각과 필터 범위 조회 기록 초기화"""
+        self._cache.invalidate()
+        self._pushdown_cache.invalidate()
+        self.tile_grid.invalidate()
+        with self._tile_lock:
+            self._covered = []
+        
+    def _get_api_params(self, bbox: Optional[BBox] = None, feed: Optional[Feed] = None) -> Dict:
+        """API 파라미터 생성
         
-    def _get_api_params(self) -> Dict:
-        """API 파라미터 생성"""
+        bbox가 없으면 기존 수도권 범위를, feed가 없으면 첫 번째 피드를 사용합니다.
+        """
+        min_x, min_y, max_x, max_y = bbox or DEFAULT_BBOX
+        feed = feed or self.feeds[0]
         return {
             "key": self.api_key,
-            "type": "json",
-            "cctvType": "1",
-            "minX": "126.5",
-            "maxX": "127.5",
-            "minY": "37.0",
-            "maxY": "38.0",
+            "type": feed.road_type,
+            "cctvType": feed.cctv_type,
+            "minX": str(min_x),
+            "maxX": str(max_x),
+            "minY": str(min_y),
+            "maxY": str(max_y),
             "getType": "json"
         }
         
-    def _parse_cctv_data(self, cctv: Dict) -> Dict:
-        """CCTV 데이터 파싱"""
+    def _parse_cctv_data(self, cctv: Dict, source: str = DEFAULT_SOURCE) -> Dict:
+        """CCTV 데이터 파싱 (source: 피드 출처 태그)"""
+        name = cctv.get("cctvName", "Unknown")
         return {
-            "name": cctv.get("cctvName", "Unknown"),
+            "name": name,
             "url": cctv.get("cctvUrl", ""),
             "lat": float(cctv.get("coordY", 0)),
-            "lon": float(cctv.get("coordX", 0))
+            "lon": float(cctv.get("coordX", 0)),
+            # 지역/도로 유형은 파싱 시 한 번만 분류
+            "region": classify_region(name),
+            "road_type": classify_road_type(name),
+            "source": source
         }
     
     def _load_sample_data(self) -> None:
@@ -201,7 +1215,11 @@ class CctvModel(QObject):
             provider = self.layer.dataProvider()
             provider.addAttributes([
                 QgsField("name", QVariant.String),
-                QgsField("url", QVariant.String)
+                QgsField("url", QVariant.String),
+                QgsField("region", QVariant.String),
+                QgsField("district", QVariant.String),
+                QgsField("road_type", QVariant.String),
+                QgsField("source", QVariant.String)
             ])
             self.layer.updateFields()
             
@@ -209,6 +1227,8 @@ class CctvModel(QObject):
             self._set_layer_style()
             self._setup_labels()
             
+            self._reset_feature_index()
+            
             # Add to project
             QgsProject.instance().addMapLayer(self.layer)
             logger.info("임시 레이어가 생성되었습니다.")
@@ -270,68 +1290,269 @@ class CctvModel(QObject):
         if not self.layer:
             raise Exception("Layer not initialized")
             
-        feature = QgsFeature()
-        point = QgsPointXY(lon, lat)
-        feature.setGeometry(QgsGeometry.fromPointXY(point))
-        feature.setAttributes([name, url])
+        self.add_cctv_features([{"name": name, "url": url, "lat": lat, "lon": lon}])
         
-        self.layer.dataProvider().addFeature(feature)
+    def add_cctv_features(self, records: List[Dict]) -> None:
+        """Add many CCTV features with a single insert, extent update and repaint"""
+        if not self.layer:
+            raise Exception("Layer not initialized")
+            
+        self._add_layer_records(records)
         self.layer.updateExtents()
         self.layer.triggerRepaint()
+        
+    def _build_feature(self, cctv: Dict) -> QgsFeature:
+        """Build a layer feature from a CCTV record"""
+        feature = QgsFeature()
+        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(cctv["lon"], cctv["lat"])))
+        # 점진 표시한 레코드와 카탈로그 행이 같은 속성이 되도록 저장소와 같은 기본값 사용
+        categories = record_categories(cctv)
+        feature.setAttributes([
+            cctv["name"],
+            cctv["url"],
+            categories["region"],
+            categories["district"],
+            categories["road_type"],
+            categories["source"]
+        ])
+        return feature
+        
+    def _add_layer_records(self, records: List[Dict]) -> None:
+        """Insert records with one addFeatures call and register their feature ids
+        
+        피처 색인은 CCTV 키(이름 + 위치)별로 피처 하나를 가리키므로, 이미 레이어에
+        있거나 같은 묶음에서 키가 겹치는 레코드(URL만 다른 같은 CCTV 등)는 제외합니다.
+        """
+        unique = {}
+        for cctv in records:
+            key = record_key(cctv)
+            if key not in self._layer_fids:
+                unique.setdefault(key, cctv)
+        duplicates = len(records) - len(unique)
+        if duplicates:
+            logger.info(f"키가 중복된 CCTV {duplicates}개는 레이어에 한 번만 추가합니다.")
+        records = list(unique.values())
+        if not records:
+            return
+            
+        features = [self._build_feature(cctv) for cctv in records]
+        ok, added = self.layer.dataProvider().addFeatures(features)
+        if not ok:
+            raise LayerError("피처 추가 실패")
+            
+        for cctv, feature in zip(records, added):
+            self._register_feature(feature.id(), cctv)
+            
+    def _reset_feature_index(self) -> None:
+        """Clear feature id and spatial indexes (layer created or removed)"""
+        self._layer_fids = {}
+        self._records_by_fid = {}
+        self._spatial_index = QgsSpatialIndex()
+        self._layer_revision += 1
+        self._stream_generation = None
+        
+    def _register_feature(self, fid: int, cctv: Dict) -> None:
+        """Add a layer feature to the id and spatial indexes"""
+        self._layer_revision += 1
+        self._layer_fids[record_key(cctv)] = fid
+        self._records_by_fid[fid] = cctv
+        point = QgsPointXY(cctv["lon"], cctv["lat"])
+        self._spatial_index.addFeature(fid, QgsRectangle(point, point))
+        
+    def _unregister_feature(self, cctv: Dict) -> Optional[int]:
+        """Remove a layer feature from the indexes and return its id"""
+        fid = self._layer_fids.pop(record_key(cctv), None)
+        if fid is None:
+            return None
+        self._layer_revision += 1
+            
+        indexed = self._records_by_fid.pop(fid)
+        feature = QgsFeature(fid)
+        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(indexed["lon"], indexed["lat"])))
+        self._spatial_index.deleteFeature(feature)
+        return fid
     
     def remove_temp_layer(self) -> None:
         """Remove temporary CCTV layer"""
         if self.layer:
             QgsProject.instance().removeMapLayer(self.layer.id())
             self.layer = None
+        self._reset_feature_index()
     
     def filter_cctv_data(self, region: str = None, road_type: str = None) -> None:
         """Filter CCTV data based on region and road type"""
-        self.filtered_data = self.cctv_data.copy()
+        # 레이어는 그대로 두고 표시 조건만 변경
+        self.apply_filter({"region": region, "road_type": road_type})
         
-        if region:
-            self.filtered_data = [
-                cctv for cctv in self.filtered_data
-                if region.lower() in cctv["name"].lower()
-            ]
+    def _evaluate_filter(self, filter_config: Dict) -> np.ndarray:
+        """Evaluate a filter (single or nested AND/OR/NOT group) to catalog row indices"""
+        return self.filter_engine.evaluate(filter_config, self.catalog, self._search_index())
+        
+    def _category_columns(self, catalog: Optional[CatalogStore] = None) -> List[Tuple[str, object]]:
+        """Filterable category columns of a catalog (default: the current one)"""
+        if catalog is None:
+            catalog = self.catalog
+        return [
+            ("region", catalog.regions),
+            ("district", catalog.districts),
+            ("road_type", catalog.road_types),
+            ("source", catalog.sources)
+        ]
+        
+    def _search_index(self) -> NgramSearchIndex:
+        """Search index of the current catalog (rebuilt if the catalog changed)"""
+        index = self.search_index
+        if index.version != self.catalog.version:
+            index = NgramSearchIndex(self.catalog)
+            self.search_index = index
+        return index
+        
+    def _layer_subset(self, filter_config: Dict, rows: RowsView,
+                      catalog: Optional[CatalogStore] = None) -> str:
+        """Build a layer subset expression equivalent to the filter (rows: its result in catalog)"""
+        if (is_group(filter_config) or filter_config.get("negate")
+                or any(filter_config.get(key) for key in SPATIAL_KEYS)):
+            # 조합/공간 필터는 평가 결과 피처 ID로 제한
+            return self._fid_subset(rows)
             
-        if road_type:
-            self.filtered_data = [
-                cctv for cctv in self.filtered_data
-                if road_type.lower() in cctv["name"].lower()
-            ]
+        clauses = []
+        for key, index in self._category_columns(catalog):
+            value = filter_config.get(key)
+            if not value or value == "전체":
+                continue
+            if value in index:
+                clauses.append(f"\"{key}\" = {QgsExpression.quotedString(value)}")
+            else:
+                clauses.append(self._name_clause(value))
+                
+        keyword = filter_config.get("keyword")
+        if keyword:
+            if has_choseong(keyword):
+                # 초성 검색은 식으로 표현할 수 없으므로 결과 피처 ID로 제한
+                return self._fid_subset(rows)
+            clauses.append(self._name_clause(keyword))
+        return " AND ".join(clauses)
+        
+    @staticmethod
+    def _name_clause(value: str) -> str:
+        """Case-insensitive substring test on the name field"""
+        return f"strpos(lower(\"name\"), {QgsExpression.quotedString(value.lower())}) > 0"
+        
+    def _fid_subset(self, records) -> str:
+        """Subset expression selecting the features of the given records"""
+        # 작업 스레드에서도 호출되므로 조회 한 번으로 처리
+        fids = sorted({
+            fid for fid in map(self._layer_fids.get, map(record_key, records))
+            if fid is not None
+        })
+        return f"$id IN ({', '.join(map(str, fids))})" if fids else "FALSE"
+        
+    def _set_layer_subset(self, expression: str) -> None:
+        """Show only matching features of the fully populated layer"""
+        if not self.layer:
+            return
             
-        # 필터링된 데이터로 레이어 업데이트
-        self.update_layer_features()
+        if self.layer.subsetString() == expression:
+            return
+            
+        if not self.layer.setSubsetString(expression):
+            raise LayerError(f"레이어 필터 설정 실패: {expression}")
+        self.layer.triggerRepaint()
         
-    def update_layer_features(self) -> None:
-        """Update layer with filtered features"""
+    def update_layer_features(self, diff: Optional[Dict] = None) -> None:
+        """Synchronize the layer with the catalog
+        
+        레이어에는 항상 전체 카탈로그가 들어 있고 필터는 subset string으로
+        적용됩니다. 표시 중인 피처와 카탈로그의 변경분만 반영하며,
+        diff가 주어지면 재계산 없이 그대로 적용합니다.
+        """
         if not self.layer:
             return
             
-        # 기존 피처 모두 제거
-        self.layer.dataProvider().deleteFeatures(
-            [f.id() for f in self.layer.getFeatures()]
-        )
+        if diff is None:
+            diff = diff_catalog(self._records_by_fid.values(), self.cctv_data)
+            
+        if not is_empty_diff(diff):
+            self.apply_layer_diff(diff)
+        self._rebind_layer_records()
         
-        # 필터링된 데이터로 피처 추가
-        for cctv in (self.filtered_data or self.cctv_data):
-            self.add_cctv_feature(
-                cctv["name"],
-                cctv["url"],
-                cctv["lat"],
-                cctv["lon"]
-            )
+    def _rebind_layer_records(self) -> None:
+        """Point feature records at rows of the current catalog store
+        
+        이전 카탈로그 저장소를 참조하는 레코드가 남지 않도록 합니다.
+        """
+        key_index = self.catalog.key_index()
+        for key, fid in self._layer_fids.items():
+            index = key_index.get(key)
+            if index is not None:
+                self._records_by_fid[fid] = self.catalog.row(index)
+        
+    def apply_layer_diff(self, diff: Dict) -> None:
+        """Apply a catalog diff to the layer's data provider in one batch"""
+        if not self.layer:
+            return
+            
+        provider = self.layer.dataProvider()
+        
+        # 삭제
+        removed_fids = []
+        for cctv in diff.get("removed", []):
+            fid = self._unregister_feature(cctv)
+            if fid is not None:
+                removed_fids.append(fid)
+        if removed_fids and not provider.deleteFeatures(removed_fids):
+            raise LayerError("피처 삭제 실패")
             
-    def search_cctv(self, keyword: str) -> List[Dict]:
-        """Search CCTV by name"""
+        # 이동 / 이름 변경 / URL 변경
+        geometry_changes = {}
+        attribute_changes = {}
+        for change in ("moved", "renamed", "url_changed", "reclassified"):
+            for old_cctv, new_cctv in diff.get(change, []):
+                fid = self._unregister_feature(old_cctv)
+                if fid is None:
+                    continue
+                    
+                if change == "moved":
+                    geometry_changes[fid] = QgsGeometry.fromPointXY(
+                        QgsPointXY(new_cctv["lon"], new_cctv["lat"])
+                    )
+                # 위치가 바뀌면 시도/시군구도 바뀔 수 있으므로 속성 전체 갱신
+                attribute_changes[fid] = dict(enumerate(
+                    self._build_feature(new_cctv).attributes()
+                ))
+                    
+                self._register_feature(fid, new_cctv)
+                
+        if geometry_changes and not provider.changeGeometryValues(geometry_changes):
+            raise LayerError("피처 위치 변경 실패")
+        if attribute_changes and not provider.changeAttributeValues(attribute_changes):
+            raise LayerError("피처 속성 변경 실패")
+            
+        # 추가 (이미 표시 중인 CCTV는 제외)
+        self._add_layer_records([
+            cctv for cctv in diff.get("added", [])
+            if record_key(cctv) not in self._layer_fids
+        ])
+        
+        self.layer.updateExtents()
+        self.layer.triggerRepaint()
+        logger.info(f"레이어 갱신: {summarize_diff(diff)}")
+            
+    def search_cctv(self, keyword: str, previous: Optional[RowsView] = None,
+                    is_canceled: Optional[Callable[[], bool]] = None) -> RowsView:
+        """Search CCTV by name
+        
+        previous가 같은 카탈로그에 대한 이전 검색 결과이고 keyword가 이전
+        검색어를 포함하면 그 결과 안에서만 검색합니다. 스레드에서 호출 가능합니다.
+        """
         if not keyword:
             return self.cctv_data
             
-        return [
-            cctv for cctv in self.cctv_data
-            if keyword.lower() in cctv["name"].lower()
-        ] 
+        index = self._search_index()
+        within = None
+        if previous is not None and previous.store is index.store:
+            within = previous.indices
+        return index.store.rows(index.search(keyword, within, is_canceled))
     
     def save_filtered_results(self, file_path: str) -> None:
         """Save filtered CCTV data to CSV file"""
@@ -339,7 +1560,7 @@ class CctvModel(QObject):
             data_to_save = self.filtered_data if self.filtered_data else self.cctv_data
             
             with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['name', 'url', 'lat', 'lon'])
+                writer = csv.DictWriter(f, fieldnames=list(CatalogStore.FIELDS))
                 writer.writeheader()
                 writer.writerows(data_to_save)
                 
@@ -351,18 +1572,29 @@ class CctvModel(QObject):
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
-                self.filtered_data = []
-                
-                for row in reader:
-                    self.filtered_data.append({
+                self.filtered_data = [
+                    {
                         'name': row['name'],
                         'url': row['url'],
                         'lat': float(row['lat']),
-                        'lon': float(row['lon'])
-                    })
+                        'lon': float(row['lon']),
+                        'region': row.get('region'),
+                        'district': row.get('district'),
+                        'source': row.get('source'),
+                        'road_type': row.get('road_type')
+                    }
+                    for row in reader
+                ]
                     
-            # Update layer with loaded data
-            self.update_layer_features()
+            if not self.layer:
+                return
+                
+            # 불러온 CCTV 중 레이어에 없는 것만 추가하고 해당 피처만 표시
+            self._add_layer_records([
+                cctv for cctv in self.filtered_data
+                if record_key(cctv) not in self._layer_fids
+            ])
+            self._set_layer_subset(self._fid_subset(self.filtered_data))
             
         except Exception as e:
             raise Exception(f"Failed to load results: {str(e)}")
@@ -397,106 +1629,248 @@ class CctvModel(QObject):
         """Generate report of CCTV data"""
         try:
             data_to_report = self.filtered_data if self.filtered_data else self.cctv_data
+            stats = self.get_filter_stats()
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write("QcctvKor CCTV 데이터 보고서\n")
-                f.write(f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                f.write(f"총 CCTV 수: {len(data_to_report)}\n")
-                
-                # 지역별 통계
-                regions = {}
-                for cctv in data_to_report:
-                    region = cctv['name'].split()[0]  # 첫 번째 단어를 지역으로 가정
-                    regions[region] = regions.get(region, 0) + 1
-                    
-                f.write("\n지역별 CCTV 수:\n")
-                for region, count in regions.items():
-                    f.write(f"- {region}: {count}대\n")
-                    
-                # CCTV 목록
-                f.write("\nCCTV 목록:\n")
-                for cctv in data_to_report:
-                    f.write(f"- {cctv['name']} (위도: {cctv['lat']}, 경도: {cctv['lon']})\n")
+            # 통계 부분은 한 번에 만들고 목록은 청크 단위 문자열로 기록
+            sections = [
+                "QcctvKor CCTV 데이터 보고서",
+                f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "",
+                f"총 CCTV 수: {stats['total']}"
+            ]
+            for title, key in (("지역별 CCTV 수", "regions"),
+                               ("시군구별 CCTV 수", "districts"),
+                               ("도로 유형별 CCTV 수", "road_types"),
+                               ("출처별 CCTV 수", "sources")):
+                if stats[key]:
+                    sections += ["", f"{title}:"]
+                    sections += [f"- {label}: {count}대" for label, count in stats[key].items()]
                     
+            if stats["cells"]:
+                sections += ["", f"CCTV 밀집 격자 (상위 {len(stats['cells'])}개):"]
+                sections += [
+                    f"- 경도 {lon:g}, 위도 {lat:g}: {count}대"
+                    for (lon, lat), count in stats["cells"]
+                ]
+            sections += ["", "CCTV 목록:", ""]
+            
+            with open(file_path, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                f.write("\n".join(sections))
+                f.writelines(iter_report_lines(data_to_report.store, data_to_report.indices))
+                
         except Exception as e:
             raise Exception(f"Failed to generate report: {str(e)}")
             
-    def apply_filter(self, filter_config: Dict) -> None:
-        """Apply filter configuration"""
-        try:
-            self.current_filter = filter_config
-            region = filter_config.get("region")
-            road_type = filter_config.get("road_type")
-            keyword = filter_config.get("keyword")
+    def prepare_filter(self, filter_config: Dict,
+                       is_canceled: Optional[Callable[[], bool]] = None,
+                       progress: Optional[Callable[[int, int], None]] = None) -> PreparedFilter:
+        """Evaluate a filter and its layer subset expression without touching the layer
+        
+        스레드에서 호출 가능합니다. 결과는 commit_filter()로 GUI 스레드에서 반영합니다.
+        """
+        layer_revision = self._layer_revision
+        # 평가 중 새 카탈로그가 설치되어도 같은 카탈로그의 색인/분류만 사용
+        catalog = self.catalog
+        search_index = self.search_index
+        if search_index.store is not catalog:
+            search_index = None  # 필터 엔진이 catalog의 색인을 만듦
+        indices = self.filter_engine.evaluate(
+            filter_config, catalog, search_index, is_canceled, progress
+        )
+        rows = catalog.rows(indices)
+        return PreparedFilter(
+            filter_config, rows, self._layer_subset(filter_config, rows, catalog), layer_revision
+        )
+        
+    def commit_filter(self, prepared: PreparedFilter) -> None:
+        """Make a prepared filter current and set the layer subset (GUI thread)"""
+        if (prepared.rows.store is not self.catalog
+                or prepared.layer_revision != self._layer_revision):
+            # 평가 중에 카탈로그나 레이어가 바뀌었으면 다시 평가 (대개 캐시 적중)
+            prepared = self.prepare_filter(prepared.filter_config)
             
-            # 필터링 적용
-            self.filtered_data = self.cctv_data.copy()
+        self.current_filter = prepared.filter_config
+        # 필터링 적용 (레코드 복사 없이 인덱스 배열로 표현)
+        self._filtered = prepared.rows
+        # 레이어 표시 조건 변경 (피처 재생성 없음)
+        self._set_layer_subset(prepared.subset)
+        logger.info(
+            f"필터 적용됨 {self.filter_engine.explain(prepared.filter_config)} "
+            f"- {len(prepared.rows)}개 결과"
+        )
             
-            if region and region != "전체":
-                self.filtered_data = [
-                    cctv for cctv in self.filtered_data
-                    if region.lower() in cctv["name"].lower()
-                ]
-                
-            if road_type and road_type != "전체":
-                self.filtered_data = [
-                    cctv for cctv in self.filtered_data
-                    if road_type.lower() in cctv["name"].lower()
-                ]
-                
-            if keyword:
-                self.filtered_data = [
-                    cctv for cctv in self.filtered_data
-                    if keyword.lower() in cctv["name"].lower()
-                ]
-                
-            # 레이어 업데이트
-            self.update_layer_features()
-            logger.info(
-                f"필터 적용됨 (지역: {region}, 도로: {road_type}, "
-                f"키워드: {keyword}) - {len(self.filtered_data)}개 결과"
-            )
+    def apply_filter(self, filter_config: Dict) -> None:
+        """Apply filter configuration (single filter or nested AND/OR/NOT group)"""
+        try:
+            self.commit_filter(self.prepare_filter(filter_config))
             
         except Exception as e:
             logger.error(Logger.format_error(e, "필터 적용 실패"))
             raise handle_exception(e)
+        # 카탈로그에 없는 범위를 좁혀 조회 (병합 후 다시 평가)
+        self.push_down_filter(filter_config)
+            
+    def apply_filter_async(self, filter_config: Dict) -> QgsTask:
+        """Evaluate a filter in a background task and apply only the latest result
+        
+        실행 중인 이전 필터 작업은 취소됩니다. 평가와 피처 ID 조건 생성은 작업
+        스레드에서, 레이어 표시 조건 변경은 GUI 스레드에서 수행하며 진행률은
+        filter_progress, 완료는 filter_finished로 알립니다. 작업 관리자에서
+        취소된 작업은 filter_canceled로 알립니다.
+        """
+        self.cancel_filter_task()
+        generation = self._filter_generation
+        
+        task = QgsTask.fromFunction(
+            "CCTV 필터",
+            self._run_filter_task,
+            filter_config,
+            on_finished=lambda exception, result=None: self._on_filter_task_finished(
+                generation, exception, result),
+            flags=QgsTask.CanCancel | QgsTask.Silent
+        )
+        task.progressChanged.connect(
+            lambda value: self._on_filter_task_progress(generation, value)
+        )
+        self._filter_task = task
+        QgsApplication.taskManager().addTask(task)
+        # 카탈로그에 없는 범위를 좁혀 조회 (병합 후 다시 평가)
+        self.push_down_filter(filter_config)
+        return task
+        
+    def cancel_filter_task(self) -> None:
+        """Cancel the running background filter (its result is discarded)"""
+        self._filter_generation += 1
+        if self._filter_task is not None:
+            self._filter_task.cancel()
+            self._filter_task = None
+            
+    def _run_filter_task(self, task: QgsTask, filter_config: Dict) -> PreparedFilter:
+        """Filter worker (runs off the GUI thread)"""
+        return self.prepare_filter(
+            filter_config,
+            task.isCanceled,
+            lambda done, total: task.setProgress(100.0 * done / max(total, 1))
+        )
+        
+    def _on_filter_task_progress(self, generation: int, value: float) -> None:
+        if generation == self._filter_generation:
+            self.filter_progress.emit(int(value))
             
+    def _on_filter_task_finished(self, generation: int, exception, result) -> None:
+        """Apply the task's result unless a newer filter request superseded it"""
+        if generation != self._filter_generation:
+            return
+        self._filter_task = None
+        
+        if exception is None and result is not None:
+            try:
+                self.commit_filter(result)
+                self.filter_finished.emit(True)
+                return
+            except Exception as e:
+                exception = e
+                
+        if isinstance(exception, CanceledError) or str(exception) == "Task canceled":
+            # 실패가 아니므로 경고 없이 진행 표시만 정리하도록 별도 시그널로 알림
+            logger.info("필터 작업이 취소되었습니다.")
+            self.filter_canceled.emit()
+            return
+        logger.error(Logger.format_error(exception, "필터 적용 실패"))
+        self.filter_finished.emit(False)
+            
+    def apply_query(self, query: str, background: bool = False) -> Dict:
+        """Parse a filter query (예: region:서울 AND name~"IC") and apply it
+        
+        background가 True이면 apply_filter_async()로 적용합니다.
+        """
+        filter_config = parse_query(query)
+        (self.apply_filter_async if background else self.apply_filter)(filter_config)
+        return filter_config
+        
+    def explain_query(self, query: str) -> str:
+        """Chosen plan of a filter query with per-stage row counts and timings"""
+        explain = self.filter_engine.explain(parse_query(query), self.catalog, self._search_index())
+        stats = self.filter_engine.cache.stats()
+        return (
+            f"{explain}\n결과 캐시: 적중 {stats['hits']}, 미스 {stats['misses']} "
+            f"(적중률 {stats['hit_rate']:.0%}), 항목 {stats['entries']}개"
+        )
+        
+    def get_filter_cache_stats(self) -> Dict:
+        """Hit/miss statistics of the filter result cache"""
+        return self.filter_engine.cache.stats()
+        
+    def get_http_stats(self) -> Dict:
+        """Request, retry and latency statistics of the ITS API client"""
+        return self.http.stats()
+        
+    def apply_selection_filter(self, layer: QgsVectorLayer, buffer_m: float = DEFAULT_BUFFER_M,
+                               base_filter: Optional[Dict] = None,
+                               background: bool = False) -> Dict:
+        """Filter by the selected features of a layer (polygon, line buffer or point radius)
+        
+        base_filter가 주어지면 공간 조건과 AND로 결합합니다.
+        """
+        filter_config = selection_filter(layer, buffer_m)
+        if base_filter:
+            filter_config = {"operator": "AND", "filters": [base_filter, filter_config]}
+        (self.apply_filter_async if background else self.apply_filter)(filter_config)
+        return filter_config
+        
     def get_current_filter(self) -> Optional[Dict]:
         """Get current filter configuration"""
         return self.current_filter
         
     def clear_filter(self) -> None:
         """Clear current filter"""
+        self.cancel_filter_task()
         self.current_filter = None
-        self.filtered_data = []
-        self.update_layer_features()
+        self._filtered = None
+        self._set_layer_subset("")
         logger.info("필터가 초기화되었습니다.")
         
-    def get_filter_stats(self) -> Dict:
-        """Get filter statistics"""
-        data = self.filtered_data if self.filtered_data else self.cctv_data
+    def _catalog_aggregates(self) -> CatalogAggregates:
+        """Aggregates of the current catalog (full count only when missing or stale)"""
+        aggregates = self._aggregates
+        if aggregates is None or aggregates.version != self.catalog.version:
+            aggregates = CatalogAggregates(self.catalog)
+            self._aggregates = aggregates
+        return aggregates
         
-        # 지역별 통계
-        regions = {}
-        road_types = {}
+    def _update_aggregates(self, diff: Dict, old_catalog: CatalogStore) -> None:
+        """Apply a catalog diff to the aggregates of the previous catalog"""
+        aggregates = self._aggregates
+        if aggregates is not None and aggregates.version == old_catalog.version:
+            aggregates.apply_diff(diff, old_catalog, self.catalog)
+            
+    def get_filter_stats(self, top_cells: int = 10) -> Dict:
+        """Get filter statistics
         
-        for cctv in data:
-            name_parts = cctv["name"].split()
-            if name_parts:
-                region = name_parts[0]
-                regions[region] = regions.get(region, 0) + 1
-                
-                # 도로 유형 분류
-                for road in ["고속도로", "국도", "시도"]:
-                    if road in cctv["name"]:
-                        road_types[road] = road_types.get(road, 0) + 1
-                        break
-                        
+        전체 카탈로그는 유지 중인 집계를, 필터 결과는 결과 행 인덱스의
+        범주 코드 집계(필터 키별 캐시)를 사용합니다.
+        """
+        data = self.filtered_data if self.filtered_data else self.cctv_data
+        
+        if data.store is not self.catalog:
+            # 불러온 CSV 결과 등 별도 저장소
+            counts = count_rows(data.store, data.indices)
+        elif data is self._filtered:
+            key = filter_key(self.current_filter) if self.current_filter else None
+            counts = self._catalog_aggregates().for_rows(data.indices, key)
+        else:
+            counts = self._catalog_aggregates().counts
+            
         return {
             "total": len(data),
-            "regions": regions,
-            "road_types": road_types,
+            "regions": counts["region"],
+            "districts": {
+                district: count for district, count in counts["district"].items()
+                if district != UNKNOWN
+            },
+            "road_types": counts["road_type"],
+            "sources": counts["source"],
+            "cells": CatalogAggregates.top(counts["cell"], top_cells),
             "has_filter": bool(self.current_filter)
         }
 
@@ -0,0 +1,81 @@
+from typing import Dict, List, Optional, Tuple
+import math
+import time
+
+# 대한민국 전역(제주, 울릉도 포함) 경위도 범위: (minX, minY, maxX, maxY)
+KOREA_EXTENT = (124.5, 33.0, 131.0, 38.7)
+
+Tile = Tuple[int, int]
+BBox = Tuple[float, float, float, float]
+
+
+class TileGrid:
+    """Split the national extent into a grid of lon/lat bounding boxes"""
+
+    def __init__(self, extent: BBox = KOREA_EXTENT, tile_size: float = 0.5,
+                 max_age: float = 300):
+        self.extent = extent
+        self.tile_size = tile_size
+        self.max_age = max_age
+        self.cols = math.ceil((extent[2] - extent[0]) / tile_size)
+        self.rows = math.ceil((extent[3] - extent[1]) / tile_size)
+        self._fetched_at: Dict[Tile, float] = {}
+
+    def tiles(self) -> List[Tile]:
+        """Get all tiles of the grid (column, row)"""
+        return [(col, row) for row in range(self.rows) for col in range(self.cols)]
+
+    def tile_bbox(self, tile: Tile) -> BBox:
+        """Get bounding box of a tile"""
+        col, row = tile
+        min_x = self.extent[0] + col * self.tile_size
+        min_y = self.extent[1] + row * self.tile_size
+        return (
+            min_x,
+            min_y,
+            min(min_x + self.tile_size, self.extent[2]),
+            min(min_y + self.tile_size, self.extent[3])
+        )
+
+    def tiles_for_bbox(self, bbox: BBox) -> List[Tile]:
+        """Get tiles intersecting the given bounding box"""
+        min_x = max(bbox[0], self.extent[0])
+        min_y = max(bbox[1], self.extent[1])
+        max_x = min(bbox[2], self.extent[2])
+        max_y = min(bbox[3], self.extent[3])
+        if min_x > max_x or min_y > max_y:
+            return []
+
+        first_col = int((min_x - self.extent[0]) // self.tile_size)
+        first_row = int((min_y - self.extent[1]) // self.tile_size)
+        last_col = min(int((max_x - self.extent[0]) // self.tile_size), self.cols - 1)
+        last_row = min(int((max_y - self.extent[1]) // self.tile_size), self.rows - 1)
+        return [
+            (col, row)
+            for row in range(first_row, last_row + 1)
+            for col in range(first_col, last_col + 1)
+        ]
+
+    def is_fresh(self, tile: Tile, now: Optional[float] = None) -> bool:
+        """Check whether a tile was fetched within max_age"""
+        fetched_at = self._fetched_at.get(tile)
+        if fetched_at is None:
+            return False
+        return (now or time.time()) - fetched_at <= self.max_age
+
+    def stale_tiles(self, tiles: Optional[List[Tile]] = None) -> List[Tile]:
+        """Get tiles that need to be (re)fetched"""
+        now = time.time()
+        return [tile for tile in (tiles or self.tiles())
+                if not self.is_fresh(tile, now)]
+
+    def mark_fresh(self, tile: Tile, timestamp: Optional[float] = None) -> None:
+        """Record fetch time of a tile"""
+        self._fetched_at[tile] = timestamp or time.time()
+
+    def invalidate(self, tile: Optional[Tile] = None) -> None:
+        """Mark one tile (or every tile) as stale"""
+        if tile is None:
+            self._fetched_at.clear()
+        else:
+            self._fetched_at.pop(tile, None)
@@ -0,0 +1,82 @@
+from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from threading import Lock
+import numpy as np
+
+
+class FilterResultCache:
+    """Bounded LRU cache of filter results keyed by (catalog version, normalised filter key)
+
+    결과는 카탈로그 행 인덱스 배열(읽기 전용)로 저장합니다. 항목 수와 총
+    바이트 수를 모두 제한하며, 카탈로그가 바뀌면 retain()으로 이전 버전의
+    결과를 버립니다.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[int, str], np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, version: int, key: str) -> Optional[np.ndarray]:
+        """Cached row indices (marks the entry most recently used)"""
+        with self._lock:
+            indices = self._entries.get((version, key))
+            if indices is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((version, key))
+            self.hits += 1
+            return indices
+
+    def put(self, version: int, key: str, indices: np.ndarray) -> np.ndarray:
+        """Store row indices and return the read-only cached array"""
+        indices = np.array(indices, dtype=np.int64)
+        indices.setflags(write=False)
+        with self._lock:
+            previous = self._entries.pop((version, key), None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[(version, key)] = indices
+            self._bytes += indices.nbytes
+
+            # 가장 오래 쓰이지 않은 항목부터 제거 (방금 넣은 항목은 유지)
+            while len(self._entries) > 1 and (
+                    len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+        return indices
+
+    def retain(self, version: int) -> None:
+        """Drop the results of every catalog version except version"""
+        with self._lock:
+            stale = [entry for entry in self._entries if entry[0] != version]
+            for entry in stale:
+                self._bytes -= self._entries.pop(entry).nbytes
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes
+            }
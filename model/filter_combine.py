@@ -1,20 +1,32 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from qgis.PyQt.QtCore import QSettings
 import json
+import numpy as np
 from datetime import datetime
 from ..utils.logger import Logger
 from ..utils.exceptions import ConfigError
+from .catalog_store import CatalogStore, RowsView
+from .filter_engine import FilterEngine, compile_filter
 
 logger = Logger.get_logger()
 
 class FilterCombine:
-    def __init__(self):
+    def __init__(self, engine: Optional[FilterEngine] = None):
         self.settings = QSettings("QcctvKor", "QcctvKor")
+        # 모델과 같은 엔진을 받으면 컴파일 계획과 결과 캐시를 공유
+        self.engine = engine or FilterEngine()
         
     def save_combined_filter(self, name: str, filters: List[Dict],
                            operator: str = "AND") -> None:
-        """Save combined filter configuration"""
+        """Save combined filter configuration
+        
+        filters의 각 항목은 단일 필터 또는 {"operator", "filters"} 형식의
+        중첩 그룹입니다. 단일 필터에는 공간 조건(within, bbox, polygon, route)도
+        사용할 수 있습니다.
+        """
         try:
+            compile_filter({"operator": operator, "filters": filters})
+            
             combined_filters = self._get_combined_filters()
             
             # 새 조합 필터 추가
@@ -59,35 +71,27 @@ class FilterCombine:
             logger.error(f"조합 필터 삭제 실패: {str(e)}")
             return False
             
-    def apply_combined_filter(self, name: str, data: List[Dict]) -> List[Dict]:
-        """Apply combined filter to data"""
+    def apply_combined_filter(self, name: str,
+                              data: Union[RowsView, List[Dict]]) -> Union[RowsView, List[Dict]]:
+        """Apply combined filter to data
+        
+        조합 필터를 계획으로 컴파일해 카탈로그 전체에 대한 비트셋으로 평가한 뒤
+        data에 포함된 행만 남깁니다. RowsView를 주면 RowsView를 반환합니다.
+        """
         try:
             combined_filter = self.get_combined_filter(name)
             if not combined_filter:
                 raise ConfigError(f"조합 필터 '{name}'을(를) 찾을 수 없습니다.")
                 
-            filters = combined_filter["filters"]
-            operator = combined_filter["operator"]
-            
-            filtered_data = data
-            
-            if operator == "AND":
-                # 모든 필터 조건을 만족하는 데이터만 선택
-                for filter_config in filters:
-                    filtered_data = self._apply_single_filter(filter_config,
-                                                           filtered_data)
-            else:  # OR
-                # 하나라도 만족하는 데이터 선택
-                result_set = set()
-                for filter_config in filters:
-                    filtered = self._apply_single_filter(filter_config, data)
-                    result_set.update(self._get_data_ids(filtered))
-                    
-                filtered_data = [item for item in data 
-                               if self._get_item_id(item) in result_set]
+            if isinstance(data, RowsView):
+                indices = self.engine.evaluate(combined_filter, data.store)
+                return data.store.rows(data.indices[np.isin(data.indices, indices)])
                 
-            return filtered_data
+            indices = self.engine.evaluate(combined_filter, CatalogStore(data))
+            return [data[i] for i in indices.tolist()]
             
+        except ConfigError:
+            raise
         except Exception as e:
             logger.error(f"조합 필터 적용 실패: {str(e)}")
             raise ConfigError(f"조합 필터 적용 실패: {str(e)}")
@@ -100,38 +104,3 @@ class FilterCombine:
         except Exception as e:
             logger.error(f"조합 필터 목록 로드 실패: {str(e)}")
             return {}
-            
-    def _apply_single_filter(self, filter_config: Dict,
-                           data: List[Dict]) -> List[Dict]:
-        """Apply single filter configuration to data"""
-        region = filter_config.get("region", "")
-        road_type = filter_config.get("road_type", "")
-        keyword = filter_config.get("keyword", "").lower()
-        
-        filtered = data
-        
-        # 지역 필터링
-        if region and region != "전체":
-            filtered = [item for item in filtered 
-                       if item.get("region") == region]
-            
-        # 도로 유형 필터링
-        if road_type and road_type != "전체":
-            filtered = [item for item in filtered 
-                       if item.get("road_type") == road_type]
-            
-        # 키워드 필터링
-        if keyword:
-            filtered = [item for item in filtered 
-                       if keyword in str(item).lower()]
-            
-        return filtered
-        
-    def _get_data_ids(self, data: List[Dict]) -> set:
-        """Get set of data item IDs"""
-        return {self._get_item_id(item) for item in data}
-        
-    def _get_item_id(self, item: Dict) -> str:
-        """Get unique identifier for data item"""
-        # CCTV 데이터의 고유 식별자 생성
-        return f"{item.get('id', '')}_{item.get('location', '')}" 
\ No newline at end of file
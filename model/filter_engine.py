@@ -0,0 +1,565 @@
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+import json
+import time
+import numpy as np
+
+from ..utils.exceptions import CanceledError, ConfigError
+from ..utils.geo import (distance_to_line_m, haversine_m, line_chunks,
+                         points_in_polygon, radius_bbox, rings_bbox)
+from .catalog_store import CatalogStore
+from .filter_cache import FilterResultCache
+from .search_index import NgramSearchIndex
+
+# 필터 설정에서 범주 열로 평가하는 키
+CATEGORY_KEYS = ("region", "district", "road_type", "source")
+
+# 공간 조건 키 (좌표는 모두 WGS84 경도/위도)
+#   within:  {"radius_m": 3000, "lon": 127.0, "lat": 37.5}
+#   bbox:    [min_lon, min_lat, max_lon, max_lat]
+#   polygon: [[[lon, lat], ...], ...]  (외곽선/구멍/멀티폴리곤 부분의 링 목록)
+#   route:   {"lines": [[[lon, lat], ...], ...], "buffer_m": 500}
+SPATIAL_KEYS = ("within", "bbox", "polygon", "route")
+
+# 값이 없는 것으로 취급하는 필터 값
+ANY_VALUES = (None, "", "전체")
+
+OPERATORS = ("AND", "OR", "NOT")
+
+
+def is_group(filter_config: Mapping) -> bool:
+    """Whether a filter config is a group of sub-filters"""
+    return "filters" in filter_config
+
+
+def normalize_filter(filter_config: Mapping):
+    """Canonical form of a filter tree (drops empty values and metadata)
+
+    단일 필터는 조건 키만, 그룹은 연산자/부정/하위 필터만 남깁니다.
+    """
+    if is_group(filter_config):
+        operator = str(filter_config.get("operator", "AND")).upper()
+        group = {
+            "operator": operator,
+            "filters": [normalize_filter(child) for child in filter_config["filters"]]
+        }
+        if filter_config.get("negate"):
+            group["negate"] = True
+        return group
+
+    leaf = {}
+    for key in CATEGORY_KEYS + ("keyword",) + SPATIAL_KEYS:
+        value = filter_config.get(key)
+        if isinstance(value, str):
+            value = value.strip()
+        if value not in ANY_VALUES:
+            leaf[key] = value
+    # 이름 검색은 대소문자를 구분하지 않으므로 키도 소문자로 통일
+    if "keyword" in leaf:
+        leaf["keyword"] = leaf["keyword"].lower()
+    if filter_config.get("negate"):
+        leaf["negate"] = True
+    return leaf
+
+
+def filter_key(filter_config: Mapping) -> str:
+    """Normalised JSON key of a filter tree"""
+    return json.dumps(normalize_filter(filter_config), sort_keys=True, ensure_ascii=False)
+
+
+class EvalContext:
+    """Catalog and indexes a plan is evaluated against
+
+    trace가 리스트이면 단계별 (깊이, 조건, 접근 방식, 예상 행 수, 입력 행 수,
+    결과 행 수, 소요 시간 ms)를 기록합니다. is_canceled가 참을 반환하면 다음
+    단계 전에 CanceledError를 발생시키고, progress(완료 조건 수, 전체 조건 수)로
+    진행률을 알립니다.
+    """
+
+    def __init__(self, store: CatalogStore, search_index: Callable[[], NgramSearchIndex],
+                 trace: Optional[List[Tuple]] = None,
+                 is_canceled: Optional[Callable[[], bool]] = None,
+                 progress: Optional[Callable[[int, int], None]] = None,
+                 total_steps: int = 0):
+        self.store = store
+        self._search_index = search_index
+        self.size = len(store)
+        self.trace = trace
+        self.depth = 0
+        self.is_canceled = is_canceled
+        self.progress = progress
+        self.total_steps = total_steps
+        self.steps = 0
+
+    def check_canceled(self) -> None:
+        if self.is_canceled is not None and self.is_canceled():
+            raise CanceledError("필터 평가가 취소되었습니다.")
+
+    def advance(self) -> None:
+        """Count one evaluated predicate and report progress"""
+        self.steps += 1
+        if self.progress is not None:
+            self.progress(min(self.steps, self.total_steps), self.total_steps)
+
+    @property
+    def search_index(self) -> NgramSearchIndex:
+        """N-gram index of the store (built only when a keyword predicate needs it)"""
+        return self._search_index()
+
+    def all_rows(self) -> np.ndarray:
+        return np.arange(self.size, dtype=np.int64)
+
+
+class PlanNode:
+    """Compiled filter plan node
+
+    select(context, rows)는 rows가 None이면 색인으로 전체 카탈로그에서,
+    아니면 주어진 행(이전 단계의 생존 행)만 검사하여 정렬된 행 인덱스를 반환합니다.
+    """
+
+    # 색인 접근 방식 (explain 표시용)
+    access = ""
+    # 조건 노드 여부 (AND/OR/NOT 노드는 False, 진행률 계산용)
+    leaf = True
+
+    def estimate(self, context: EvalContext) -> int:
+        """Estimated number of matching rows (planner selectivity)"""
+        return context.size
+
+    def select(self, context: EvalContext, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        raise NotImplementedError
+
+    def run(self, context: EvalContext, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """select() with per-stage tracing, cancellation checks and progress"""
+        context.check_canceled()
+        if context.trace is None:
+            result = self.select(context, rows)
+        else:
+            entry_index = len(context.trace)
+            context.trace.append(None)
+            context.depth += 1
+            start = time.perf_counter()
+            result = self.select(context, rows)
+            elapsed = (time.perf_counter() - start) * 1000
+            context.depth -= 1
+            context.trace[entry_index] = (
+                context.depth, self.describe(), self.access, self.estimate(context),
+                None if rows is None else len(rows), len(result), elapsed
+            )
+
+        # 취소로 중단된 조건의 불완전한 결과는 사용하지 않음
+        context.check_canceled()
+        if self.leaf:
+            context.advance()
+        return result
+
+    def leaves(self) -> int:
+        """Number of predicates in the plan"""
+        return 1
+
+    def describe(self) -> str:
+        raise NotImplementedError
+
+
+class AllRows(PlanNode):
+    def estimate(self, context):
+        return context.size
+
+    def select(self, context, rows=None):
+        return context.all_rows() if rows is None else rows
+
+    def describe(self) -> str:
+        return "ALL"
+
+
+class CategoryPredicate(PlanNode):
+    """Category column equals value (bitmap lookup)
+
+    범주에 없는 값은 이전처럼 이름 부분 문자열 비교로 평가합니다.
+    """
+
+    access = "bitmap"
+
+    def __init__(self, column: str, value: str):
+        self.column = column
+        self.value = value
+
+    def _index(self, context):
+        return getattr(context.store, self.column + "s")
+
+    def estimate(self, context):
+        index = self._index(context)
+        if self.value in index:
+            return int(np.count_nonzero(index.bitmap(self.value)))
+        return context.size
+
+    def select(self, context, rows=None):
+        index = self._index(context)
+        if self.value in index:
+            mask = index.bitmap(self.value)
+        else:
+            mask = context.store.name_contains(self.value)
+        return np.flatnonzero(mask) if rows is None else rows[mask[rows]]
+
+    def describe(self) -> str:
+        return f"{self.column}={self.value}"
+
+
+class KeywordPredicate(PlanNode):
+    """Name matches keyword (n-gram index, substring or 초성)"""
+
+    access = "ngram"
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+
+    def estimate(self, context):
+        return context.search_index.estimate_rows(self.keyword)
+
+    def select(self, context, rows=None):
+        mask = context.search_index.search_mask(self.keyword, rows, context.is_canceled)
+        return np.flatnonzero(mask) if rows is None else rows[mask[rows]]
+
+    def describe(self) -> str:
+        return f"name~{self.keyword!r}"
+
+
+class WithinPredicate(PlanNode):
+    """Within radius metres of a point (grid index + haversine refinement)"""
+
+    access = "spatial"
+
+    def __init__(self, radius_m: float, lon: float, lat: float):
+        self.radius_m = float(radius_m)
+        self.lon = float(lon)
+        self.lat = float(lat)
+
+    def estimate(self, context):
+        bbox = radius_bbox(self.lon, self.lat, self.radius_m)
+        # 원은 외접 사각형 면적의 약 π/4
+        return int(context.store.point_index().count_bbox(bbox) * np.pi / 4)
+
+    def select(self, context, rows=None):
+        store = context.store
+        if rows is None:
+            return store.point_index().query_radius(self.lon, self.lat, self.radius_m)
+        distance = haversine_m(store.lon[rows], store.lat[rows], self.lon, self.lat)
+        return rows[distance <= self.radius_m]
+
+    def describe(self) -> str:
+        return f"within({self.radius_m:g}m, {self.lon:g}, {self.lat:g})"
+
+
+class BBoxPredicate(PlanNode):
+    """Inside a lon/lat bounding box (grid index)"""
+
+    access = "spatial"
+
+    def __init__(self, bbox):
+        min_x, min_y, max_x, max_y = (float(value) for value in bbox)
+        if min_x > max_x or min_y > max_y:
+            raise ValueError("min > max")
+        self.bbox = (min_x, min_y, max_x, max_y)
+
+    def estimate(self, context):
+        return context.store.point_index().count_bbox(self.bbox)
+
+    def select(self, context, rows=None):
+        store = context.store
+        if rows is None:
+            return store.point_index().query_bbox(self.bbox)
+        min_x, min_y, max_x, max_y = self.bbox
+        lon = store.lon[rows]
+        lat = store.lat[rows]
+        return rows[(lon >= min_x) & (lon <= max_x) & (lat >= min_y) & (lat <= max_y)]
+
+    def describe(self) -> str:
+        return "bbox({:g}, {:g}, {:g}, {:g})".format(*self.bbox)
+
+
+class PolygonPredicate(PlanNode):
+    """Inside a polygon (grid index bbox prefilter + even-odd test)"""
+
+    access = "spatial"
+
+    def __init__(self, rings):
+        self.rings = [np.asarray(ring, dtype=np.float64) for ring in rings]
+        if not self.rings or any(ring.ndim != 2 or len(ring) < 3 for ring in self.rings):
+            raise ValueError("polygon rings need at least 3 points")
+        self.bbox = rings_bbox(self.rings)
+
+    def estimate(self, context):
+        return context.store.point_index().count_bbox(self.bbox)
+
+    def select(self, context, rows=None):
+        store = context.store
+        if rows is None:
+            return store.point_index().query_polygon(self.rings)
+        inside = points_in_polygon(store.lon[rows], store.lat[rows], self.rings)
+        return rows[inside]
+
+    def describe(self) -> str:
+        vertices = sum(len(ring) for ring in self.rings)
+        return f"polygon({len(self.rings)} rings, {vertices} pts)"
+
+
+class RoutePredicate(PlanNode):
+    """Within buffer_m metres of polylines (per-chunk grid lookup + segment distance)"""
+
+    access = "spatial"
+
+    def __init__(self, lines, buffer_m: float):
+        self.lines = [np.asarray(line, dtype=np.float64) for line in lines]
+        if not self.lines or any(line.ndim != 2 or len(line) < 2 for line in self.lines):
+            raise ValueError("route lines need at least 2 points")
+        self.buffer_m = float(buffer_m)
+
+    def estimate(self, context):
+        return context.store.point_index().count_line_buffer(self.lines, self.buffer_m)
+
+    def select(self, context, rows=None):
+        store = context.store
+        if rows is None:
+            return store.point_index().query_line_buffer(self.lines, self.buffer_m)
+        lon = store.lon[rows]
+        lat = store.lat[rows]
+        near = np.zeros(len(rows), dtype=bool)
+        for part in line_chunks(self.lines, 16):
+            near |= distance_to_line_m(lon, lat, part) <= self.buffer_m
+        return rows[near]
+
+    def describe(self) -> str:
+        vertices = sum(len(line) for line in self.lines)
+        return f"route({len(self.lines)} lines, {vertices} pts, {self.buffer_m:g}m)"
+
+
+class AndNode(PlanNode):
+    """Conjunction evaluated most-selective-first over the survivors"""
+
+    access = "and"
+    leaf = False
+
+    def __init__(self, children: List[PlanNode]):
+        self.children = children
+
+    def leaves(self) -> int:
+        return sum(child.leaves() for child in self.children)
+
+    def plan(self, context: EvalContext) -> List[PlanNode]:
+        """Children ordered by estimated row count (smallest first)"""
+        return sorted(self.children, key=lambda child: child.estimate(context))
+
+    def estimate(self, context):
+        return min(child.estimate(context) for child in self.children)
+
+    def select(self, context, rows=None):
+        for child in self.plan(context):
+            rows = child.run(context, rows)
+            if not len(rows):
+                break
+        return rows
+
+    def describe(self) -> str:
+        return "(" + " AND ".join(child.describe() for child in self.children) + ")"
+
+
+class OrNode(PlanNode):
+    access = "or"
+    leaf = False
+
+    def __init__(self, children: List[PlanNode]):
+        self.children = children
+
+    def leaves(self) -> int:
+        return sum(child.leaves() for child in self.children)
+
+    def estimate(self, context):
+        return min(sum(child.estimate(context) for child in self.children), context.size)
+
+    def select(self, context, rows=None):
+        result = np.zeros(0, dtype=np.int64)
+        for child in self.children:
+            result = np.union1d(result, child.run(context, rows))
+        return result
+
+    def describe(self) -> str:
+        return "(" + " OR ".join(child.describe() for child in self.children) + ")"
+
+
+class NotNode(PlanNode):
+    access = "not"
+    leaf = False
+
+    def __init__(self, child: PlanNode):
+        self.child = child
+
+    def leaves(self) -> int:
+        return self.child.leaves()
+
+    def estimate(self, context):
+        return context.size - self.child.estimate(context)
+
+    def select(self, context, rows=None):
+        base = context.all_rows() if rows is None else rows
+        return np.setdiff1d(base, self.child.run(context, rows), assume_unique=True)
+
+    def describe(self) -> str:
+        return f"NOT {self.child.describe()}"
+
+
+def _combine(operator: str, children: List[PlanNode]) -> PlanNode:
+    """AND/OR node with nested same-operator groups flattened"""
+    node_type = AndNode if operator == "AND" else OrNode
+    flat = []
+    for child in children:
+        if isinstance(child, node_type):
+            flat.extend(child.children)
+        else:
+            flat.append(child)
+
+    if operator == "AND":
+        flat = [child for child in flat if not isinstance(child, AllRows)]
+        if not flat:
+            return AllRows()
+    elif any(isinstance(child, AllRows) for child in flat):
+        return AllRows()
+
+    return flat[0] if len(flat) == 1 else node_type(flat)
+
+
+def _spatial_predicate(key: str, value) -> PlanNode:
+    """Plan node of a spatial filter value"""
+    try:
+        if key == "within":
+            return WithinPredicate(value["radius_m"], value["lon"], value["lat"])
+        if key == "bbox":
+            return BBoxPredicate(value)
+        if key == "polygon":
+            return PolygonPredicate(value)
+        if key == "route":
+            return RoutePredicate(value["lines"], value.get("buffer_m", 0))
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        raise ConfigError(f"잘못된 공간 필터입니다 ({key}): {str(value)[:80]}") from e
+    raise ConfigError(f"지원하지 않는 공간 필터입니다: {key}")
+
+
+def compile_filter(filter_config: Mapping) -> PlanNode:
+    """Compile a (possibly nested) filter config into a plan
+
+    그룹은 {"operator": "AND" | "OR" | "NOT", "filters": [...], "negate": bool},
+    단일 필터는 {"region", "district", "road_type", "source", "keyword", "negate"}와
+    공간 조건 키(SPATIAL_KEYS 참고)로 이루어집니다.
+    """
+    if is_group(filter_config):
+        operator = str(filter_config.get("operator", "AND")).upper()
+        if operator not in OPERATORS:
+            raise ConfigError(f"지원하지 않는 필터 연산자입니다: {operator}")
+
+        children = [compile_filter(child) for child in filter_config["filters"]]
+        if operator == "NOT":
+            node = NotNode(_combine("AND", children))
+        elif children:
+            node = _combine(operator, children)
+        else:
+            node = AllRows()
+    else:
+        predicates = [
+            CategoryPredicate(key, filter_config[key]) for key in CATEGORY_KEYS
+            if filter_config.get(key) not in ANY_VALUES
+        ]
+        keyword = filter_config.get("keyword")
+        if keyword:
+            predicates.append(KeywordPredicate(keyword))
+        predicates.extend(
+            _spatial_predicate(key, filter_config[key]) for key in SPATIAL_KEYS
+            if filter_config.get(key) not in ANY_VALUES
+        )
+        node = _combine("AND", predicates)
+
+    if filter_config.get("negate"):
+        node = NotNode(node)
+    return node
+
+
+def format_trace(plan: PlanNode, trace: List[Tuple], total_ms: float, result: int) -> str:
+    """Readable explain output of a traced evaluation"""
+    lines = [f"계획: {plan.describe()}"]
+    for step, (depth, description, access, estimate, rows_in, rows_out, elapsed) in enumerate(trace, 1):
+        source = "전체" if rows_in is None else f"{rows_in}행 중"
+        lines.append(
+            f"{'  ' * (depth + 1)}{step}. {description} [{access}] "
+            f"예상 {estimate}행, {source} -> {rows_out}행 ({elapsed:.2f}ms)"
+        )
+    lines.append(f"결과: {result}행 ({total_ms:.2f}ms)")
+    return "\n".join(lines)
+
+
+class FilterEngine:
+    """Compile filter trees once and evaluate them to row index sets over the catalog
+
+    컴파일된 계획은 정규화된 필터 키로, 평가 결과(행 인덱스)는
+    (카탈로그 버전, 필터 키)로 LRU 캐시에 저장합니다.
+    """
+
+    def __init__(self, max_plans: int = 128, cache: Optional[FilterResultCache] = None):
+        self.max_plans = max_plans
+        self._plans: Dict[str, PlanNode] = {}
+        self.cache = cache or FilterResultCache()
+        self._search_index: Optional[NgramSearchIndex] = None
+
+    def compile(self, filter_config: Mapping) -> PlanNode:
+        """Compiled plan of a filter tree (cached by normalised key)"""
+        key = filter_key(filter_config)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = compile_filter(normalize_filter(filter_config))
+            if len(self._plans) >= self.max_plans:
+                self._plans.clear()
+            self._plans[key] = plan
+        return plan
+
+    def _context(self, store: CatalogStore, search_index: Optional[NgramSearchIndex],
+                 trace: Optional[List[Tuple]] = None, **options) -> EvalContext:
+        def get_search_index() -> NgramSearchIndex:
+            if search_index is not None and search_index.store is store:
+                return search_index
+            if self._search_index is None or self._search_index.store is not store:
+                self._search_index = NgramSearchIndex(store)
+            return self._search_index
+
+        return EvalContext(store, get_search_index, trace, **options)
+
+    def evaluate(self, filter_config: Mapping, store: CatalogStore,
+                 search_index: Optional[NgramSearchIndex] = None,
+                 is_canceled: Optional[Callable[[], bool]] = None,
+                 progress: Optional[Callable[[int, int], None]] = None) -> np.ndarray:
+        """Row indices of store matching a filter tree (read-only, possibly cached)
+
+        스레드에서 호출 가능합니다. 취소되면 CanceledError가 발생하며 결과는
+        캐시에 저장되지 않습니다.
+        """
+        key = filter_key(filter_config)
+        indices = self.cache.get(store.version, key)
+        if indices is None:
+            plan = self.compile(filter_config)
+            context = self._context(store, search_index, is_canceled=is_canceled,
+                                    progress=progress, total_steps=plan.leaves())
+            indices = self.cache.put(store.version, key, plan.run(context))
+        if progress is not None:
+            progress(1, 1)
+        return indices
+
+    def invalidate(self, store: CatalogStore) -> None:
+        """Keep only cached results of the given (current) catalog"""
+        self.cache.retain(store.version)
+
+    def explain(self, filter_config: Mapping, store: Optional[CatalogStore] = None,
+                search_index: Optional[NgramSearchIndex] = None) -> str:
+        """Readable plan; with a store, run it uncached and show per-stage timings"""
+        plan = self.compile(filter_config)
+        if store is None:
+            return plan.describe()
+
+        trace: List[Tuple] = []
+        start = time.perf_counter()
+        result = plan.run(self._context(store, search_index, trace))
+        return format_trace(plan, trace, (time.perf_counter() - start) * 1000, len(result))
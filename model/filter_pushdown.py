@@ -0,0 +1,206 @@
+from typing import Callable, FrozenSet, Iterable, Mapping, NamedTuple, Optional, Tuple
+import math
+import numpy as np
+
+from ..utils.geo import buffered_bbox, radius_bbox, rings_bbox
+from .cctv_tiles import KOREA_EXTENT, BBox
+from .filter_engine import ANY_VALUES, SPATIAL_KEYS, is_group
+
+# 시도별 대략적인 경위도 범위 (섬 포함, 경계 파일이 없을 때 사용)
+REGION_BBOXES = {
+    "서울": (126.76, 37.41, 127.19, 37.72),
+    "부산": (128.76, 34.88, 129.32, 35.40),
+    "대구": (128.35, 35.60, 128.77, 36.02),
+    "인천": (124.60, 37.00, 126.80, 37.98),
+    "광주": (126.64, 35.05, 127.02, 35.26),
+    "대전": (127.24, 36.18, 127.56, 36.50),
+    "울산": (128.96, 35.32, 129.47, 35.73),
+    "세종": (127.14, 36.40, 127.41, 36.74),
+    "경기": (126.37, 36.89, 127.86, 38.29),
+    "강원": (127.08, 37.02, 129.37, 38.62),
+    "충북": (127.27, 36.00, 128.66, 37.27),
+    "충남": (125.98, 35.97, 127.65, 37.07),
+    "전북": (125.97, 35.29, 127.91, 36.16),
+    "전남": (125.06, 33.86, 127.90, 35.51),
+    "경북": (127.80, 35.57, 131.00, 37.56),
+    "경남": (127.56, 34.46, 129.23, 35.91),
+    "제주": (126.08, 33.11, 126.98, 33.57)
+}
+
+# 지역 범위 여유 (도, 경계 근처 CCTV 포함)
+REGION_MARGIN = 0.05
+
+# 도로 유형 필터 값 -> ITS 도로 유형(type)
+ROAD_TYPE_FEEDS = {"고속도로": "ex", "국도": "its"}
+
+# 조회 범위 정밀도 (소수점 자릿수)
+BBOX_PRECISION = 4
+
+
+class Pushdown(NamedTuple):
+    """API request constraints implied by a filter: area and road types to fetch"""
+    bbox: BBox
+    road_types: Optional[FrozenSet[str]]  # None이면 모든 도로 유형
+
+
+# (범위, 도로 유형): None은 제약 없음
+Constraint = Tuple[Optional[BBox], Optional[FrozenSet[str]]]
+
+
+def bbox_intersection(a: Optional[BBox], b: Optional[BBox]) -> Optional[BBox]:
+    """Intersection of two boxes (None is unbounded; may be empty)"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (max(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), min(a[3], b[3]))
+
+
+def bbox_union(a: BBox, b: BBox) -> BBox:
+    """Smallest box containing both boxes"""
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def bbox_is_empty(bbox: BBox) -> bool:
+    return bbox[0] > bbox[2] or bbox[1] > bbox[3]
+
+
+def bbox_contains(outer: BBox, inner: BBox) -> bool:
+    """Whether outer covers inner"""
+    return (outer[0] <= inner[0] and outer[1] <= inner[1]
+            and outer[2] >= inner[2] and outer[3] >= inner[3])
+
+
+def region_bbox(region: str, areas: Optional[Iterable] = None) -> Optional[BBox]:
+    """Box of a 시도 from boundary areas (AdminArea) or the built-in table, with margin"""
+    bbox = None
+    for area in areas or ():
+        if area.region == region:
+            bbox = area.bbox if bbox is None else bbox_union(bbox, area.bbox)
+    if bbox is None:
+        bbox = REGION_BBOXES.get(region)
+    if bbox is None:
+        return None
+    return (bbox[0] - REGION_MARGIN, bbox[1] - REGION_MARGIN,
+            bbox[2] + REGION_MARGIN, bbox[3] + REGION_MARGIN)
+
+
+def spatial_bbox(key: str, value) -> Optional[BBox]:
+    """Box enclosing a spatial filter value (None if the value is malformed)"""
+    try:
+        if key == "within":
+            return tuple(float(v) for v in radius_bbox(
+                float(value["lon"]), float(value["lat"]), float(value["radius_m"])
+            ))
+        if key == "bbox":
+            return tuple(float(v) for v in value)
+        if key == "polygon":
+            return rings_bbox([np.asarray(ring, dtype=np.float64) for ring in value])
+        if key == "route":
+            bbox = None
+            for line in value["lines"]:
+                line_bbox = buffered_bbox(np.asarray(line, dtype=np.float64),
+                                          float(value.get("buffer_m", 0)))
+                bbox = line_bbox if bbox is None else bbox_union(bbox, line_bbox)
+            return tuple(float(v) for v in bbox) if bbox else None
+    except (KeyError, TypeError, ValueError, IndexError, AttributeError):
+        return None
+    return None
+
+
+def _intersect_types(a: Optional[FrozenSet[str]],
+                     b: Optional[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a & b
+
+
+def _constraint(filter_config: Mapping, region_box: Callable[[str], Optional[BBox]],
+                source_road_types: Mapping[str, str]) -> Constraint:
+    """Area and road types a filter can only match within"""
+    if filter_config.get("negate"):
+        # 부정 조건은 조회 범위를 줄일 수 없음
+        return None, None
+
+    if is_group(filter_config):
+        operator = str(filter_config.get("operator", "AND")).upper()
+        children = [
+            _constraint(child, region_box, source_road_types)
+            for child in filter_config["filters"]
+        ]
+        if operator == "AND":
+            bbox, road_types = None, None
+            for child_bbox, child_types in children:
+                bbox = bbox_intersection(bbox, child_bbox)
+                road_types = _intersect_types(road_types, child_types)
+            return bbox, road_types
+        if operator == "OR" and children:
+            # 모든 하위 조건이 제약될 때만 합집합으로 제약
+            bbox = None
+            if all(child_bbox is not None for child_bbox, _ in children):
+                for child_bbox, _ in children:
+                    bbox = child_bbox if bbox is None else bbox_union(bbox, child_bbox)
+            road_types = None
+            if all(child_types is not None for _, child_types in children):
+                road_types = frozenset().union(*(child_types for _, child_types in children))
+            return bbox, road_types
+        return None, None
+
+    bbox = None
+    for key in SPATIAL_KEYS:
+        value = filter_config.get(key)
+        if value:
+            bbox = bbox_intersection(bbox, spatial_bbox(key, value))
+
+    region = filter_config.get("region")
+    if region not in ANY_VALUES:
+        bbox = bbox_intersection(bbox, region_box(region))
+    district = filter_config.get("district")
+    if district not in ANY_VALUES:
+        # 시군구 값은 "시도 시군구" 형식
+        bbox = bbox_intersection(bbox, region_box(str(district).split()[0]))
+
+    road_types = None
+    road_type = ROAD_TYPE_FEEDS.get(filter_config.get("road_type"))
+    if road_type:
+        road_types = frozenset((road_type,))
+    source = filter_config.get("source")
+    if source not in ANY_VALUES and source in source_road_types:
+        road_types = _intersect_types(road_types, frozenset((source_road_types[source],)))
+    return bbox, road_types
+
+
+def plan_pushdown(filter_config: Mapping,
+                  region_box: Callable[[str], Optional[BBox]] = region_bbox,
+                  source_road_types: Optional[Mapping[str, str]] = None,
+                  extent: BBox = KOREA_EXTENT) -> Optional[Pushdown]:
+    """API constraints to push down for a filter (None if it does not narrow the area)
+
+    공간 조건과 지역/시군구 필터는 조회 범위(bbox)로, 도로 유형과 출처
+    필터는 조회할 피드의 도로 유형(type)으로 바꿉니다. AND는 교집합, OR는
+    모든 하위 조건이 제약될 때만 합집합이며 부정 조건은 제약하지 않습니다.
+    결과는 범위 안의 CCTV를 더 가져오기 위한 것이며 필터는 그대로 평가합니다.
+    """
+    bbox, road_types = _constraint(filter_config, region_box, source_road_types or {})
+    if bbox is None:
+        return None
+    bbox = bbox_intersection(bbox, extent)
+    if bbox_is_empty(bbox) or road_types == frozenset():
+        return None
+    # 바깥쪽으로 반올림 (같은 범위가 같은 캐시 키가 되도록)
+    scale = 10 ** BBOX_PRECISION
+    bbox = (
+        math.floor(bbox[0] * scale + 1e-6) / scale,
+        math.floor(bbox[1] * scale + 1e-6) / scale,
+        math.ceil(bbox[2] * scale - 1e-6) / scale,
+        math.ceil(bbox[3] * scale - 1e-6) / scale
+    )
+    return Pushdown(bbox, road_types)
+
+
+def describe_pushdown(pushdown: Pushdown) -> str:
+    """Short description for logs"""
+    road_types = "전체" if pushdown.road_types is None else ", ".join(sorted(pushdown.road_types))
+    return "범위 ({:.4f}, {:.4f}, {:.4f}, {:.4f}), 도로 유형 {}".format(*pushdown.bbox, road_types)
@@ -0,0 +1,209 @@
+from typing import Dict, List, Optional, Tuple
+import re
+
+from ..utils.exceptions import ConfigError
+
+# 필드 이름 (영문/한글 별칭) -> 필터 키
+FIELD_ALIASES = {
+    "region": "region", "sido": "region", "지역": "region", "시도": "region",
+    "district": "district", "sigungu": "district", "시군구": "district",
+    "road": "road_type", "road_type": "road_type", "도로": "road_type",
+    "source": "source", "feed": "source", "출처": "source",
+    "name": "keyword", "keyword": "keyword", "이름": "keyword"
+}
+
+# 함수 이름 -> 인자 수
+FUNCTIONS = {"within": 3, "bbox": 4}
+
+_TOKEN_PATTERN = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<punct>[():~=,])
+  | (?P<word>[^\s():~=,"']+)
+''', re.VERBOSE)
+
+_DISTANCE_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)\s*(km|m)?$", re.IGNORECASE)
+
+Token = Tuple[str, str, int]
+
+
+def tokenize(text: str) -> List[Token]:
+    """Split a query into (kind, value, position) tokens"""
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN_PATTERN.match(text, position)
+        if not match:
+            raise ConfigError(f"쿼리 구문 오류 (위치 {position}): 닫히지 않은 따옴표")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == "word" and value.upper() in ("AND", "OR", "NOT"):
+            kind, value = "op", value.upper()
+        if kind != "space":
+            tokens.append((kind, value, position))
+        position = match.end()
+    return tokens
+
+
+def parse_distance(value: str) -> float:
+    """Distance in metres from "5km", "500m" or a bare number of metres"""
+    match = _DISTANCE_PATTERN.match(value.strip())
+    if not match:
+        raise ConfigError(f"잘못된 거리 값입니다: {value}")
+    number = float(match.group(1))
+    return number * 1000 if (match.group(2) or "m").lower() == "km" else number
+
+
+class _Parser:
+    """Recursive descent parser producing a FilterEngine filter tree
+
+    expr    := and_expr (OR and_expr)*
+    and_expr:= not_expr ([AND] not_expr)*
+    not_expr:= NOT not_expr | primary
+    primary := "(" expr ")" | func "(" args ")" | field (":" | "=" | "~") value | value
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.position = 0
+
+    def _peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _error(self, message: str) -> ConfigError:
+        token = self._peek()
+        where = token[2] if token else len(self.text)
+        return ConfigError(f"쿼리 구문 오류 (위치 {where}): {message}")
+
+    def _take(self, kind: str, value: Optional[str] = None) -> Token:
+        token = self._peek()
+        if token is None or token[0] != kind or (value is not None and token[1] != value):
+            raise self._error(f"'{value or kind}'이(가) 필요합니다")
+        self.position += 1
+        return token
+
+    def _accept(self, kind: str, value: Optional[str] = None) -> bool:
+        token = self._peek()
+        if token is not None and token[0] == kind and (value is None or token[1] == value):
+            self.position += 1
+            return True
+        return False
+
+    def parse(self) -> Dict:
+        if not self.tokens:
+            return {}
+        tree = self._expr()
+        if self._peek() is not None:
+            raise self._error("예상하지 못한 토큰")
+        return tree
+
+    @staticmethod
+    def _group(operator: str, filters: List[Dict]) -> Dict:
+        return filters[0] if len(filters) == 1 else {"operator": operator, "filters": filters}
+
+    def _expr(self) -> Dict:
+        filters = [self._and_expr()]
+        while self._accept("op", "OR"):
+            filters.append(self._and_expr())
+        return self._group("OR", filters)
+
+    def _and_expr(self) -> Dict:
+        filters = [self._not_expr()]
+        while True:
+            if self._accept("op", "AND"):
+                filters.append(self._not_expr())
+                continue
+            # 연산자 없이 이어진 조건은 AND
+            token = self._peek()
+            if token is None or token[:2] in (("op", "OR"), ("punct", ")")):
+                break
+            filters.append(self._not_expr())
+        return self._group("AND", filters)
+
+    def _not_expr(self) -> Dict:
+        if self._accept("op", "NOT"):
+            return {"operator": "NOT", "filters": [self._not_expr()]}
+        return self._primary()
+
+    def _primary(self) -> Dict:
+        token = self._peek()
+        if token is None:
+            raise self._error("조건이 필요합니다")
+
+        if self._accept("punct", "("):
+            tree = self._expr()
+            self._take("punct", ")")
+            return tree
+
+        kind, value, _ = token
+        following = self._peek(1)
+        # 알려진 함수 이름만 함수 호출 (그 밖의 단어 뒤 괄호는 AND로 이어진 그룹)
+        if (kind == "word" and value.lower() in FUNCTIONS
+                and following and following[:2] == ("punct", "(")):
+            return self._function()
+        if kind == "word" and following and following[0] == "punct" and following[1] in ":=~":
+            return self._field()
+        if kind in ("word", "string"):
+            self.position += 1
+            return {"keyword": value}
+        raise self._error(f"예상하지 못한 '{value}'")
+
+    def _field(self) -> Dict:
+        name = self._take("word")[1]
+        operator = self._take("punct")[1]
+        key = FIELD_ALIASES.get(name.lower())
+        if key is None:
+            raise ConfigError(f"알 수 없는 필드입니다: {name}")
+        if operator == "~" and key != "keyword":
+            raise ConfigError(f"'~'는 이름 필드에만 사용할 수 있습니다: {name}")
+
+        token = self._peek()
+        if token is None or token[0] not in ("word", "string"):
+            raise self._error(f"'{name}' 값이 필요합니다")
+        self.position += 1
+        return {key: token[1]}
+
+    def _function(self) -> Dict:
+        name = self._take("word")[1].lower()
+        if name not in FUNCTIONS:
+            raise ConfigError(f"알 수 없는 함수입니다: {name}")
+        self._take("punct", "(")
+        args = [self._take("word")[1]]
+        while self._accept("punct", ","):
+            args.append(self._take("word")[1])
+        self._take("punct", ")")
+
+        if len(args) != FUNCTIONS[name]:
+            usage = {
+                "within": "within(거리, 경도, 위도)",
+                "bbox": "bbox(최소경도, 최소위도, 최대경도, 최대위도)"
+            }[name]
+            raise ConfigError(f"{usage} 형식이어야 합니다")
+
+        numbers = args[1:] if name == "within" else args
+        try:
+            coords = [float(arg) for arg in numbers]
+        except ValueError:
+            raise ConfigError(f"잘못된 좌표입니다: {', '.join(args)}")
+        if name == "bbox":
+            return {"bbox": coords}
+
+        lon, lat = coords
+        # 위도/경도 순서로 입력한 경우 (한국 범위에서 경도는 항상 90보다 큼)
+        if abs(lon) <= 90 < abs(lat):
+            lon, lat = lat, lon
+        return {"within": {"radius_m": parse_distance(args[0]), "lon": lon, "lat": lat}}
+
+
+def parse_query(text: str) -> Dict:
+    """Parse a filter query into a filter tree
+
+    예: region:서울 AND road:고속도로 AND name~"IC" AND within(5km, 127.03, 37.50)
+        bbox(126.9, 37.4, 127.1, 37.6) NOT 터널
+    필드 없이 쓴 단어는 이름 검색어이고, 연산자 없이 이어진 조건은 AND입니다.
+    """
+    return _Parser(text).parse()
@@ -4,6 +4,7 @@ import json
 from datetime import datetime
 from ..utils.logger import Logger
 from ..utils.exceptions import ConfigError
+from .filter_engine import compile_filter
 
 logger = Logger.get_logger()
 
@@ -12,8 +13,15 @@ class FilterSettings:
         self.settings = QSettings("QcctvKor", "QcctvKor")
         
     def save_filter(self, name: str, filter_config: Dict) -> None:
-        """Save filter configuration"""
+        """Save filter configuration
+        
+        filter_config에는 지역/도로/키워드 외에 공간 조건(within, bbox, polygon,
+        route)을 WGS84 좌표로 넣을 수 있습니다 (filter_engine.SPATIAL_KEYS 참고).
+        """
         try:
+            # 평가할 수 없는 필터는 저장하지 않음
+            compile_filter(filter_config)
+            
             # 기존 필터 목록 로드
             filters = self.get_saved_filters()
             
@@ -0,0 +1,214 @@
+from typing import List, NamedTuple, Optional, Tuple
+from collections import OrderedDict
+from threading import Lock
+import hashlib
+import os
+import time
+import numpy as np
+from qgis.core import (QgsVectorLayer, QgsCoordinateReferenceSystem,
+                       QgsCoordinateTransform, QgsProject)
+from ..utils.logger import Logger
+from ..utils.exceptions import DataError
+from ..utils.geo import PointGridIndex, points_in_polygon, rings_bbox
+from .catalog_store import CatalogStore
+from .cctv_classify import REGIONS, UNKNOWN, CategoryIndex, classify_region
+
+logger = Logger.get_logger()
+
+# 경계 파일에서 시도/시군구 이름을 찾을 속성 (SGIS, 국토지리정보원 등)
+SIDO_FIELDS = ("sido", "CTP_KOR_NM", "SIDO_NM", "CTPRVN_NM", "ctp_kor_nm", "sidonm")
+SIGUNGU_FIELDS = ("sigungu", "SIG_KOR_NM", "SGG_NM", "SIGUNGU_NM", "sig_kor_nm", "sggnm")
+CODE_FIELDS = ("SIG_CD", "ADM_CD", "CTPRVN_CD", "adm_cd", "code")
+
+# 행정구역 코드 앞 두 자리 -> 시도
+SIDO_CODES = {
+    "11": "서울", "26": "부산", "27": "대구", "28": "인천", "29": "광주",
+    "30": "대전", "31": "울산", "36": "세종", "41": "경기", "42": "강원",
+    "51": "강원", "43": "충북", "44": "충남", "45": "전북", "52": "전북",
+    "46": "전남", "47": "경북", "48": "경남", "50": "제주"
+}
+
+# 경계 단순화 허용 오차 (도, 약 10m)
+SIMPLIFY_TOLERANCE = 0.0001
+
+
+class AdminArea(NamedTuple):
+    """One administrative polygon in WGS84"""
+    region: str
+    district: str
+    rings: List[np.ndarray]
+    bbox: Tuple[float, float, float, float]
+
+
+def default_boundary_file() -> str:
+    """Boundary file bundled in the plugin resources directory"""
+    return os.path.join(os.path.dirname(__file__), "..", "resources", "admin_boundaries.geojson")
+
+
+class RegionEngine:
+    """Assign cameras to 시도/시군구 by point-in-polygon against administrative boundaries
+
+    경계 파일(GeoJSON, Shapefile 등 OGR 형식)은 처음 사용할 때 읽어 WGS84로
+    변환합니다. 점 격자 색인으로 경계 사각형 안의 후보만 골라 벡터화된
+    짝수-홀수 판정을 수행하며, 결과는 경계 파일과 좌표/이름 기반 시도가
+    같은 카탈로그끼리 공유하도록 캐시합니다 (재검증으로 다시 만든 카탈로그 등).
+    어느 경계에도 속하지 않는 CCTV는 이름 기반 분류를 유지합니다.
+    """
+
+    def __init__(self, boundary_file: Optional[str] = None, cache_size: int = 4):
+        self.boundary_file = boundary_file or default_boundary_file()
+        self.cache_size = cache_size
+        self._areas: Optional[List[AdminArea]] = None
+        self._results: "OrderedDict[Tuple[str, str], Tuple[CategoryIndex, CategoryIndex]]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether a boundary file exists"""
+        return os.path.exists(self.boundary_file)
+
+    @property
+    def areas(self) -> List[AdminArea]:
+        """Administrative polygons (loaded on first use)"""
+        with self._lock:
+            if self._areas is None:
+                self._areas = self._load_areas()
+            return self._areas
+
+    @staticmethod
+    def _attribute(feature, fields, names) -> str:
+        for name in names:
+            if fields.indexOf(name) >= 0:
+                value = feature[name]
+                if value:
+                    return str(value).strip()
+        return ""
+
+    def _load_areas(self) -> List[AdminArea]:
+        """Read boundary polygons and transform them to WGS84"""
+        layer = QgsVectorLayer(self.boundary_file, "admin_boundaries", "ogr")
+        if not layer.isValid():
+            raise DataError(f"행정구역 경계 파일을 읽을 수 없습니다: {self.boundary_file}")
+
+        start = time.perf_counter()
+        fields = layer.fields()
+        transform = QgsCoordinateTransform(
+            layer.crs(), QgsCoordinateReferenceSystem("EPSG:4326"), QgsProject.instance()
+        )
+
+        areas = []
+        for feature in layer.getFeatures():
+            geometry = feature.geometry()
+            if geometry.isEmpty():
+                continue
+            geometry.transform(transform)
+            geometry = geometry.simplify(SIMPLIFY_TOLERANCE)
+
+            sido = self._attribute(feature, fields, SIDO_FIELDS)
+            code = self._attribute(feature, fields, CODE_FIELDS)
+            region = classify_region(sido) if sido else SIDO_CODES.get(code[:2], UNKNOWN)
+            district = self._attribute(feature, fields, SIGUNGU_FIELDS)
+
+            polygons = geometry.asMultiPolygon() if geometry.isMultipart() else [geometry.asPolygon()]
+            rings = [
+                np.array([(point.x(), point.y()) for point in ring], dtype=np.float64)
+                for polygon in polygons for ring in polygon if len(ring) >= 3
+            ]
+            if rings:
+                areas.append(AdminArea(
+                    region,
+                    f"{region} {district}" if district else UNKNOWN,
+                    rings,
+                    rings_bbox(rings)
+                ))
+
+        logger.info(
+            f"행정구역 경계 {len(areas)}개 로드 "
+            f"({time.perf_counter() - start:.2f}초): {self.boundary_file}"
+        )
+        return areas
+
+    def classify(self, lon: np.ndarray, lat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Area index of each point (-1 outside every boundary) and the hit mask"""
+        area_ids = np.full(len(lon), -1, dtype=np.int32)
+        grid = PointGridIndex(lon, lat)
+        for area_id, area in enumerate(self.areas):
+            candidates = grid.query_bbox(area.bbox)
+            # 이미 다른 경계에 배정된 점은 다시 검사하지 않음
+            candidates = candidates[area_ids[candidates] < 0]
+            if not len(candidates):
+                continue
+            inside = points_in_polygon(lon[candidates], lat[candidates], area.rings)
+            area_ids[candidates[inside]] = area_id
+        return area_ids, area_ids >= 0
+
+    def _result_key(self, store: CatalogStore) -> Tuple[str, str]:
+        """Cache key: boundary file and a digest of the inputs of the assignment"""
+        digest = hashlib.blake2b(digest_size=16)
+        for column in (store.lon, store.lat, store.regions.codes):
+            digest.update(np.ascontiguousarray(column).tobytes())
+        digest.update(repr(store.regions.labels).encode("utf-8"))
+        return self.boundary_file, digest.hexdigest()
+
+    def assign(self, store: CatalogStore) -> Optional[Tuple[CategoryIndex, CategoryIndex]]:
+        """시도/시군구 category columns of a catalog (cached by coordinates and boundary file)
+
+        경계 파일이 없으면 None을 반환합니다.
+        """
+        if not self.available:
+            return None
+
+        key = self._result_key(store)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+
+        start = time.perf_counter()
+        area_ids, hit = self.classify(store.lon, store.lat)
+        areas = self.areas
+
+        # 시도: 경계에 속한 점은 경계 값, 나머지는 이름 기반 분류 유지
+        region_lookup = np.array(
+            [REGIONS.index(area.region) for area in areas] or [0], dtype=np.uint16
+        )
+        region_codes = store.regions.codes.copy()
+        region_codes[hit] = region_lookup[area_ids[hit]]
+
+        # 시군구: 경계에서 나온 이름만 범주로 사용
+        district_labels = sorted({area.district for area in areas} - {UNKNOWN}) + [UNKNOWN]
+        district_position = {label: i for i, label in enumerate(district_labels)}
+        district_lookup = np.array(
+            [district_position[area.district] for area in areas] or [0], dtype=np.uint16
+        )
+        district_codes = np.full(len(store), len(district_labels) - 1, dtype=np.uint16)
+        district_codes[hit] = district_lookup[area_ids[hit]]
+
+        result = (CategoryIndex(REGIONS, region_codes),
+                  CategoryIndex(district_labels, district_codes))
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+
+        logger.info(
+            f"행정구역 배정: {int(hit.sum())}/{len(store)}개 "
+            f"({time.perf_counter() - start:.3f}초)"
+        )
+        return result
+
+    def apply(self, store: CatalogStore) -> bool:
+        """Replace the store's name-based region columns with boundary-based ones"""
+        result = self.assign(store)
+        if result is None:
+            return False
+        store.set_admin_regions(*result)
+        return True
+
+    def invalidate(self) -> None:
+        """Drop cached assignments and boundaries (boundary file changed)"""
+        with self._lock:
+            self._areas = None
+            self._results.clear()
+
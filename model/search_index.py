@@ -0,0 +1,165 @@
+from typing import Callable, Dict, List, Optional
+from collections import defaultdict
+import numpy as np
+
+from .catalog_store import CatalogStore
+
+# 한글 초성 (호환용 자모)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+HANGUL_FIRST = 0xAC00  # '가'
+HANGUL_LAST = 0xD7A3   # '힣'
+SYLLABLES_PER_CHOSEONG = 21 * 28
+
+
+def to_choseong(text: str) -> str:
+    """Replace every Hangul syllable with its initial consonant (초성)
+
+    한글 음절이 아닌 문자는 그대로 두므로 결과 길이는 원문과 같습니다.
+    """
+    return "".join(
+        CHOSEONG[(ord(ch) - HANGUL_FIRST) // SYLLABLES_PER_CHOSEONG]
+        if HANGUL_FIRST <= ord(ch) <= HANGUL_LAST else ch
+        for ch in text
+    )
+
+
+def has_choseong(text: str) -> bool:
+    """Check whether a query contains bare initial consonants"""
+    return any(ch in CHOSEONG_SET for ch in text)
+
+
+def _grams(text: str) -> set:
+    """Unigrams and bigrams of a text"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _query_grams(text: str) -> set:
+    """Grams to look up for a query (bigrams, or the single character)"""
+    if len(text) == 1:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _matches_mixed(name: str, choseong: str, query: str) -> bool:
+    """Substring match where query jamo match the syllable's initial consonant"""
+    size = len(query)
+    for start in range(len(name) - size + 1):
+        for offset, q in enumerate(query):
+            position = start + offset
+            if q != name[position] and not (q in CHOSEONG_SET and q == choseong[position]):
+                break
+        else:
+            return True
+    return False
+
+
+class NgramSearchIndex:
+    """Inverted unigram/bigram index over the distinct camera names of a store
+
+    이름 원문(소문자)과 초성 문자열을 각각 색인하여 부분 문자열 검색과
+    "ㄱㄴㄷㄹ" 같은 초성 검색을 게시 목록 교집합으로 처리합니다.
+    """
+
+    def __init__(self, store: CatalogStore):
+        self.store = store
+        self.version = store.version
+        self._names: List[str] = store.names.lower
+        self._choseong: List[str] = [to_choseong(name) for name in self._names]
+        self._postings = self._build(self._names)
+        self._choseong_postings = self._build(self._choseong)
+
+    @staticmethod
+    def _build(texts: List[str]) -> Dict[str, np.ndarray]:
+        postings = defaultdict(list)
+        for code, text in enumerate(texts):
+            for gram in _grams(text):
+                postings[gram].append(code)
+        return {gram: np.array(codes, dtype=np.int32) for gram, codes in postings.items()}
+
+    def search_codes(self, query: str, within: Optional[np.ndarray] = None,
+                     is_canceled: Optional[Callable[[], bool]] = None) -> np.ndarray:
+        """Name codes matching query (substring or initial-consonant match)
+
+        Args:
+            within: 이전 검색 결과의 이름 코드 (새 검색어가 이전 검색어를
+                포함하면 결과는 항상 그 부분집합이므로 후보를 제한)
+            is_canceled: 취소 여부 확인 함수 (취소되면 빈 결과 반환)
+        """
+        query = query.lower()
+        if not query:
+            return np.arange(len(self._names), dtype=np.int32)
+
+        mixed = has_choseong(query)
+        postings = self._choseong_postings if mixed else self._postings
+        lookup = to_choseong(query) if mixed else query
+
+        # 가장 짧은 게시 목록부터 교집합
+        lists = []
+        for gram in _query_grams(lookup):
+            posting = postings.get(gram)
+            if posting is None:
+                return np.zeros(0, dtype=np.int32)
+            lists.append(posting)
+        if within is not None:
+            lists.append(np.asarray(within, dtype=np.int32))
+        lists.sort(key=len)
+
+        candidates = lists[0]
+        for posting in lists[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if not len(candidates):
+                return candidates
+
+        if not mixed and len(query) <= 2:
+            return candidates
+            
+        # 바이그램 교집합은 후보일 뿐이므로 실제 부분 문자열 여부 확인
+        verified = []
+        for i, code in enumerate(candidates.tolist()):
+            if is_canceled and i % 1024 == 0 and is_canceled():
+                return np.zeros(0, dtype=np.int32)
+            name = self._names[code]
+            if mixed:
+                matched = _matches_mixed(name, self._choseong[code], query)
+            else:
+                matched = query in name
+            if matched:
+                verified.append(code)
+        return np.array(verified, dtype=np.int32)
+
+    def estimate_rows(self, query: str) -> int:
+        """Upper bound of matching rows from the shortest posting list (no verification)"""
+        query = query.lower()
+        if not query:
+            return len(self.store)
+        mixed = has_choseong(query)
+        postings = self._choseong_postings if mixed else self._postings
+        lookup = to_choseong(query) if mixed else query
+        shortest = min(
+            (len(postings.get(gram, ())) for gram in _query_grams(lookup)),
+            default=len(self._names)
+        )
+        # 이름 코드 수를 이름당 평균 행 수로 환산
+        return int(shortest * len(self.store) / max(len(self._names), 1))
+
+    def search_mask(self, query: str, within: Optional[np.ndarray] = None,
+                    is_canceled: Optional[Callable[[], bool]] = None) -> np.ndarray:
+        """Boolean row mask of the store for a query
+
+        within은 이전 검색 결과의 행 인덱스입니다.
+        """
+        within_codes = None
+        if within is not None:
+            within_codes = np.unique(self.store.name_codes[within])
+        code_mask = np.zeros(len(self._names), dtype=bool)
+        code_mask[self.search_codes(query, within_codes, is_canceled)] = True
+        return code_mask[self.store.name_codes]
+
+    def search(self, query: str, within: Optional[np.ndarray] = None,
+               is_canceled: Optional[Callable[[], bool]] = None) -> np.ndarray:
+        """Row indices of the store matching a query"""
+        return np.flatnonzero(self.search_mask(query, within, is_canceled))
@@ -0,0 +1,65 @@
+from typing import Dict, List, Optional
+from qgis.core import (QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+                       QgsGeometry, QgsProject, QgsVectorLayer, QgsWkbTypes)
+from ..utils.exceptions import LayerError
+
+WGS84 = QgsCoordinateReferenceSystem("EPSG:4326")
+
+# 점 피처를 고르면 사용할 기본 반경 / 선 피처 기본 버퍼 (m)
+DEFAULT_BUFFER_M = 500
+
+
+def _to_wgs84(geometry: QgsGeometry, crs: QgsCoordinateReferenceSystem) -> QgsGeometry:
+    geometry = QgsGeometry(geometry)
+    if crs.isValid() and crs != WGS84:
+        geometry.transform(QgsCoordinateTransform(crs, WGS84, QgsProject.instance()))
+    return geometry
+
+
+def _coords(points) -> List[List[float]]:
+    return [[point.x(), point.y()] for point in points]
+
+
+def geometry_filter(geometry: QgsGeometry, crs: QgsCoordinateReferenceSystem,
+                    buffer_m: float = DEFAULT_BUFFER_M) -> Dict:
+    """Spatial filter config (WGS84) for a QGIS geometry
+
+    폴리곤은 polygon, 선은 buffer_m 버퍼의 route, 점은 buffer_m 반경의
+    within 조건이 됩니다.
+    """
+    geometry = _to_wgs84(geometry, crs)
+    geometry_type = QgsWkbTypes.geometryType(geometry.wkbType())
+
+    if geometry_type == QgsWkbTypes.PolygonGeometry:
+        polygons = geometry.asMultiPolygon() if geometry.isMultipart() else [geometry.asPolygon()]
+        return {"polygon": [_coords(ring) for polygon in polygons for ring in polygon]}
+
+    if geometry_type == QgsWkbTypes.LineGeometry:
+        lines = geometry.asMultiPolyline() if geometry.isMultipart() else [geometry.asPolyline()]
+        return {"route": {"lines": [_coords(line) for line in lines], "buffer_m": buffer_m}}
+
+    if geometry_type == QgsWkbTypes.PointGeometry:
+        points = geometry.asMultiPoint() if geometry.isMultipart() else [geometry.asPoint()]
+        filters = [
+            {"within": {"radius_m": buffer_m, "lon": point.x(), "lat": point.y()}}
+            for point in points
+        ]
+        return filters[0] if len(filters) == 1 else {"operator": "OR", "filters": filters}
+
+    raise LayerError("지원하지 않는 도형 유형입니다.")
+
+
+def selection_filter(layer: Optional[QgsVectorLayer],
+                     buffer_m: float = DEFAULT_BUFFER_M) -> Dict:
+    """Spatial filter of a layer's selected features (OR of each feature)"""
+    if not isinstance(layer, QgsVectorLayer) or not layer.isValid():
+        raise LayerError("벡터 레이어를 선택하세요.")
+
+    filters = [
+        geometry_filter(feature.geometry(), layer.crs(), buffer_m)
+        for feature in layer.selectedFeatures()
+        if feature.hasGeometry()
+    ]
+    if not filters:
+        raise LayerError(f"'{layer.name()}' 레이어에 선택된 피처가 없습니다.")
+    return filters[0] if len(filters) == 1 else {"operator": "OR", "filters": filters}
@@ -35,6 +35,28 @@ class ConfigManager:
         """ITS API 키 가져오기"""
         return self.config.get('API', 'ITS_API_KEY', fallback='')
     
+    def get_boundary_file(self):
+        """행정구역 경계 파일 경로 가져오기 (비어 있으면 resources 기본 파일)"""
+        return self.config.get('REGION', 'BOUNDARY_FILE', fallback='')
+    
+    def get_cctv_feeds(self):
+        """조회할 CCTV 피드 목록 가져오기 (예: "ex:1, its:1", 비어 있으면 기본 피드)"""
+        return self.config.get('API', 'CCTV_FEEDS', fallback='')
+    
+    def get_viewport_loading(self):
+        """지도 화면 범위 단위 로딩 사용 여부"""
+        try:
+            return self.config.getboolean('VIEWPORT', 'ENABLED', fallback=False)
+        except ValueError:
+            return False
+    
+    def get_viewport_budget(self):
+        """화면 범위 로딩 시 메모리에 유지할 최대 CCTV 수 (0이면 기본값)"""
+        try:
+            return self.config.getint('VIEWPORT', 'MAX_RECORDS', fallback=0)
+        except ValueError:
+            return 0
+    
     def set_api_key(self, api_key):
         """ITS API 키 설정"""
         if 'API' not in self.config:
@@ -26,6 +26,10 @@ class VideoError(QcctvKorError):
     """Video streaming related errors"""
     pass
 
+class CanceledError(QcctvKorError):
+    """Background operation canceled (superseded or aborted)"""
+    pass
+
 def handle_exception(error: Exception) -> QcctvKorError:
     """Convert general exceptions to QcctvKor specific exceptions"""
     if isinstance(error, QcctvKorError):
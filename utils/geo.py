@@ -0,0 +1,209 @@
+from typing import List, Sequence, Tuple
+import numpy as np
+
+EARTH_RADIUS_M = 6371008.8
+
+BBox = Tuple[float, float, float, float]
+
+
+def haversine_m(lon: np.ndarray, lat: np.ndarray,
+                lon0: float, lat0: float) -> np.ndarray:
+    """Great-circle distance in metres from (lon0, lat0) to each point"""
+    lon = np.radians(lon)
+    lat = np.radians(lat)
+    lon0 = np.radians(lon0)
+    lat0 = np.radians(lat0)
+    a = (np.sin((lat - lat0) / 2) ** 2
+         + np.cos(lat) * np.cos(lat0) * np.sin((lon - lon0) / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def radius_bbox(lon: float, lat: float, radius_m: float) -> BBox:
+    """Lon/lat bounding box enclosing a circle"""
+    dlat = np.degrees(radius_m / EARTH_RADIUS_M)
+    dlon = dlat / max(np.cos(np.radians(lat)), 1e-6)
+    return (lon - dlon, lat - dlat, lon + dlon, lat + dlat)
+
+
+def rings_bbox(rings: Sequence[np.ndarray]) -> BBox:
+    """Bounding box of a set of coordinate rings/lines"""
+    coords = np.vstack(rings)
+    return (float(coords[:, 0].min()), float(coords[:, 1].min()),
+            float(coords[:, 0].max()), float(coords[:, 1].max()))
+
+
+def points_in_polygon(x: np.ndarray, y: np.ndarray, rings: Sequence[np.ndarray],
+                      max_cells: int = 2_000_000) -> np.ndarray:
+    """Even-odd point-in-polygon test vectorised over points and edges
+
+    rings에는 외곽선과 구멍, 멀티폴리곤의 모든 부분을 함께 넣습니다.
+    (짝수-홀수 규칙이므로 구멍은 자동으로 제외됩니다.)
+    """
+    inside = np.zeros(len(x), dtype=bool)
+    if not len(x):
+        return inside
+
+    for ring in rings:
+        x1 = ring[:, 0]
+        y1 = ring[:, 1]
+        x2 = np.roll(x1, -1)
+        y2 = np.roll(y1, -1)
+        # 점 x 변 행렬이 너무 커지지 않도록 점을 나누어 처리
+        step = max(1, max_cells // max(len(x1), 1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for start in range(0, len(x), step):
+                px = x[start:start + step, None]
+                py = y[start:start + step, None]
+                straddles = (y1 > py) != (y2 > py)
+                x_cross = (x2 - x1) * (py - y1) / (y2 - y1) + x1
+                crossings = np.count_nonzero(straddles & (px < x_cross), axis=1)
+                inside[start:start + step] ^= (crossings % 2).astype(bool)
+    return inside
+
+
+def distance_to_line_m(lon: np.ndarray, lat: np.ndarray,
+                       line: np.ndarray) -> np.ndarray:
+    """Minimum distance in metres from each point to a polyline
+
+    짧은 구간에서는 충분히 정확한 등장방형 투영으로 계산합니다.
+    """
+    if not len(lon):
+        return np.zeros(0)
+
+    lat0 = np.radians(float(np.mean(line[:, 1])))
+    scale_x = np.radians(1.0) * EARTH_RADIUS_M * np.cos(lat0)
+    scale_y = np.radians(1.0) * EARTH_RADIUS_M
+
+    px = (lon * scale_x)[:, None]
+    py = (lat * scale_y)[:, None]
+    ax = line[:-1, 0] * scale_x
+    ay = line[:-1, 1] * scale_y
+    bx = line[1:, 0] * scale_x
+    by = line[1:, 1] * scale_y
+
+    dx = bx - ax
+    dy = by - ay
+    length_sq = dx * dx + dy * dy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = ((px - ax) * dx + (py - ay) * dy) / length_sq
+    t = np.clip(np.nan_to_num(t), 0.0, 1.0)
+    dist_sq = (px - (ax + t * dx)) ** 2 + (py - (ay + t * dy)) ** 2
+    return np.sqrt(dist_sq.min(axis=1))
+
+
+def buffered_bbox(line: np.ndarray, distance_m: float) -> BBox:
+    """Bounding box of a polyline expanded by distance_m metres"""
+    min_x, min_y, max_x, max_y = rings_bbox([line])
+    pad_y = np.degrees(distance_m / EARTH_RADIUS_M)
+    pad_x = pad_y / max(np.cos(np.radians(max(abs(min_y), abs(max_y)))), 1e-6)
+    return (min_x - pad_x, min_y - pad_y, max_x + pad_x, max_y + pad_y)
+
+
+def line_chunks(lines: Sequence[np.ndarray], chunk: int) -> List[np.ndarray]:
+    """Split polylines into pieces of at most chunk segments (sharing end vertices)"""
+    parts = []
+    for line in lines:
+        for start in range(0, max(len(line) - 1, 1), chunk):
+            parts.append(line[start:start + chunk + 1])
+    return parts
+
+
+class PointGridIndex:
+    """Static uniform-grid spatial index over lon/lat points
+
+    점을 격자 셀 번호로 정렬해 두고 범위 질의 시 행마다 연속된 셀 구간을
+    searchsorted로 찾습니다.
+    """
+
+    def __init__(self, lon: np.ndarray, lat: np.ndarray, cell_size: float = 0.05):
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.cell_size = cell_size
+
+        if len(self.lon):
+            self.min_x = float(self.lon.min())
+            self.min_y = float(self.lat.min())
+            self.cols = int((self.lon.max() - self.min_x) // cell_size) + 1
+        else:
+            self.min_x = self.min_y = 0.0
+            self.cols = 1
+
+        cell_ids = self._cell_ids(self.lon, self.lat)
+        self.order = np.argsort(cell_ids, kind="stable")
+        self.sorted_cells = cell_ids[self.order]
+
+    def _cell_ids(self, lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+        col = ((lon - self.min_x) // self.cell_size).astype(np.int64)
+        row = ((lat - self.min_y) // self.cell_size).astype(np.int64)
+        return row * self.cols + col
+
+    def _cell_ranges(self, bbox: BBox) -> Tuple[np.ndarray, np.ndarray]:
+        """Start/end positions in the sorted order of the cells overlapping bbox"""
+        empty = np.zeros(0, dtype=np.int64)
+        if not len(self.lon):
+            return empty, empty
+
+        min_x, min_y, max_x, max_y = bbox
+        first_col = max(int((min_x - self.min_x) // self.cell_size), 0)
+        last_col = min(int((max_x - self.min_x) // self.cell_size), self.cols - 1)
+        first_row = max(int((min_y - self.min_y) // self.cell_size), 0)
+        last_row = int((max_y - self.min_y) // self.cell_size)
+        if first_col > last_col or first_row > last_row:
+            return empty, empty
+
+        rows = np.arange(first_row, last_row + 1)
+        starts = np.searchsorted(self.sorted_cells, rows * self.cols + first_col, "left")
+        ends = np.searchsorted(self.sorted_cells, rows * self.cols + last_col, "right")
+        return starts, ends
+
+    def count_bbox(self, bbox: BBox) -> int:
+        """Number of points in the grid cells overlapping bbox (upper bound, no refinement)"""
+        starts, ends = self._cell_ranges(bbox)
+        return int((ends - starts).sum())
+
+    def query_bbox(self, bbox: BBox) -> np.ndarray:
+        """Indices of points inside a bounding box"""
+        starts, ends = self._cell_ranges(bbox)
+        min_x, min_y, max_x, max_y = bbox
+        parts = [self.order[s:e] for s, e in zip(starts.tolist(), ends.tolist()) if e > s]
+        if not parts:
+            return np.zeros(0, dtype=np.int64)
+
+        candidates = np.concatenate(parts)
+        lon = self.lon[candidates]
+        lat = self.lat[candidates]
+        inside = (lon >= min_x) & (lon <= max_x) & (lat >= min_y) & (lat <= max_y)
+        return np.sort(candidates[inside])
+
+    def query_radius(self, lon: float, lat: float, radius_m: float) -> np.ndarray:
+        """Indices of points within radius_m metres (haversine refinement)"""
+        candidates = self.query_bbox(radius_bbox(lon, lat, radius_m))
+        distance = haversine_m(self.lon[candidates], self.lat[candidates], lon, lat)
+        return candidates[distance <= radius_m]
+
+    def query_polygon(self, rings: Sequence[np.ndarray]) -> np.ndarray:
+        """Indices of points inside a polygon (bbox prefilter + even-odd test)"""
+        candidates = self.query_bbox(rings_bbox(rings))
+        inside = points_in_polygon(self.lon[candidates], self.lat[candidates], rings)
+        return candidates[inside]
+
+    def query_line_buffer(self, lines: Sequence[np.ndarray], distance_m: float,
+                          chunk: int = 16) -> np.ndarray:
+        """Indices of points within distance_m metres of any of the polylines
+
+        긴 노선은 chunk개 구간씩 나누어 구간별 사각형으로 후보를 좁힙니다.
+        """
+        result: List[np.ndarray] = []
+        for part in line_chunks(lines, chunk):
+            candidates = self.query_bbox(buffered_bbox(part, distance_m))
+            near = distance_to_line_m(self.lon[candidates], self.lat[candidates], part)
+            result.append(candidates[near <= distance_m])
+        if not result:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(result))
+
+    def count_line_buffer(self, lines: Sequence[np.ndarray], distance_m: float,
+                          chunk: int = 16) -> int:
+        """Upper bound of points near the polylines (grid cell counts)"""
+        return sum(self.count_bbox(buffered_bbox(part, distance_m))
+                   for part in line_chunks(lines, chunk))
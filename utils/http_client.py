@@ -0,0 +1,254 @@
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+from collections import deque
+from threading import BoundedSemaphore, Lock
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .exceptions import ApiError, CanceledError, DataError, NetworkError
+from .logger import Logger
+
+logger = Logger.get_logger()
+
+# 재시도할 HTTP 상태 코드 (요청 과다 / 일시적 서버 오류)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# (연결, 읽기) 제한 시간 (초)
+DEFAULT_TIMEOUT = (5.0, 30.0)
+
+# 스트림으로 읽을 때 한 번에 읽는 본문 크기 (바이트, 압축 해제 후)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class HttpClient:
+    """Pooled HTTP client for ITS API calls
+
+    하나의 Session으로 연결을 재사용(keep-alive)하고, 동시 요청 수를 제한하며
+    (스트림 응답은 본문을 다 읽고 닫을 때까지 한 자리를 차지),
+    gzip/deflate 압축을 요청합니다. 연결 오류, 제한 시간 초과, 429/5xx 응답은
+    지터가 있는 지수 백오프로 재시도하고 요청별 지연 시간을 기록합니다.
+    """
+
+    def __init__(self, max_connections: int = 8, max_concurrency: int = 4,
+                 timeout: Timeout = DEFAULT_TIMEOUT, retries: int = 3,
+                 backoff: float = 0.5, max_backoff: float = 8.0,
+                 latency_window: int = 512):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.session = requests.Session()
+        # 재시도는 직접 처리 (urllib3 재시도 비활성화)
+        adapter = HTTPAdapter(pool_connections=max_connections,
+                              pool_maxsize=max_connections, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
+        })
+        self._slots = BoundedSemaphore(max_concurrency)
+
+        self._lock = Lock()
+        self._latencies = deque(maxlen=latency_window)
+        self.requests = 0
+        self.retried = 0
+        self.failures = 0
+
+    def _delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Jittered exponential backoff (Retry-After wins when the server sends one)"""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get("Retry-After", ""))
+                delay = max(delay, min(retry_after, self.max_backoff))
+            except ValueError:
+                pass
+        return delay
+
+    @staticmethod
+    def _sleep(delay: float, is_canceled: Optional[Callable[[], bool]]) -> None:
+        """Sleep in short slices so a cancelled task does not wait out the backoff"""
+        deadline = time.monotonic() + delay
+        while True:
+            if is_canceled and is_canceled():
+                raise CanceledError("요청이 취소되었습니다.")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, 0.1))
+
+    def _record(self, elapsed: float) -> None:
+        with self._lock:
+            self._latencies.append(elapsed)
+
+    def _release_on_close(self, response: requests.Response) -> None:
+        """Keep a concurrency slot until the streamed response is closed (once)"""
+        close = response.close
+        released = False
+
+        def close_and_release() -> None:
+            nonlocal released
+            try:
+                close()
+            finally:
+                if not released:
+                    released = True
+                    self._slots.release()
+
+        response.close = close_and_release
+
+    def get(self, url: str, params: Optional[Dict] = None,
+            timeout: Optional[Timeout] = None, stream: bool = False,
+            is_canceled: Optional[Callable[[], bool]] = None) -> requests.Response:
+        """GET with pooling, bounded concurrency, timeouts and retry/backoff
+
+        재시도 후에도 실패하면 NetworkError(연결/시간 초과) 또는 ApiError(HTTP 오류)를
+        발생시킵니다. stream이 True이면 본문을 읽지 않은 응답을 반환하며, 응답을
+        닫을 때(iter_chunks 종료 포함)까지 동시 요청 자리를 차지합니다.
+        """
+        timeout = timeout or self.timeout
+        attempt = 0
+        while True:
+            if is_canceled and is_canceled():
+                raise CanceledError("요청이 취소되었습니다.")
+
+            response = None
+            error = None
+            # 자리가 날 때까지 기다리되 취소되면 바로 중단
+            while not self._slots.acquire(timeout=0.1):
+                if is_canceled and is_canceled():
+                    raise CanceledError("요청이 취소되었습니다.")
+            keep_slot = False
+            try:
+                start = time.perf_counter()
+                try:
+                    response = self.session.get(url, params=params, timeout=timeout,
+                                                stream=stream)
+                except (requests.exceptions.ConnectionError,
+                        requests.exceptions.Timeout) as e:
+                    error = NetworkError(f"API 호출 실패: {str(e)}")
+                except requests.exceptions.RequestException as e:
+                    with self._lock:
+                        self.requests += 1
+                        self.failures += 1
+                    raise NetworkError(f"API 호출 실패: {str(e)}")
+                elapsed = time.perf_counter() - start
+                # 스트림 본문도 동시 요청 수에 포함 (응답을 닫을 때 자리 반환)
+                if stream and response is not None and response.status_code not in RETRY_STATUS:
+                    self._release_on_close(response)
+                    keep_slot = True
+            finally:
+                if not keep_slot:
+                    self._slots.release()
+
+            with self._lock:
+                self.requests += 1
+            if response is not None:
+                self._record(elapsed)
+                if response.status_code not in RETRY_STATUS:
+                    break
+                error = ApiError(f"API 오류 응답: HTTP {response.status_code}")
+
+            if attempt >= self.retries:
+                if response is not None:
+                    response.close()
+                with self._lock:
+                    self.failures += 1
+                raise error
+
+            delay = self._delay(attempt, response)
+            if response is not None:
+                response.close()
+            logger.warning(f"{str(error)} - {delay:.2f}초 후 재시도 ({attempt + 1}/{self.retries})")
+            with self._lock:
+                self.retried += 1
+            self._sleep(delay, is_canceled)
+            attempt += 1
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            response.close()
+            with self._lock:
+                self.failures += 1
+            raise ApiError(f"API 호출 실패: {str(e)}")
+        return response
+
+    def get_json(self, url: str, params: Optional[Dict] = None,
+                 timeout: Optional[Timeout] = None,
+                 is_canceled: Optional[Callable[[], bool]] = None) -> Any:
+        """GET and decode a JSON body"""
+        response = self.get(url, params, timeout, is_canceled=is_canceled)
+        try:
+            return response.json()
+        except ValueError as e:
+            raise DataError(f"JSON 파싱 실패: {str(e)}")
+
+    @staticmethod
+    def iter_chunks(response: requests.Response, chunk_size: int = STREAM_CHUNK_SIZE,
+                    is_canceled: Optional[Callable[[], bool]] = None) -> Iterator[bytes]:
+        """Body chunks of a streamed response (closed when done, failed or cancelled)
+
+        본문을 읽는 중의 연결 오류/시간 초과는 NetworkError로 변환합니다.
+        """
+        try:
+            for chunk in response.iter_content(chunk_size):
+                if is_canceled and is_canceled():
+                    raise CanceledError("요청이 취소되었습니다.")
+                yield chunk
+        except requests.exceptions.RequestException as e:
+            raise NetworkError(f"응답 수신 실패: {str(e)}")
+        finally:
+            response.close()
+
+    @staticmethod
+    def bytes_read(response: requests.Response) -> int:
+        """Bytes of the (possibly compressed) body read so far"""
+        try:
+            return int(response.raw.tell())
+        except (AttributeError, TypeError, ValueError):
+            return 0
+
+    def stats(self) -> Dict:
+        """Request counters and latency percentiles (ms) of recent requests"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                "requests": self.requests,
+                "retries": self.retried,
+                "failures": self.failures,
+                "latency_count": len(latencies)
+            }
+        if latencies:
+            def percentile(p: float) -> float:
+                return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+            stats.update({
+                "latency_mean_ms": sum(latencies) / len(latencies) * 1000,
+                "latency_p50_ms": percentile(0.5),
+                "latency_p95_ms": percentile(0.95),
+                "latency_max_ms": latencies[-1] * 1000
+            })
+        return stats
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_lock = Lock()
+
+
+def shared_client() -> HttpClient:
+    """Process-wide client shared by all model fetches (one connection pool)"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
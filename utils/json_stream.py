@@ -0,0 +1,212 @@
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+import codecs
+import json
+import re
+
+from .exceptions import DataError
+
+# 항목 밖에서 찾는 구조 문자
+_STRUCTURE = re.compile(r'[{}\[\]",:]')
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_NON_SPACE = re.compile(r'\S')
+_NUMBER_TAIL = re.compile(r'[0-9.eE+\-]*\Z')
+_DECODER = json.JSONDecoder()
+
+# 항목 하나의 최대 길이 (문자 수, 넘으면 잘못된 응답으로 처리)
+MAX_ITEM_CHARS = 1024 * 1024
+
+
+class JsonArrayStream:
+    """Incremental parser yielding the items of one array inside a JSON document
+
+    path는 배열까지의 객체 키 경로입니다 (예: ("response", "data")).
+    feed()에 응답 본문 조각을 넣으면 완성된 항목만 json.loads로 변환하여
+    반환하므로, 버퍼에는 현재 파싱 중인 항목 하나만 남습니다. 항목 안은
+    json 모듈의 C 디코더로 한 번에 읽습니다. 배열 안의 항목 사이에는 공백과
+    쉼표만 허용하며, 그 밖의 문자가 있으면 DataError를 발생시킵니다.
+    경로의 값이 배열이 아니라 객체 하나이면 그 객체를 항목으로 반환합니다.
+    """
+
+    def __init__(self, path: Sequence[str], encoding: str = "utf-8"):
+        self.path = tuple(path)
+        self.found = False
+        self.done = False
+        self.items = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ""
+        self._pos = 0
+        # 열린 컨테이너: [종류, 현재 키, 키를 기다리는 중]
+        self._stack: List[list] = []
+        self._target_depth: Optional[int] = None
+        self._item_start: Optional[int] = None
+        # 대상 배열 안에서 쉼표/닫는 괄호를 기다리는 중 / 쉼표 뒤 항목을 기다리는 중
+        self._after_item = False
+        self._after_comma = False
+        self._final = False
+
+    def _at_target(self) -> bool:
+        """Whether the value being opened sits at path"""
+        return len(self._stack) == len(self.path) and all(
+            entry[0] == "{" and entry[1] == key for entry, key in zip(self._stack, self.path)
+        )
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Parse the next chunk of the body and return the items it completed"""
+        if self.done:
+            return []
+        try:
+            self._buffer += self._decoder.decode(data)
+        except UnicodeDecodeError as e:
+            raise DataError(f"JSON 응답 디코딩 실패: {str(e)}")
+
+        items = self._scan()
+
+        # 이미 처리한 부분은 버림 (진행 중인 항목만 유지)
+        keep = self._pos if self._item_start is None else self._item_start
+        if keep:
+            self._buffer = self._buffer[keep:]
+            self._pos -= keep
+            if self._item_start is not None:
+                self._item_start = 0
+        return items
+
+    def _scan(self) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        while not self.done:
+            if self._item_start is not None:
+                try:
+                    value, end = _DECODER.raw_decode(buffer, self._item_start)
+                except ValueError as e:
+                    # 항목이 다음 조각으로 이어지면 기다림
+                    if len(buffer) - self._item_start > MAX_ITEM_CHARS:
+                        raise DataError(f"JSON 파싱 실패 (항목 {self.items + 1}): {str(e)}")
+                    self._pos = len(buffer)
+                    break
+                if (not self._final and isinstance(value, (int, float))
+                        and _NUMBER_TAIL.match(buffer, end)):
+                    # 조각 끝의 숫자는 다음 조각에서 이어질 수 있음
+                    self._pos = len(buffer)
+                    break
+                self.items += 1
+                items.append(value)
+                self._item_start = None
+                self._pos = end
+                if self._target_depth is None:
+                    # 배열이 아닌 단일 객체 값
+                    self.done = True
+                else:
+                    self._after_item = True
+                continue
+
+            if self._target_depth is not None and len(self._stack) == self._target_depth:
+                if self._scan_array_separator(buffer):
+                    continue
+                break
+
+            match = _STRUCTURE.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                break
+            position = match.start()
+            char = buffer[position]
+
+            if char == '"':
+                string = _STRING.match(buffer, position)
+                if string is None:
+                    # 문자열이 다음 조각으로 이어짐
+                    self._pos = position
+                    break
+                self._pos = string.end()
+                if self._stack:
+                    entry = self._stack[-1]
+                    if entry[0] == "{" and entry[2]:
+                        entry[1] = json.loads(string.group())
+                continue
+
+            self._pos = position + 1
+            if char in "{[":
+                if self._target_depth is not None and len(self._stack) == self._target_depth:
+                    self._item_start = position
+                elif self._at_target():
+                    self.found = True
+                    if char == "[":
+                        self._stack.append(["[", None, False])
+                        self._target_depth = len(self._stack)
+                    else:
+                        self._item_start = position
+                else:
+                    self._stack.append([char, None, char == "{"])
+            elif char in "}]":
+                if not self._stack:
+                    raise DataError("잘못된 JSON 응답 형식")
+                self._check_scalar_target()
+                self._stack.pop()
+                if self._target_depth is not None and len(self._stack) < self._target_depth:
+                    self.done = True
+            elif char == ":":
+                if self._stack and self._stack[-1][0] == "{":
+                    self._stack[-1][2] = False
+            elif char == ",":
+                self._check_scalar_target()
+                if self._stack and self._stack[-1][0] == "{":
+                    self._stack[-1][1] = None
+                    self._stack[-1][2] = True
+        return items
+
+    def _scan_array_separator(self, buffer: str) -> bool:
+        """Consume what follows an item in the target array (False: wait for more data)"""
+        match = _NON_SPACE.search(buffer, self._pos)
+        if match is None:
+            self._pos = len(buffer)
+            return False
+        position = match.start()
+        char = buffer[position]
+        self._pos = position + 1
+
+        if char == "]":
+            if self._after_comma:
+                raise DataError(f"잘못된 JSON 응답 형식 (항목 {self.items} 뒤 쉼표)")
+            self._stack.pop()
+            self.done = True
+        elif self._after_item:
+            if char != ",":
+                raise DataError(f"잘못된 JSON 응답 형식 (항목 {self.items} 뒤: {char!r})")
+            self._after_item = False
+            self._after_comma = True
+        elif char in "},:":
+            raise DataError(f"잘못된 JSON 응답 형식 (항목 {self.items + 1} 위치: {char!r})")
+        else:
+            # 다음 항목 (객체/배열/값) 시작
+            self._after_comma = False
+            self._item_start = position
+        return True
+
+    def _check_scalar_target(self) -> None:
+        """A value at path that ended without opening a container (예: null) has no items"""
+        if not self.found and self._at_target() and not self._stack[-1][2]:
+            self.found = True
+            self.done = True
+
+    def close(self) -> None:
+        """Check that the document did not end in the middle of the target"""
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._final = True
+        if self._item_start is not None:
+            self._scan()
+        if self._item_start is not None:
+            try:
+                _DECODER.raw_decode(self._buffer, self._item_start)
+            except ValueError as e:
+                raise DataError(f"JSON 파싱 실패 (항목 {self.items + 1}): {str(e)}")
+        if self.found and not self.done:
+            raise DataError("JSON 응답이 중간에 끊겼습니다.")
+
+
+def iter_json_array(chunks: Iterable[bytes], path: Sequence[str],
+                    encoding: str = "utf-8") -> Iterator[Any]:
+    """Items of the array at path, parsed incrementally from body chunks"""
+    parser = JsonArrayStream(path, encoding)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
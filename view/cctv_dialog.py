@@ -1,7 +1,9 @@
 from qgis.PyQt.QtWidgets import (QDialog, QVBoxLayout, QPushButton, QLabel,
                              QHBoxLayout, QWidget, QFileDialog, QMessageBox,
-                             QComboBox, QLineEdit, QProgressBar)
+                             QComboBox, QLineEdit, QProgressBar, QListWidget,
+                             QSpinBox)
 from qgis.PyQt.QtCore import QTimer, Qt, QUrl
+from qgis.core import QgsApplication, QgsTask
 # QGIS PyQt에 없는 멀티미디어 모듈은 PyQt5에서 직접 임포트
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 from PyQt5.QtMultimediaWidgets import QVideoWidget
@@ -18,9 +20,16 @@ from ..model.filter_combine import FilterCombine
 from .recommend_dialog import RecommendDialog
 from ..model.filter_recommend import FilterRecommend
 from ..model.cctv_model import CctvModel
+from ..utils.logger import Logger
+
+logger = Logger.get_logger()
+
+# 검색 입력 디바운스 간격 (ms)과 결과 목록에 한 번에 추가할 항목 수
+SEARCH_DEBOUNCE_MS = 250
+SEARCH_RESULT_CHUNK = 200
 
 class CctvDialog(QDialog):
-    def __init__(self, cctv_info=None, parent=None, iface=None):
+    def __init__(self, cctv_info=None, parent=None, iface=None, model=None):
         super().__init__(parent)
         self.iface = iface
         # CCTV 정보가 없으면 기본값 설정
@@ -30,15 +39,58 @@ class CctvDialog(QDialog):
             'lat': 0.0,
             'lon': 0.0
         }
-        self.model = CctvModel()
+        # 컨트롤러의 모델을 공유하여 카탈로그와 캐시를 중복 생성하지 않음
+        self.model = model or CctvModel()
         self.filter_auto = FilterAuto()
         self.auto_filter_timer = QTimer()
         self.auto_filter_timer.timeout.connect(self._check_auto_filters)
         self.auto_filter_timer.start(60000)  # 1분마다 체크
-        self.filter_combine = FilterCombine()
+        self.filter_combine = FilterCombine(self.model.filter_engine)
         self.filter_recommend = FilterRecommend()
+        
+        # 백그라운드 검색 상태
+        self._search_task = None
+        self._search_generation = 0
+        self._last_search = None  # (검색어, 결과 RowsView)
+        self._pending_results = None
+        self._pending_position = 0
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self._start_search)
+        self.result_stream_timer = QTimer(self)
+        self.result_stream_timer.timeout.connect(self._stream_search_results)
+        
         self.setup_ui()
         
+        # 카탈로그가 로드/갱신되면 지역/도로 콤보 박스의 개수 갱신
+        self.model.data_loaded.connect(self.on_data_loaded)
+        self.model.catalog_updated.connect(self._populate_filter_combos)
+        
+        # 백그라운드 필터 진행률/완료
+        self.model.filter_progress.connect(self._on_filter_progress)
+        self.model.filter_finished.connect(self._on_filter_finished)
+        self.model.filter_canceled.connect(self._on_filter_canceled)
+        
+        # 닫힌 대화상자가 공유 모델의 시그널에 계속 반응하지 않도록 연결 해제
+        self._model_connected = True
+        self.finished.connect(self._disconnect_model)
+        
+    def _disconnect_model(self, *args) -> None:
+        """Disconnect from the shared model's signals (dialog closed)"""
+        if not self._model_connected:
+            return
+        self._model_connected = False
+        for signal, slot in ((self.model.data_loaded, self.on_data_loaded),
+                             (self.model.catalog_updated, self._populate_filter_combos),
+                             (self.model.filter_progress, self._on_filter_progress),
+                             (self.model.filter_finished, self._on_filter_finished),
+                             (self.model.filter_canceled, self._on_filter_canceled)):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+        
     def setup_ui(self) -> None:
         """Initialize UI components"""
         self.setWindowTitle(f"CCTV View - {self.cctv_info['name']}")
@@ -58,14 +110,13 @@ class CctvDialog(QDialog):
         # Region filter
         region_label = QLabel("지역:")
         self.region_combo = QComboBox()
-        self.region_combo.addItems(["전체", "서울", "경기", "인천", "부산"])
-        self.region_combo.currentTextChanged.connect(self.apply_filters)
+        self.region_combo.currentIndexChanged.connect(self.apply_filters)
         
         # Road type filter
         road_label = QLabel("도로:")
         self.road_combo = QComboBox()
-        self.road_combo.addItems(["전체", "고속도로", "국도", "시도"])
-        self.road_combo.currentTextChanged.connect(self.apply_filters)
+        self.road_combo.currentIndexChanged.connect(self.apply_filters)
+        self._populate_filter_combos()
         
         # Search box
         search_label = QLabel("검색:")
@@ -86,6 +137,46 @@ class CctvDialog(QDialog):
         top_widget.setLayout(top_panel)
         layout.addWidget(top_widget)
         
+        # 필터 쿼리
+        query_panel = QHBoxLayout()
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText(
+            'region:서울 AND road:고속도로 AND name~"IC" AND within(5km, 127.03, 37.50)'
+        )
+        self.query_input.returnPressed.connect(self.apply_query)
+        query_btn = QPushButton("쿼리 적용")
+        query_btn.clicked.connect(self.apply_query)
+        explain_btn = QPushButton("실행 계획")
+        explain_btn.clicked.connect(self.explain_query)
+        query_panel.addWidget(QLabel("쿼리:"))
+        query_panel.addWidget(self.query_input)
+        query_panel.addWidget(query_btn)
+        query_panel.addWidget(explain_btn)
+        layout.addLayout(query_panel)
+        
+        # 선택한 피처(폴리곤/노선/지점) 기준 공간 필터
+        spatial_panel = QHBoxLayout()
+        self.buffer_spin = QSpinBox()
+        self.buffer_spin.setRange(10, 50000)
+        self.buffer_spin.setSingleStep(100)
+        self.buffer_spin.setValue(500)
+        self.buffer_spin.setSuffix(" m")
+        selection_btn = QPushButton("선택 피처로 필터")
+        selection_btn.clicked.connect(self.apply_selection_filter)
+        spatial_panel.addWidget(QLabel("버퍼/반경:"))
+        spatial_panel.addWidget(self.buffer_spin)
+        spatial_panel.addWidget(selection_btn)
+        spatial_panel.addStretch()
+        layout.addLayout(spatial_panel)
+        
+        # Search results
+        self.search_status_label = QLabel()
+        self.search_results_list = QListWidget()
+        self.search_results_list.setMaximumHeight(150)
+        self.search_results_list.setVisible(False)
+        layout.addWidget(self.search_status_label)
+        layout.addWidget(self.search_results_list)
+        
         # Video player
         self.setup_video_player()
         layout.addWidget(self.video_player)
@@ -230,6 +321,8 @@ class CctvDialog(QDialog):
     def on_data_loaded(self, success: bool) -> None:
         """Handle data loading completion"""
         self.progress_bar.setVisible(False)
+        if success:
+            self._populate_filter_combos()
         if not success:
             QMessageBox.warning(
                 self,
@@ -243,28 +336,209 @@ class CctvDialog(QDialog):
         self.progress_bar.setMaximum(total)
         self.progress_bar.setValue(current)
         
+    def _populate_filter_combos(self, *args) -> None:
+        """Fill region/road type combo boxes from the category index with counts"""
+        catalog = self.model.catalog
+        for combo, index in ((self.region_combo, catalog.regions),
+                             (self.road_combo, catalog.road_types)):
+            current = self._combo_value(combo)
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem(f"전체 ({len(catalog)})", "전체")
+            for label, count in index.labels_with_counts():
+                combo.addItem(f"{label} ({count})", label)
+            self._set_combo_value(combo, current)
+            combo.blockSignals(False)
+            
+    @staticmethod
+    def _combo_value(combo: QComboBox) -> str:
+        """Category value of the selected combo item"""
+        return combo.currentData() or "전체"
+        
+    @staticmethod
+    def _set_combo_value(combo: QComboBox, value: str) -> None:
+        """Select the combo item of a category value (adding it if missing)"""
+        index = combo.findData(value or "전체")
+        if index < 0:
+            combo.addItem(f"{value} (0)", value)
+            index = combo.count() - 1
+        combo.setCurrentIndex(index)
+        
     def apply_filters(self) -> None:
         """Apply selected filters"""
-        self.progress_bar.setVisible(True)
-        region = self.region_combo.currentText()
-        road_type = self.road_combo.currentText()
+        region = self._combo_value(self.region_combo)
+        road_type = self._combo_value(self.road_combo)
         
         # Convert "전체" to None for the model
         region = None if region == "전체" else region
         road_type = None if road_type == "전체" else road_type
         
-        # Apply filters through the model
-        self.model.filter_cctv_data(region, road_type)
+        # 백그라운드에서 평가 (진행 중인 이전 필터는 취소)
+        self._start_filter_progress()
+        self.model.apply_filter_async({"region": region, "road_type": road_type})
+        
+    def _start_filter_progress(self) -> None:
+        """Show the progress bar for a background filter"""
+        self.progress_bar.setMaximum(100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        
+    def _on_filter_progress(self, value: int) -> None:
+        self.progress_bar.setMaximum(100)
+        self.progress_bar.setValue(value)
+        
+    def _on_filter_finished(self, success: bool) -> None:
+        """Show the applied filter result (or the failure)"""
+        self.progress_bar.setVisible(False)
+        if success:
+            self.update_results_display()
+        else:
+            QMessageBox.warning(self, "경고", "필터 적용에 실패했습니다.")
+            
+    def _on_filter_canceled(self) -> None:
         self.progress_bar.setVisible(False)
         
+    def apply_query(self) -> None:
+        """Apply the filter query"""
+        query = self.query_input.text().strip()
+        try:
+            if query:
+                self._start_filter_progress()
+                self.model.apply_query(query, background=True)
+            else:
+                self.model.clear_filter()
+                self.update_results_display()
+        except Exception as e:
+            self.progress_bar.setVisible(False)
+            logger.error(f"쿼리 적용 실패: {str(e)}")
+            QMessageBox.warning(self, "경고", f"쿼리 적용 실패: {str(e)}")
+            
+    def apply_selection_filter(self) -> None:
+        """Filter cameras by the selected features of the active layer"""
+        if not self.iface:
+            return
+        try:
+            base_filter = {
+                "region": self._combo_value(self.region_combo),
+                "road_type": self._combo_value(self.road_combo),
+                "keyword": self.search_input.text()
+            }
+            self._start_filter_progress()
+            self.model.apply_selection_filter(
+                self.iface.activeLayer(), self.buffer_spin.value(), base_filter,
+                background=True
+            )
+        except Exception as e:
+            self.progress_bar.setVisible(False)
+            logger.error(f"공간 필터 적용 실패: {str(e)}")
+            QMessageBox.warning(self, "경고", f"공간 필터 적용 실패: {str(e)}")
+            
+    def explain_query(self) -> None:
+        """Show the chosen plan and per-stage timings of the filter query"""
+        query = self.query_input.text().strip()
+        if not query:
+            return
+        try:
+            QMessageBox.information(self, "실행 계획", self.model.explain_query(query))
+        except Exception as e:
+            logger.error(f"실행 계획 생성 실패: {str(e)}")
+            QMessageBox.warning(self, "경고", f"실행 계획 생성 실패: {str(e)}")
+            
     def search_cctv(self) -> None:
-        """Search CCTV by name"""
+        """Search CCTV by name (debounced)"""
+        # 입력이 멈출 때까지 검색을 미룸
+        self.search_timer.start()
+        
+    def _start_search(self) -> None:
+        """Run the current query as a background task"""
         keyword = self.search_input.text().strip()
-        results = self.model.search_cctv(keyword)
         
-        # Update the view with search results
-        # TODO: Implement result display
-        print(f"Found {len(results)} CCTVs matching '{keyword}'") 
+        # 이전 검색 취소
+        if self._search_task is not None:
+            self._search_task.cancel()
+            self._search_task = None
+        self._search_generation += 1
+        generation = self._search_generation
+        
+        if not keyword:
+            self._last_search = None
+            self._show_search_results(keyword, None)
+            return
+            
+        # 이전 검색어를 포함하는 검색어이면 이전 결과 안에서만 검색
+        previous = None
+        if self._last_search and self._last_search[0] in keyword:
+            previous = self._last_search[1]
+            
+        task = QgsTask.fromFunction(
+            "CCTV 검색",
+            self._run_search,
+            keyword,
+            previous,
+            on_finished=lambda exception, result=None: self._on_search_finished(
+                generation, exception, result),
+            flags=QgsTask.CanCancel | QgsTask.Silent
+        )
+        self._search_task = task
+        QgsApplication.taskManager().addTask(task)
+        
+    def _run_search(self, task: QgsTask, keyword: str, previous):
+        """Search worker (runs off the GUI thread)"""
+        return keyword, self.model.search_cctv(keyword, previous, task.isCanceled)
+        
+    def _on_search_finished(self, generation: int, exception, result) -> None:
+        """Apply search results if the query was not superseded"""
+        if generation != self._search_generation:
+            return
+        self._search_task = None
+        
+        if exception is not None or result is None:
+            if exception is not None and str(exception) != "Task canceled":
+                logger.error(f"CCTV 검색 실패: {str(exception)}")
+            return
+            
+        keyword, results = result
+        self._last_search = (keyword, results)
+        self._show_search_results(keyword, results)
+        
+    def _show_search_results(self, keyword: str, results) -> None:
+        """Start streaming search results into the results list"""
+        self.result_stream_timer.stop()
+        self.search_results_list.clear()
+        
+        if results is None:
+            self.search_status_label.clear()
+            self.search_results_list.setVisible(False)
+            return
+            
+        self.search_status_label.setText(f"'{keyword}' 검색 결과: {len(results)}개")
+        self.search_results_list.setVisible(True)
+        self._pending_results = results
+        self._pending_position = 0
+        self.result_stream_timer.start(0)
+        
+    def update_results_display(self) -> None:
+        """Show the model's current filter result in the results list"""
+        results = self.model.filtered_data
+        self._show_search_results(None, results)
+        self.search_status_label.setText(f"필터 결과: {len(results)}개")
+        
+    def _stream_search_results(self) -> None:
+        """Add the next chunk of results without blocking the GUI"""
+        results = self._pending_results
+        if results is None:
+            self.result_stream_timer.stop()
+            return
+            
+        end = min(self._pending_position + SEARCH_RESULT_CHUNK, len(results))
+        self.search_results_list.addItems(
+            [cctv["name"] for cctv in results[self._pending_position:end]]
+        )
+        self._pending_position = end
+        
+        if end >= len(results):
+            self.result_stream_timer.stop()
+            self._pending_results = None
         
     def _show_auto_filter_dialog(self):
         """Show automatic filter configuration dialog"""
@@ -272,8 +546,8 @@ class CctvDialog(QDialog):
             # 현재 필터 설정 가져오기
             filter_config = {
                 "name": "",
-                "region": self.region_combo.currentText(),
-                "road_type": self.road_combo.currentText(),
+                "region": self._combo_value(self.region_combo),
+                "road_type": self._combo_value(self.road_combo),
                 "keyword": self.search_input.text()
             }
             
@@ -293,8 +567,8 @@ class CctvDialog(QDialog):
                 config = filter_data["config"]
                 
                 # 필터 적용
-                self.region_combo.setCurrentText(config["region"])
-                self.road_combo.setCurrentText(config["road_type"])
+                self._set_combo_value(self.region_combo, config["region"])
+                self._set_combo_value(self.road_combo, config["road_type"])
                 self.search_input.setText(config["keyword"])
                 self.apply_filter()
                 
@@ -308,6 +582,12 @@ class CctvDialog(QDialog):
     def closeEvent(self, event):
         """Handle dialog close event"""
         self.auto_filter_timer.stop()
+        self.search_timer.stop()
+        self.result_stream_timer.stop()
+        if self._search_task is not None:
+            self._search_task.cancel()
+            self._search_task = None
+        self._disconnect_model()
         super().closeEvent(event) 
         
     def _show_combine_filter_dialog(self):
@@ -315,8 +595,8 @@ class CctvDialog(QDialog):
         try:
             # 현재 필터 설정 가져오기
             current_filter = {
-                "region": self.region_combo.currentText(),
-                "road_type": self.road_combo.currentText(),
+                "region": self._combo_value(self.region_combo),
+                "road_type": self._combo_value(self.road_combo),
                 "keyword": self.search_input.text()
             }
             
@@ -331,13 +611,14 @@ class CctvDialog(QDialog):
     def _apply_combined_filter(self, filter_name: str):
         """Apply combined filter"""
         try:
-            # 원본 데이터에 조합 필터 적용
-            filtered_data = self.filter_combine.apply_combined_filter(
-                filter_name, self.model.get_all_data())
+            combined_filter = self.filter_combine.get_combined_filter(filter_name)
+            if not combined_filter:
+                QMessageBox.warning(self, "경고", f"조합 필터 '{filter_name}'을(를) 찾을 수 없습니다.")
+                return
                 
-            # 결과 표시
-            self.model.set_filtered_data(filtered_data)
-            self.update_results_display()
+            # 모델과 같은 필터 엔진으로 평가하고 레이어 표시 조건도 갱신
+            self._start_filter_progress()
+            self.model.apply_filter_async(combined_filter)
             
             logger.info(f"조합 필터 '{filter_name}' 적용됨")
             
@@ -350,8 +631,8 @@ class CctvDialog(QDialog):
         try:
             # 현재 필터 설정 가져오기
             current_filter = {
-                "region": self.region_combo.currentText(),
-                "road_type": self.road_combo.currentText(),
+                "region": self._combo_value(self.region_combo),
+                "road_type": self._combo_value(self.road_combo),
                 "keyword": self.search_input.text()
             }
             
@@ -367,8 +648,8 @@ class CctvDialog(QDialog):
         """Apply recommended filter"""
         try:
             # 필터 설정 적용
-            self.region_combo.setCurrentText(filter_config["region"])
-            self.road_combo.setCurrentText(filter_config["road_type"])
+            self._set_combo_value(self.region_combo, filter_config["region"])
+            self._set_combo_value(self.road_combo, filter_config["road_type"])
             self.search_input.setText(filter_config["keyword"])
             
             # 필터 적용
@@ -388,14 +669,14 @@ class CctvDialog(QDialog):
         try:
             # 현재 필터 설정 가져오기
             filter_config = {
-                "region": self.region_combo.currentText(),
-                "road_type": self.road_combo.currentText(),
+                "region": self._combo_value(self.region_combo),
+                "road_type": self._combo_value(self.road_combo),
                 "keyword": self.search_input.text()
             }
             
-            # 필터 적용
-            filtered_data = self.model.apply_filter(filter_config)
-            self.update_results_display()
+            # 필터 적용 (백그라운드)
+            self._start_filter_progress()
+            self.model.apply_filter_async(filter_config)
             
             # 사용 기록 저장
             self.filter_recommend.save_filter_usage(filter_config)
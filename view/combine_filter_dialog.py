@@ -145,9 +145,11 @@ class CombineFilterDialog(QDialog):
                 
             operator = "AND" if self.operator_group.checkedId() == 0 else "OR"
             
-            # 현재 필터도 포함
-            filters = [self.current_filter] + [f["filters"][0] 
-                                             for f in self.filters_to_combine]
+            # 현재 필터도 포함 (선택한 조합 필터는 중첩 그룹으로 보존)
+            filters = [self.current_filter] + [
+                {"operator": f["operator"], "filters": f["filters"]}
+                for f in self.filters_to_combine
+            ]
             
             self.filter_combine.save_combined_filter(name, filters, operator)
             QMessageBox.information(self, "알림", "필터 조합이 저장되었습니다.")